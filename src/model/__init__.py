@@ -1,4 +1,59 @@
-from .bot import *
-from .example import *
-from .osrs import *
-from .runelite_bot import *
+import importlib
+from types import ModuleType
+from typing import Any, List
+
+# The bots are imported on first access rather than along with the package, since
+# they pull in the GUI (e.g. customtkinter, pynput, and pyautogui). This keeps
+# GUI-free modules like `model.recorded_window` importable headless. Names resolve
+# as if each submodule were star-imported in this order, so later ones take
+# precedence.
+_SUBMODULES = ("bot", "example", "osrs", "runelite_bot")
+
+
+def _exports(module: ModuleType) -> List[str]:
+    """Get the names `from module import *` would import.
+
+    Args:
+        module (ModuleType): The module.
+
+    Returns:
+        List[str]: The names in the module's `__all__`, or else its public names.
+    """
+    if hasattr(module, "__all__"):
+        return list(module.__all__)
+    return [name for name in vars(module) if not name.startswith("_")]
+
+
+def __getattr__(name: str) -> Any:
+    """Look up a name exported by one of the bot submodules, importing it lazily.
+
+    Args:
+        name (str): The attribute name (e.g. "RuneLiteBot").
+
+    Raises:
+        AttributeError: If no submodule exports `name`.
+
+    Returns:
+        Any: The attribute.
+    """
+    if not name.startswith("_"):
+        for submodule in reversed(_SUBMODULES):
+            module = importlib.import_module(f"{__name__}.{submodule}")
+            if name in _exports(module):
+                return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the package's names, importing every bot submodule to include theirs.
+
+    Bot discovery (see `rune_dark.App`) relies on this listing every bot class.
+
+    Returns:
+        List[str]: The sorted names.
+    """
+    names = set(globals())
+    for submodule in _SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{submodule}")
+        names.update(_exports(module))
+    return sorted(names)
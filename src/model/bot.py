@@ -17,6 +17,7 @@ from customtkinter.windows.ctk_toplevel import CTkToplevel
 import utilities.debug as debug
 import utilities.random_util as rd
 from model.window import Window
+from utilities.executor import WorkerPool, get_worker_pool
 from utilities.geometry import Point
 from utilities.mouse import Mouse
 from utilities.options_builder import OptionsBuilder
@@ -137,6 +138,20 @@ class Bot(ABC):
         self.options_builder = OptionsBuilder(bot_title)
         self.win = window
 
+    @property
+    def pool(self) -> WorkerPool:
+        """Get the process-wide worker pool for parallel computer vision.
+
+        The pool is created on first use and then shared by every bot for the life of
+        the runtime, so no workers are spun up on the per-frame path. It can be
+        reconfigured (e.g. to process mode) via
+        `utilities.executor.configure_worker_pool`.
+
+        Returns:
+            WorkerPool: The shared pool.
+        """
+        return get_worker_pool()
+
     @abstractmethod
     def main_loop(self) -> None:
         """Main logic of the bot. This function is called in a separate thread."""
@@ -4,7 +4,6 @@ from typing import List
 
 import utilities.random_util as rd
 from model.osrs.osrs_bot import OSRSBot
-from utilities.geometry import RuneLiteObject
 from utilities.img_search import BOT_IMAGES
 
 
@@ -166,8 +165,7 @@ class OSRSPowerChopper(OSRSBot):
         if trees := self.find_colors(self.win.game_view, self.mark_color):
             if second_closest and len(trees) < 2:
                 return False
-            trees = sorted(trees, key=RuneLiteObject.dist_from_rect_center)
-            chosen_tree = trees[1] if second_closest else trees[0]
+            chosen_tree = trees.nth_nearest(1 if second_closest else 0)
             self.mouse.move_to(chosen_tree.random_point())
             if self.is_hovering_tree:
                 order = "second-closest" if second_closest else "closest"
@@ -194,6 +194,7 @@ class OSRSWineMaker(OSRSBot):
             rect=self.win.chat,
             font=ocr.BOLD_12,
             colors=self.cp.bgr.OFF_BROWN_TEXT,
+            pool=self.pool,
         )
         return bool(textboxes)
 
@@ -0,0 +1,212 @@
+from pathlib import Path
+from typing import Literal, Optional, Union
+
+import cv2
+import numpy as np
+
+from model.runelite_window import RuneLiteWindow
+from utilities.geometry import CaptureSource, Point, Rectangle, set_capture_source
+
+
+class RecordedWindow(RuneLiteWindow):
+    """A `RuneLiteWindow` backed by a saved screenshot instead of a live client.
+
+    `RecordedWindow` locates every region of the RuneLite UI exactly as
+    `RuneLiteWindow` does, but within a recorded image of the full client window
+    rather than the screen. While active, every `Rectangle.screenshot` (not only those
+    of this window's regions) is served by cropping the recorded image, with anything
+    outside of it appearing black. Since no window handles or screen capture are
+    involved, the whole initialization, OCR, and detection stack can be profiled and
+    regression-tested off-Windows (e.g. on a Linux CI box).
+
+    Note that only vision is simulated: mouse and keyboard input still go to the real
+    screen, so a `RecordedWindow` shouldn't be handed to a running bot's main loop.
+
+    Example:
+        with RecordedWindow("recordings/fixed_classic.png") as win:
+            win.initialize()
+            white = ColorPalette().bgr.OFF_WHITE_TEXT
+            print(ocr.scrape_text(win.mouseover, ocr.BOLD_12, white))
+    """
+
+    def __init__(
+        self,
+        image: Union[np.ndarray, str, Path],
+        window_title: str = "RuneLite (recorded)",
+        origin: Point = Point(0, 0),
+        channel_order: Literal["rgb", "bgr"] = "rgb",
+    ) -> None:
+        """Initialize a `RecordedWindow`.
+
+        Args:
+            image (Union[np.ndarray, str, Path]): A capture of the full client window
+                (i.e. what `Window.rectangle` outlines), as a BGR image array or the
+                path to a PNG.
+            window_title (str, optional): The title to report for the window. Defaults
+                to "RuneLite (recorded)".
+            origin (Point, optional): Where the recorded window is placed on the
+                virtual screen. Defaults to Point(0, 0).
+            channel_order (Literal["rgb", "bgr"], optional): How the PNG stores its
+                colors: "rgb" for a standard PNG (e.g. written by `cv2.imwrite` or a
+                screenshot tool), or "bgr" for a capture written by
+                `matplotlib.pyplot.imsave` (e.g. by `_snapshot_all_window_regions`),
+                which saves BGR arrays as if they were RGB. Ignored if `image` is an
+                array. Defaults to "rgb".
+        """
+        super().__init__(window_title)
+        self._origin = origin
+        self._previous_source: Optional[CaptureSource] = None
+        self._active = False
+        self.load(image, channel_order)
+
+    def load(
+        self,
+        image: Union[np.ndarray, str, Path],
+        channel_order: Literal["rgb", "bgr"] = "rgb",
+    ) -> None:
+        """Swap in a new recorded image (e.g. the next frame of a recording).
+
+        Regions aren't re-located, so call `initialize` or `check_layout` afterward if
+        the new image may have a different layout.
+
+        Args:
+            image (Union[np.ndarray, str, Path]): A capture of the full client window,
+                as a BGR image array or the path to a PNG.
+            channel_order (Literal["rgb", "bgr"], optional): How the PNG stores its
+                colors. See `__init__`. Defaults to "rgb".
+
+        Raises:
+            FileNotFoundError: If the image could not be read.
+        """
+        if isinstance(image, (str, Path)):
+            img = cv2.imread(str(image), cv2.IMREAD_COLOR)
+            if img is None:
+                raise FileNotFoundError(f"Could not read recorded window: {image}")
+            if channel_order == "bgr":
+                img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+            image = img
+        self._image = np.ascontiguousarray(image[:, :, :3])
+
+    @classmethod
+    def record(cls, window: RuneLiteWindow, path: Union[str, Path]) -> Path:
+        """Save a capture of a live client window for later use by `RecordedWindow`.
+
+        Args:
+            window (RuneLiteWindow): The live window to capture.
+            path (Union[str, Path]): Where to write the PNG.
+
+        Returns:
+            Path: The path to the written PNG, which can be loaded with the default
+                `channel_order`.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        cv2.imwrite(str(path), window.rectangle().screenshot())
+        return path
+
+    def _crop(self, rect: Rectangle) -> np.ndarray:
+        """Capture a `Rectangle` from the recorded image.
+
+        Args:
+            rect (Rectangle): The area to capture, in screen coordinates.
+
+        Returns:
+            np.ndarray: A new BGR image of `rect`'s size, black wherever `rect` falls
+                outside of the recorded window.
+        """
+        out = np.zeros((rect.height, rect.width, 3), dtype=np.uint8)
+        img_h, img_w = self._image.shape[:2]
+        left, top = rect.left - self._origin.x, rect.top - self._origin.y
+        x0, y0 = max(left, 0), max(top, 0)
+        x1, y1 = min(left + rect.width, img_w), min(top + rect.height, img_h)
+        if x0 < x1 and y0 < y1:
+            out[y0 - top : y1 - top, x0 - left : x1 - left] = self._image[y0:y1, x0:x1]
+        return out
+
+    def activate(self) -> None:
+        """Serve every `Rectangle.screenshot` from the recorded image."""
+        if not self._active:
+            self._previous_source = set_capture_source(self._crop)
+            self._active = True
+
+    def deactivate(self) -> None:
+        """Restore whichever capture source was in use before `activate`."""
+        if self._active:
+            set_capture_source(self._previous_source)
+            self._previous_source = None
+            self._active = False
+
+    def __enter__(self) -> "RecordedWindow":
+        self.activate()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deactivate()
+
+    def initialize(self, use_layout_cache: bool = False, focus: bool = True) -> bool:
+        """Locate the UI regions within the recorded image.
+
+        This activates the recorded capture source (if it isn't already) and then
+        initializes exactly as `RuneLiteWindow.initialize` does. The layout cache is
+        skipped by default, so that recordings exercise the full template searches and
+        never overwrite the layouts cached for a live client.
+
+        Args:
+            use_layout_cache (bool, optional): Whether to use the layout cache.
+                Defaults to False.
+            focus (bool, optional): Accepted for compatibility with
+                `RuneLiteWindow.initialize`, though there is nothing to focus.
+                Defaults to True.
+
+        Returns:
+            bool: True if successful, else a `WindowInitializationError` is raised.
+        """
+        self.activate()
+        return super().initialize(use_layout_cache=use_layout_cache, focus=focus)
+
+    # --- Live window overrides ---
+    @property
+    def window(self) -> None:
+        """There is no live client window behind a recording.
+
+        Returns:
+            None: Always.
+        """
+        return None
+
+    def focus(self) -> None:
+        """Do nothing, since there is no live client window to focus."""
+
+    def switch_window_to_runelite(self) -> bool:
+        """Do nothing, since the recording is always "in front".
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def is_runelite_active_window(self) -> bool:
+        """Report the recording as the active window.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def position(self) -> Point:
+        """Get the origin (i.e. left-top corner) of the recorded window.
+
+        Returns:
+            Point: Where the recording is placed on the virtual screen.
+        """
+        return self._origin
+
+    def rectangle(self) -> Rectangle:
+        """Get a `Rectangle` outlining the recorded window.
+
+        Returns:
+            Rectangle: The bounding `Rectangle` of the recorded image, placed at its
+                origin.
+        """
+        height, width = self._image.shape[:2]
+        return Rectangle(self._origin.x, self._origin.y, width, height)
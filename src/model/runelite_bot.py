@@ -4,10 +4,9 @@ import shutil
 import threading
 import time
 from abc import ABCMeta
-from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple, Union
+from typing import List, Literal, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -15,7 +14,6 @@ import pyautogui as pag
 import pytweening
 import requests
 from matplotlib.pyplot import imsave
-from skimage.metrics import structural_similarity as ssim
 
 import utilities.ocr as ocr
 import utilities.random_util as rd
@@ -23,10 +21,23 @@ from model.bot import Bot
 from model.runelite_window import RuneLiteWindow
 from model.window import Window
 from utilities import settings
-from utilities.color_util import Color, ColorPalette, isolate_colors, isolate_contours
+from utilities.color_util import Color, ColorPalette, isolate_contours
+from utilities.compass import (
+    clear_compass_cache,
+    get_compass_engine,
+    load_compass_atlas,
+)
 from utilities.extract_contours import extract_contours
-from utilities.geometry import Point, Rectangle, RuneLiteObject, cosine_similarity
-from utilities.img_search import BOT_IMAGES, search_img_in_rect
+from utilities.frame_diff import FrameDiffer
+from utilities.geometry import (
+    DistMeasure,
+    Point,
+    Rectangle,
+    RuneLiteObjects,
+    cosine_similarity,
+)
+from utilities.img_search import BOT_IMAGES, search_img_in_grid, search_img_in_rect
+from utilities.object_tracker import ObjectTracker
 
 
 class RuneLiteBot(Bot, metaclass=ABCMeta):
@@ -49,6 +60,14 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
     # actual game tick is 0.6 seconds, but 3 additional milliseconds are included to
     # account for latency.
     game_tick = 0.603
+    # Detectors that look at the same `Rectangle` within this many seconds of each
+    # other share a single capture (see `Rectangle.capture`), so that the screenshot
+    # is converted to HSV, grayscale, and color masks at most once per frame.
+    frame_max_age = 0.05
+    # How often (in seconds) `sleep` lets the window check whether the client was
+    # moved, resized, or switched layouts (see `RuneLiteWindow.check_layout`). Set to
+    # None to disable the watchdog.
+    layout_check_interval: Optional[float] = 2.0
 
     def __init__(
         self,
@@ -69,6 +88,31 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         super().__init__(game_title, bot_title, description, window)
         self.num_relogs = 0  # How many times we have logged in and out of RuneLite.
 
+    def sleep(self, lo: float = 0.1, hi: float = 0.3) -> None:
+        """Don't do anything for a number of seconds, then verify the client layout.
+
+        Bots sleep between nearly all of their actions, which makes it a natural place
+        to run the layout watchdog: at most once per `layout_check_interval`, the
+        window regions are re-derived if the client moved, resized, or changed modes,
+        so that later clicks never land on stale coordinates.
+
+        Args:
+            lo (float, optional): The lower bound for the truncated normal distribution
+                the time to sleep in seconds will be drawn from. Defaults to 0.1.
+            hi (float, optional): The upper bound for the truncated normal distribution
+                the time to sleep in seconds will be drawn from. Defaults to 0.3.
+        """
+        super().sleep(lo, hi)
+        if self.layout_check_interval is None or self.win is None:
+            return
+        status = self.win.check_layout(min_interval=self.layout_check_interval)
+        if status == "moved":
+            self.log_msg("Client window moved. Regions shifted to match.")
+        elif status == "reinitialized":
+            self.log_msg("Client layout changed. Window re-initialized.")
+        elif status == "failed":
+            self.log_msg("Client layout changed, but the new layout was not found.")
+
     # --- OCR ---
     def get_mouseover_text(
         self,
@@ -92,8 +136,14 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         if colors is None:
             colors = [self.cp.bgr.OFF_WHITE_TEXT, self.cp.bgr.OFF_CYAN_TEXT]
         if contains is None:
-            return ocr.scrape_text(self.win.mouseover, ocr.BOLD_12, colors)
-        return bool(ocr.find_textbox(contains, self.win.mouseover, ocr.BOLD_12, colors))
+            return ocr.scrape_text(
+                self.win.mouseover, ocr.BOLD_12, colors, pool=self.pool
+            )
+        return bool(
+            ocr.find_textbox(
+                contains, self.win.mouseover, ocr.BOLD_12, colors, pool=self.pool
+            )
+        )
 
     def get_chatbox_text(
         self,
@@ -115,8 +165,12 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         if colors is None:
             colors = [self.cp.bgr.BLACK, self.cp.bgr.OFF_RED_TEXT]
         if contains is None:
-            return ocr.scrape_text(self.win.chat, ocr.PLAIN_12, colors)
-        return bool(ocr.find_textbox(contains, self.win.chat, ocr.PLAIN_12, colors))
+            return ocr.scrape_text(self.win.chat, ocr.PLAIN_12, colors, pool=self.pool)
+        return bool(
+            ocr.find_textbox(
+                contains, self.win.chat, ocr.PLAIN_12, colors, pool=self.pool
+            )
+        )
 
     def get_chat_input_text(self) -> str:
         """Scrape the text on the chat input line.
@@ -128,6 +182,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             self.win.chat_input,
             ocr.PLAIN_12,
             self.cp.bgr.BLACK,
+            pool=self.pool,
         )
 
     def close_active_chat_cursor(self) -> bool:
@@ -167,7 +222,11 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             True if the player is performing the given action, False otherwise.
         """
         txt_box = ocr.find_textbox(
-            action, self.win.current_action, ocr.PLAIN_12, self.cp.bgr.GREEN
+            action,
+            self.win.current_action,
+            ocr.PLAIN_12,
+            self.cp.bgr.GREEN,
+            pool=self.pool,
         )
         return bool(txt_box)
 
@@ -184,6 +243,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             self.win.chat_history[0],
             ocr.PLAIN_12,
             self.cp.bgr.BLACK,
+            pool=self.pool,
         )
 
     def get_chat_history(self, colors: Union[Color, List[Color]] = None) -> List[str]:
@@ -206,7 +266,9 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             ]
         colors = [colors] if colors and not isinstance(colors, list) else colors
         for chat_line in self.win.chat_history:
-            txt = ocr.scrape_text(chat_line, ocr.PLAIN_12, colors=colors)
+            txt = ocr.scrape_text(
+                chat_line, ocr.PLAIN_12, colors=colors, pool=self.pool
+            )
             lines.append(txt if txt else "")
         return lines
 
@@ -226,6 +288,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             self.win.chat_history[0],
             ocr.PLAIN_12,
             self.cp.bgr.OFF_RED_TEXT,
+            pool=self.pool,
         )
 
     def check_idle_notifier_status(
@@ -275,6 +338,9 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         Returns:
             bool: True if the object was found (and the mouse was moved), else False.
         """
+        # Reuse the detection for each order rather than re-detecting, unless nothing
+        # was detected (e.g. the objects hadn't rendered yet).
+        objs = self.find_colors(self.win.game_view, color)
         for order in range(order_max):
             _s = "" if order == 0 else "s"
             msg = (
@@ -283,7 +349,11 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             )
             self.log_msg(msg, overwrite=True)
             self.sleep()
-            if self.move_mouse_to_color_obj(color=color, order=order, verbose=False):
+            if not objs:
+                objs = self.find_colors(self.win.game_view, color)
+            if self.move_mouse_to_color_obj(
+                color=color, order=order, verbose=False, objs=objs
+            ):
                 if req_txt:
                     if self.get_mouseover_text(contains=req_txt):
                         self.log_msg(
@@ -297,8 +367,11 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         return False
 
     def find_colors(
-        self, rect: Rectangle, colors: Union[Color, List[Color]]
-    ) -> List[RuneLiteObject]:
+        self,
+        rect: Rectangle,
+        colors: Union[Color, List[Color]],
+        parallel: bool = False,
+    ) -> RuneLiteObjects:
         """Get all contours on screen of a given HSV color as a list of rectangles.
 
         Note that a `RuneLiteObject` is effectively a 2D geometric shape bounded by a
@@ -311,17 +384,51 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
                 (e.g., `Bot.win.control_panel`).
             colors (Union[Color, List[Color]]): The OpenCV-style HSV color tuple to
                 search for.
+            parallel (bool, optional): If several `colors` are given, whether to
+                detect each color separately on `Bot.pool` rather than all at once.
+                Note that touching objects of different colors are then reported as
+                separate objects instead of a single merged one. Defaults to False.
 
         Returns:
-            List[RuneLiteObject]: A list of `RuneLiteObject` objects or an empty
-                list if none with a matching color were found.
-        """
-        img_bgr = rect.screenshot()
-        isolated_contours = isolate_contours(img_bgr, colors)  # Threshold contours.
-        objs = extract_contours(isolated_contours)  # Get each contour as a `Rectangle`.
+            RuneLiteObjects: A list-like collection of `RuneLiteObject` objects (empty
+                if none with a matching color were found) that also supports
+                vectorized nearest-object queries like `nth_nearest`.
+        """
+        frame = rect.capture(self.frame_max_age)
+        if parallel and isinstance(colors, list) and len(colors) > 1:
+            # Convert up front so that workers share one conversion instead of racing.
+            _ = (frame.hsv, frame.gray)
+            masks = self.pool.map(isolate_contours, [frame] * len(colors), colors)
+            found = self.pool.map(extract_contours, masks)
+            objs = [obj for color_objs in found for obj in color_objs]
+        else:
+            isolated_contours = isolate_contours(frame, colors)  # Threshold contours.
+            objs = extract_contours(isolated_contours)  # Get each contour as a shape.
         for obj in objs:
             obj.set_rectangle_reference(rect)
-        return objs
+        return RuneLiteObjects(objs, rect=rect)
+
+    def track_colors(
+        self, rect: Rectangle, colors: Union[Color, List[Color]]
+    ) -> ObjectTracker:
+        """Start tracking all objects of a given HSV color across frames.
+
+        Unlike `find_colors`, which detects every object from scratch on each call,
+        the returned `ObjectTracker` assigns each object a stable ID and only
+        re-detects objects in regions of the screen that changed between updates.
+
+        Args:
+            rect (Rectangle): A reference to the `Rectangle` to track objects within
+                (e.g., `Bot.win.game_view`).
+            colors (Union[Color, List[Color]]): The OpenCV-style HSV color tuple to
+                track.
+
+        Returns:
+            ObjectTracker: A tracker that has already processed its first frame.
+        """
+        tracker = ObjectTracker(rect, colors)
+        tracker.update()
+        return tracker
 
     def find_sprite(
         self,
@@ -425,74 +532,45 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             self.move_camera(horizontal=rot) if rot != 0 else None
             img_path = img_folder / f"{deg}.png"
             imsave(img_path, self.win.compass_orb.screenshot())
+        clear_compass_cache(mode)  # The atlas is rebuilt from the new PNGs on demand.
 
-    def _load_compass_map(self) -> Dict[int, np.ndarray]:
-        """Load compass images for each degree (0-359) into a dictionary.
+    def _load_compass_map(self) -> np.ndarray:
+        """Load compass images for each degree (0-359) of the current layout mode.
 
-        This method initializes the `_compass_map` attribute, which is a dictionary
-        where each key is an integer degree (0-359) and each value is the corresponding
-        compass image loaded from disk.
-
-        The images are loaded with the `cv2.IMREAD_COLOR` flag to retain their
-        original properties, excluding any alpha channels.
+        The images come from a process-wide, memory-mapped atlas (see
+        `utilities.compass.load_compass_atlas`), so only the first bot in a process to
+        use a given mode pays the cost of reading the 360 reference PNGs.
 
         Returns:
-            Dict[int, np.ndarray]: Dictionary mapping integer degrees to corresponding
-                compass images loaded from disk.
+            np.ndarray: A read-only array of shape (360, height, width, 3), where index
+                `i` is the BGR compass image rotated `i` degrees clockwise from north.
         """
-        compass_map = {}
-        mode = self.win.mode  # Either "fixed_classic" or "resizable_classic".
-        img_folder = BOT_IMAGES / "ui_templates" / "compass_degrees" / mode
-        for deg in range(360):
-            img_path = img_folder / f"{deg}.png"
-            compass_map[deg] = cv2.imread(str(img_path), cv2.IMREAD_COLOR)
-        return compass_map
+        return load_compass_atlas(self.win.mode)
 
-    def get_compass_angle(self) -> int:
+    def get_compass_angle(self, compass: Optional[np.ndarray] = None) -> int:
         """Get the on-screen compass's degree of clockwise rotation from north.
 
         This method captures the current compass image from the screen and compares
-        it against pre-loaded reference images for each degree (0-359) using the
-        Structural Similarity Index (SSIM). The degree with the highest similarity
-        score is considered the current orientation of the compass.
+        it against pre-loaded reference images for each degree (0-359) using a
+        `CompassEngine`, which scores every degree at once via normalized
+        cross-correlation of compact, precomputed feature vectors. The degree with the
+        highest score is considered the current orientation of the compass.
 
-        If the `_compass_map` attribute is not already loaded, it `_load_compass_map`
-        is called to initialize it.
+        The engine for the current layout mode is shared process-wide, so it is only
+        built once no matter how many bots are created.
+
+        Args:
+            compass (Optional[np.ndarray], optional): A BGR capture of the compass orb
+                that was already taken (e.g. to check whether it changed). Defaults to
+                None, meaning the compass orb is captured anew.
 
         Returns:
             int: The degree (0-359) that best matches the current compass image.
         """
-        cardinal_directions = {0, 90, 180, 270}
-        if not hasattr(self, "_compass_map"):
-            self._compass_map = self._load_compass_map()
-        img_current = self.win.compass_orb.screenshot()
-
-        def __compare_images(degree: int) -> Tuple[float, int]:
-            img_ref = self._compass_map[degree]
-            # `channel_axis` is the axis representing color channels in the img arrays.
-            similarity = ssim(img_current, img_ref, channel_axis=2)
-            return similarity, degree
-
-        def __distance_to_cardinal(degree: int) -> int:
-            return min(abs(degree - cd) for cd in cardinal_directions)
-
-        # Parallelize the comparison of the current to reference image for each degree.
-        with ThreadPoolExecutor() as executor:
-            results = list(executor.map(__compare_images, range(360)))
-
-        # Get all degrees with the maximum similarity score.
-        max_similarity = max(results, key=lambda x: x[0])[0]
-        max_results = [result for result in results if result[0] == max_similarity]
-        # Get any cardinal directions in `max_results`.
-        cardinal = next((x for x in max_results if x[1] in cardinal_directions), None)
-        if cardinal:
-            chosen_result = cardinal
-        else:
-            # Choose the largest degree with the min distance to any cardinal direction.
-            chosen_result = max(
-                max_results, key=lambda x: (-x[1], __distance_to_cardinal(x[1]))
-            )
-        return chosen_result[1]
+        engine = get_compass_engine(self.win.mode)
+        if compass is None:
+            compass = self.win.compass_orb.screenshot()
+        return engine.angle(compass)
 
     def set_compass_direction(
         self, direction: Literal["north", "east", "south", "west"]
@@ -805,7 +883,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         while not close_enough and time.time() - start < duration:
             local_rect = self.mouse.get_rect_around_point(center, pad=150)
             tiles = self.find_colors(rect=local_rect, colors=path_color)
-            tiles = sorted(tiles, key=RuneLiteObject.dist_from_rect_center)
+            tiles = tiles.sorted_by_distance()
             similarities = {}
             for tile in tiles:
                 tile_center = tile._center
@@ -878,6 +956,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             font=ocr.BOLD_12,
             colors=self.cp.bgr.WHITE,
             exclude_chars=[char for char in ocr.PROBLEMATIC_CHARS if char != ","],
+            pool=self.pool,
         ):
             txt = txt.lower()
             if exit_txt is not None:
@@ -890,7 +969,9 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
                     (x, y) = (dx, 0) if exit_direction in ["left", "right"] else (0, dy)
                     self.mouse.move_rel(x, y)
                     return False
-        if ocr_rect := ocr.find_textbox(req_txt, rc_rect, font=font, colors=color):
+        if ocr_rect := ocr.find_textbox(
+            req_txt, rc_rect, font=font, colors=color, pool=self.pool
+        ):
             # Note that if the mouse strays too far, the context menu will disappear.
             menu_point = ocr_rect[0].center  # Use the center for reliability.
             y_move = menu_point.y - posn.y  # Only move vertically.
@@ -904,8 +985,9 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         self,
         color: Color,
         order: int = 0,
-        dist_measure: str = "absolute",
+        dist_measure: DistMeasure = "absolute",
         verbose: bool = True,
+        objs: RuneLiteObjects = None,
     ) -> bool:
         """Move the mouse to a region of a specified color within the game window.
 
@@ -924,25 +1006,22 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
                 "absolute". Defaults to "absolute".
             verbose (bool, optional): Whether to log detailed messages. Defaults to
                 True.
+            objs (RuneLiteObjects, optional): A previous `find_colors` result to reuse
+                instead of detecting objects again. Defaults to None (i.e. detect).
 
         Returns:
             bool: True if the mouse was moved to the color-marked object, else False.
         """
-        if match_obj := self.find_colors(self.win.game_view, color):
-            key = RuneLiteObject.dist_from_rect_center
-            if dist_measure == "vertical":
-                key = RuneLiteObject.vert_dist_from_rect_center
-            if dist_measure == "horizontal":
-                key = RuneLiteObject.horz_dist_from_rect_center
-            if dist_measure == "absolute":
-                key = RuneLiteObject.dist_from_rect_center
-            match_obj = sorted(match_obj, key=key)
-            _s = "s" if len(match_obj) != 1 else ""
+        if objs is None:
+            objs = self.find_colors(self.win.game_view, color)
+        if objs:
+            _s = "s" if len(objs) != 1 else ""
             if verbose:
-                self.log_msg(f"{len(match_obj)} {color.name} object{_s} found.")
-            if not order + 1 <= len(match_obj):
+                self.log_msg(f"{len(objs)} {color.name} object{_s} found.")
+            if not order + 1 <= len(objs):
                 order = 0  # If the order is invalid, use the closest instead.
-            self.mouse.move_to(match_obj[order].random_point())
+            match_obj = objs.nth_nearest(order, dist_measure)
+            self.mouse.move_to(match_obj.random_point())
             if verbose:
                 self.log_msg(f"Mouse moved to {color.name} object.", overwrite=True)
             return True
@@ -1006,6 +1085,32 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         return False
 
     # --- Inventory ---
+    def _find_sprite_in_inv_slots(
+        self, png: Union[Path, str], folder: Union[Path, str] = "", confidence=0.15
+    ) -> np.ndarray:
+        """Determine which inventory slots contain a sprite, all at once.
+
+        This is the vectorized equivalent of calling `find_sprite` on every slot in
+        `self.win.inventory_slots`: the inventory is captured once and the sprite is
+        matched against every slot in one operation (see `search_img_in_grid`).
+
+        Args:
+            png (Union[Path, str]): The PNG filename of the sprite.
+            folder (Union[Path, str], optional): The subfolder within the src/img/bot
+                directory that contains PNG image.
+            confidence (float, optional): The acceptable confidence level of reporting a
+                match (i.e. p-value), ranging from 0 to 1, where 0 is a perfect match.
+                Defaults to 0.15.
+
+        Returns:
+            np.ndarray: A boolean array of 28 elements, True where the sprite was found.
+        """
+        folder = Path(folder) if isinstance(folder, str) else folder
+        png_path = folder / png if folder else png
+        return search_img_in_grid(
+            BOT_IMAGES / png_path, self.win.inventory_grid, confidence=confidence
+        )
+
     def get_inv_item_slots(
         self, png: str, folder: str, confidence: float = 0.15
     ) -> List[int]:
@@ -1022,13 +1127,8 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             List[int]: A list of inventory slot indices where the given sprite was
                 found, otherwise an empty list if no matches were found.
         """
-        inds = []
-        for i, slot in enumerate(self.win.inventory_slots):
-            if self.find_sprite(
-                win=slot, png=png, folder=folder, confidence=confidence
-            ):
-                inds.append(i)
-        return inds
+        found = self._find_sprite_in_inv_slots(png, folder, confidence)
+        return np.flatnonzero(found).tolist()
 
     def get_first_item_index(
         self, png: str, folder: str, confidence: float = 0.15
@@ -1046,11 +1146,9 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             Optional[int]: The slot number where the sprite was found, or None if the
                 sprite wasn't found at all.
         """
-        for i, slot in enumerate(self.win.inventory_slots):
-            if self.find_sprite(
-                win=slot, png=png, folder=folder, confidence=confidence
-            ):
-                return i
+        found = self._find_sprite_in_inv_slots(png, folder, confidence)
+        if found.any():
+            return int(found.argmax())
 
     def get_num_empty_inv_slots(self, verbose=False) -> int:
         """Determine how much space is left in our character's inventory.
@@ -1062,15 +1160,13 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         Returns:
             int: The number of empty spaces left our character's inventory.
         """
-        # Determine whether each inventory slot is empty.
+        # Determine whether each inventory slot is empty, all from a single capture.
         item_path = BOT_IMAGES / "inventory" / "empty-slot.png"
-        num_empty_slots = 0
-        for i, slot in enumerate(self.win.inventory_slots):
-            if search_img_in_rect(item_path, slot, confidence=0.10):
-                if verbose:
-                    self.log_msg(f"Inventory slot {i+1} is empty.")
-                num_empty_slots += 1
-        return num_empty_slots
+        empty = search_img_in_grid(item_path, self.win.inventory_grid, confidence=0.10)
+        if verbose:
+            for i in np.flatnonzero(empty):
+                self.log_msg(f"Inventory slot {i+1} is empty.")
+        return int(empty.sum())
 
     def get_num_full_inv_slots(self, verbose=False) -> int:
         """Determine the number of occupied slots in our character's inventory.
@@ -1101,13 +1197,8 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         Returns:
             int: The number of the given item found in our inventory.
         """
-        num_found = 0
-        for slot in self.win.inventory_slots:
-            if self.find_sprite(
-                win=slot, png=png, folder=folder, confidence=confidence
-            ):
-                num_found += 1
-        return num_found
+        found = self._find_sprite_in_inv_slots(png, folder, confidence)
+        return int(found.sum())
 
     def is_item_in_inv(self, png: str, folder: str, confidence: float = 0.15) -> bool:
         """Determine whether a specific item is in our character's inventory.
@@ -1286,13 +1377,30 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
     # --- General Utilities ---
     def sleep_while_not_idle(self) -> None:
         """Do nothing while we wait for our character to finish their task."""
-        while not self.check_idle_notifier_status("is_idle"):
-            self.sleep()
+        self._sleep_until_idle_notifier_status("is_idle")
 
     def sleep_while_moving(self):
         """Do nothing while we wait for our character to finish moving."""
-        while not self.check_idle_notifier_status("stopped_moving"):
+        self._sleep_until_idle_notifier_status("stopped_moving")
+
+    def _sleep_until_idle_notifier_status(
+        self, status: Literal["is_idle", "stopped_moving"]
+    ) -> None:
+        """Sleep until the Idle Notifier plug-in reports a given status.
+
+        The most recent chat line is only re-scraped with OCR when it has visibly
+        changed since the previous check, as identical pixels would yield the same
+        (negative) result.
+
+        Args:
+            status (Literal["is_idle", "stopped_moving"]): The status to wait for.
+        """
+        chat_line = self.win.chat_history[0]
+        chat_line.changed_tiles(key=status)  # Remember the current chat line.
+        while not self.check_idle_notifier_status(status):
             self.sleep()
+            while not chat_line.has_changed(key=status):
+                self.sleep()
 
     def sleep_while_traveling(self):
         """Do nothing while we wait for our character to finish traveling."""
@@ -1305,10 +1413,9 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         Returns:
             bool: True if friends are nearby, False otherwise.
         """
-        minimap_bgr = self.win.minimap.screenshot()
-        minimap_hsv = cv2.cvtColor(minimap_bgr, cv2.COLOR_BGR2HSV)
+        minimap = self.win.minimap.capture(self.frame_max_age)
         # Blacken out the minimap and turn friend dots white.
-        only_friends = isolate_colors(minimap_hsv, [self.cp.hsv.GREEN])
+        only_friends = minimap.mask([self.cp.hsv.GREEN])
         # Sum the elements in the image matrix and divide by the total number of
         # elements to calculate the mean "friendliness".
         mean = only_friends.mean(axis=(0, 1))
@@ -1399,7 +1506,11 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         for style in styles[combat_style]:
             # Try to find the center of the word with OCR
             if result := ocr.find_textbox(
-                style, self.win.cp_inner, ocr.PLAIN_11, self.cp.bgr.OFF_ORANGE_TEXT
+                style,
+                self.win.cp_inner,
+                ocr.PLAIN_11,
+                self.cp.bgr.OFF_ORANGE_TEXT,
+                pool=self.pool,
             ):
                 # If the word is found, draw a rectangle around it and click a random
                 # point in that rectangle
@@ -1944,19 +2055,18 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         """
         # Position our character relative to the screen.
         char_pos = self.win.game_view.center
-        # Make a rectangle around our character.
+        # Crop a square around our character out of the (possibly shared) game view
+        # capture, rather than taking a separate screenshot.
         offset = 30
-        char_rect = Rectangle.from_points(
-            Point(char_pos.x - offset, char_pos.y - offset),
-            Point(char_pos.x + offset, char_pos.y + offset),
-        )
-        # Take a screenshot of of the rectangle.
-        char_screenshot_bgr = char_rect.screenshot()
-        char_screenshot_hsv = cv2.cvtColor(char_screenshot_bgr, cv2.COLOR_BGR2HSV)
-        # Isolate HP bars in the rectangle.
-        hp_bars = isolate_colors(
-            char_screenshot_hsv, [self.cp.bgr.RED, self.cp.bgr.GREEN]
+        game_view = self.win.game_view.capture(self.frame_max_age)
+        char_frame = game_view.crop(
+            char_pos.x - offset - self.win.game_view.left,
+            char_pos.y - offset - self.win.game_view.top,
+            2 * offset,
+            2 * offset,
         )
+        # Isolate HP bars in the square.
+        hp_bars = char_frame.mask([self.cp.bgr.RED, self.cp.bgr.GREEN])
         # If there are any HP bars, return True.
         return hp_bars.mean(axis=(0, 1)) != 0.0
 
@@ -1967,7 +2077,10 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             int: The HP of the player, or -1 if the value couldn't be read.
         """
         if hp := ocr.scrape_text(
-            self.win.hp_orb_text, ocr.PLAIN_11, [self.cp.bgr.GREEN, self.cp.bgr.RED]
+            self.win.hp_orb_text,
+            ocr.PLAIN_11,
+            [self.cp.bgr.GREEN, self.cp.bgr.RED],
+            pool=self.pool,
         ):
             return int("".join(re.findall(r"\d", hp)))
         return -1
@@ -1979,7 +2092,10 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             int: The Prayer point of the player, or -1 if the value couldn't be read.
         """
         if prayer := ocr.scrape_text(
-            self.win.prayer_orb_text, ocr.PLAIN_11, [self.cp.bgr.GREEN, self.cp.bgr.RED]
+            self.win.prayer_orb_text,
+            ocr.PLAIN_11,
+            [self.cp.bgr.GREEN, self.cp.bgr.RED],
+            pool=self.pool,
         ):
             return int("".join(re.findall(r"\d", prayer)))
         return -1
@@ -2006,6 +2122,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
                 self.cp.bgr.ORB_TEXT_10_0,
             ],
             exclude_chars=ocr.PROBLEMATIC_CHARS + ["O", "o", "l"],
+            pool=self.pool,
         ):
             return int("".join(re.findall(r"\d", energy)))
         return -1
@@ -2020,6 +2137,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             self.win.spec_orb_text,
             ocr.PLAIN_11,
             [self.cp.bgr.ORB_GREEN, self.cp.bgr.ORB_RED],
+            pool=self.pool,
         ):
             return int("".join(re.findall(r"\d", special_energy)))
         return -1
@@ -2032,7 +2150,9 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         """
         fonts = [ocr.PLAIN_11, ocr.PLAIN_12, ocr.BOLD_12]
         for font in fonts:
-            if xp := ocr.scrape_text(self.win.xp_total, font, self.cp.bgr.WHITE):
+            if xp := ocr.scrape_text(
+                self.win.xp_total, font, self.cp.bgr.WHITE, pool=self.pool
+            ):
                 return int("".join(re.findall(r"\d", xp)))
         return -1
 
@@ -2109,6 +2229,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             font=ocr.PLAIN_12,
             colors=self.cp.bgr.WHITE,
             exclude_chars=[char for char in ocr.PROBLEMATIC_CHARS if char != ","],
+            pool=self.pool,
         ):
             x, y, plane = tuple(map(int, text.replace("Tile", "").split(",")))
         return x, y, plane
@@ -2125,6 +2246,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             rect=self.win.chunk_id,
             font=ocr.PLAIN_12,
             colors=self.cp.bgr.WHITE,
+            pool=self.pool,
         ):
             chunk_id = int(text.replace("ChunkID", ""))
         return chunk_id
@@ -2141,6 +2263,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             rect=self.win.region_id,
             font=ocr.PLAIN_12,
             colors=self.cp.bgr.WHITE,
+            pool=self.pool,
         ):
             region_id = int(text.replace("RegionID", ""))
         return region_id
@@ -2294,10 +2417,19 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         """
         self.log_msg(f"Attempting to click {png} template...")
         filepath = BOT_IMAGES / folder / png
+        differ = FrameDiffer()
         start_time = time.time()
         while time.time() - start_time < 60:
-            template = search_img_in_rect(filepath, self.win.rectangle())
-            if template:
+            client_rect = self.win.rectangle()
+            frame = client_rect.screenshot()
+            # Only search again if the client changed since the last failed search.
+            if not differ.changed(frame):
+                self.sleep()
+                continue
+            if template := search_img_in_rect(filepath, frame):
+                # Shift the found template from screenshot space into screen space.
+                template.left += client_rect.left
+                template.top += client_rect.top
                 self.mouse.move_to(template.random_point())
                 self.mouse.click()
                 self.log_msg(f"Template clicked: {png}", overwrite=True)
@@ -1,17 +1,28 @@
+import copy
 import time
-from typing import Dict, List, Literal, Tuple
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Tuple
 
-import pyautogui as pag
-import pygetwindow as gw
-import win32con
-import win32gui
+import numpy as np
 from matplotlib.pyplot import imsave
 
 import utilities.img_search as imsearch
 from model.window import Window, WindowInitializationError
-from utilities.geometry import Rectangle
+from utilities import layout_cache
+from utilities.executor import get_worker_pool
+from utilities.geometry import Rectangle, RectGrid
 from utilities.mappings import subtract_windows as sw
 
+UI_TEMPLATES = imsearch.BOT_IMAGES / "ui_templates"
+# The minimap template found determines the layout mode. Fixed - Classic is checked
+# first.
+MINIMAP_TEMPLATES = {
+    "fixed_classic": "minimap-fixed-classic.png",
+    "resizable_classic": "minimap-resizable-classic.png",
+}
+CHAT_TEMPLATE = "chat.png"
+CONTROL_PANEL_TEMPLATE = "control-panel.png"
+
 
 class RuneLiteWindow(Window):
     """`RuneLiteWindow` lets us interact with the RuneLite active window.
@@ -57,13 +68,17 @@ class RuneLiteWindow(Window):
     hp_bar: Rectangle = None
     prayer_bar: Rectangle = None
     cp_tabs: List[Rectangle] = []
+    cp_tab_grid: RectGrid = None
     cp_top: Rectangle = None
     cp_bot: Rectangle = None
     cp_inner: Rectangle = None
     inventory: Rectangle = None
     inventory_slots: List[Rectangle] = []
+    inventory_grid: RectGrid = None
     spellbook_normal: List[Rectangle] = []
+    spell_grid: RectGrid = None
     prayers: List[Rectangle] = []
+    prayer_grid: RectGrid = None
 
     # Game View
     game_view: Rectangle = None
@@ -83,6 +98,14 @@ class RuneLiteWindow(Window):
             window_title (str): The title of the application window to interact with.
         """
         super().__init__(window_title, padding_top=26, padding_left=19)
+        # The template matches each region was built from, keyed by region name.
+        self._anchors: Dict[str, Rectangle] = {}
+        # The client area the regions were last built within, used by `check_layout`.
+        self._client_rect: Optional[Rectangle] = None
+        self._last_layout_check = 0.0
+        # The client area a re-initialization last failed within, and when to retry.
+        self._failed_rect: Optional[Tuple[int, int, int, int]] = None
+        self._retry_at = 0.0
 
     def is_runelite_active_window(self) -> bool:
         """Check if the RuneLite window is the currently active window.
@@ -90,6 +113,8 @@ class RuneLiteWindow(Window):
         Returns:
             bool: True if RuneLite is the focused, active window, False otherwise.
         """
+        import pyautogui as pag  # Needs a display, so headless windows never load it.
+
         current_window = pag.getActiveWindow()
         if current_window is not None:
             return "runelite" in current_window.title.lower()
@@ -100,6 +125,12 @@ class RuneLiteWindow(Window):
         Returns:
             bool: True if the active window was switched to RuneLite, False otherwise.
         """
+        # These are Windows-only, so they're imported lazily to allow headless windows
+        # (see `model.recorded_window.RecordedWindow`) to run on any platform.
+        import pygetwindow as gw
+        import win32con
+        import win32gui
+
         runelite_windows = [win for win in gw.getAllTitles() if "RuneLite" in win]
         if not runelite_windows:
             print("RuneLite window not found.")
@@ -130,11 +161,24 @@ class RuneLiteWindow(Window):
         if client := self.window:  # Make sure the window exists before resizing.
             client.size = (width, height)
 
-    def initialize(self) -> bool:
+    def initialize(self, use_layout_cache: bool = True, focus: bool = True) -> bool:
         """Initialize the client window by locating critical UI regions.
 
         This method should be called when a bot is started or resumed (done by default).
 
+        Since UI region positions are deterministic for a given client size and layout
+        mode, the located anchors are persisted to disk (see
+        `utilities.layout_cache`). On a warm start, the cached anchors are validated
+        against a single capture of the client and, if they still match, the full
+        template searches are skipped entirely.
+
+        Args:
+            use_layout_cache (bool, optional): Whether to try the cached layout before
+                searching (and to cache the result of a successful search). Defaults to
+                True.
+            focus (bool, optional): Whether to bring RuneLite to the foreground first.
+                Defaults to True.
+
         Raises:
             WindowInitializationError: Raised if the client failed to initialize all
                 critical aspects of the RuneLite UI.
@@ -143,20 +187,359 @@ class RuneLiteWindow(Window):
             bool: True if successful, else a `WindowInitializationError` is raised.
         """
         start_time = time.time()
-        self.switch_window_to_runelite()
+        if focus:
+            self.switch_window_to_runelite()
         client_rect = self.rectangle()
         try:
-            a = self._locate_minimap(client_rect)
-            b = self._locate_chat(client_rect)
-            c = self._locate_control_panel(client_rect)
+            if use_layout_cache and self._load_cached_layout(client_rect):
+                self._client_rect = client_rect
+                print(f"Window.initialize() took {time.time() - start_time} seconds.")
+                return True
+            a, b, c = self._locate_anchors(client_rect)
             d = self._locate_game_view()
             if all([a, b, c, d]):
+                if use_layout_cache:
+                    self._save_cached_layout(client_rect)
+                self._client_rect = client_rect
                 print(f"Window.initialize() took {time.time() - start_time} seconds.")
                 return True
             return False
         except Exception:
             raise WindowInitializationError()
 
+    def _locate_anchors(self, client_rect: Rectangle) -> Tuple[bool, bool, bool]:
+        """Locate the minimap, chatbox, and control panel, then build their contents.
+
+        The three anchors are independent of one another, so the client is captured
+        only once and every anchor template (including both minimap templates, one
+        per layout mode) is searched for concurrently on the shared `WorkerPool`.
+        Initialization is therefore only as slow as the slowest single search. The
+        dependent sub-regions (orbs, tabs, inventory slots, prayers, spells, etc.) are
+        built afterwards, in order: minimap > chat > control panel.
+
+        Args:
+            client_rect (Rectangle): The client area to search within.
+
+        Returns:
+            Tuple[bool, bool, bool]: Whether the minimap, chatbox, and control panel
+                were found, respectively.
+        """
+        client = client_rect.screenshot()
+        names = [*MINIMAP_TEMPLATES.values(), CHAT_TEMPLATE, CONTROL_PANEL_TEMPLATE]
+        templates = [UI_TEMPLATES / name for name in names]
+        found = imsearch.search_imgs_in_rect(templates, client, pool=get_worker_pool())
+        for rect in found:  # Shift each match from the capture into the live frame.
+            if rect:
+                rect.left += client_rect.left
+                rect.top += client_rect.top
+        *minimaps, chat, cp = found
+        # Note that `mt` refers to the minimap template. The minimap template found
+        # determines the layout mode.
+        mode, mt = next(
+            ((m, mt) for m, mt in zip(MINIMAP_TEMPLATES, minimaps) if mt), (None, None)
+        )
+        if mt:
+            self._build_minimap(mt, mode)
+        else:
+            print("Failed to find minimap.")
+        if chat:
+            self._build_chat(chat)
+        else:
+            print("Failed to find chatbox.")
+        if cp:
+            self._build_control_panel(cp)
+        else:
+            print("Failed to find control panel.")
+        return bool(mt), bool(chat), bool(cp)
+
+    def _layout_digest(self) -> str:
+        """Hash every template used to locate the UI regions.
+
+        Returns:
+            str: The template digest, so that updated templates invalidate the cache.
+        """
+        templates = [*MINIMAP_TEMPLATES.values(), CHAT_TEMPLATE, CONTROL_PANEL_TEMPLATE]
+        return layout_cache.template_digest(UI_TEMPLATES / t for t in templates)
+
+    def _save_cached_layout(self, client_rect: Rectangle) -> None:
+        """Persist the anchors of the currently-located regions to the layout cache.
+
+        Note that the anchors are the template matches themselves (recorded by the
+        `_build_*` methods), not the adjusted regions built from them, so that
+        rebuilding from the cache runs exactly the same code as locating from scratch.
+
+        Args:
+            client_rect (Rectangle): The client area the regions were located within.
+        """
+        layout = {
+            name: (
+                rect.left - client_rect.left,
+                rect.top - client_rect.top,
+                rect.width,
+                rect.height,
+            )
+            for name, rect in self._anchors.items()
+        }
+        size = (client_rect.width, client_rect.height)
+        layout_cache.set_layout(size, self.mode, self._layout_digest(), layout)
+
+    def _load_cached_layout(self, client_rect: Rectangle) -> bool:
+        """Build the UI regions from a cached layout, if one is still valid.
+
+        A cached layout is valid if, in a single capture of the client, each anchor's
+        template still matches the pixels exactly where the anchor says it is. This
+        compares one template position per anchor instead of sliding each template
+        across the whole client.
+
+        Args:
+            client_rect (Rectangle): The client area to build the regions within.
+
+        Returns:
+            bool: True if a valid cached layout was found and built, False otherwise.
+        """
+        size = (client_rect.width, client_rect.height)
+        layouts = layout_cache.get_layouts(
+            size, list(MINIMAP_TEMPLATES), self._layout_digest()
+        )
+        if not layouts:
+            return False
+        client = client_rect.screenshot()
+        names = ("minimap", "chat", "control_panel")
+        for mode, layout in layouts.items():
+            templates = self._anchor_templates(mode)
+            if set(layout) == set(names) and all(
+                self._anchor_matches(client, template, layout[name])
+                for name, template in zip(names, templates)
+            ):
+                rects = {
+                    name: Rectangle(
+                        left + client_rect.left, top + client_rect.top, width, height
+                    )
+                    for name, (left, top, width, height) in layout.items()
+                }
+                self._build_minimap(rects["minimap"], mode)
+                self._build_chat(rects["chat"])
+                self._build_control_panel(rects["control_panel"])
+                return self._locate_game_view()
+        return False
+
+    @staticmethod
+    def _anchor_templates(mode: str) -> Tuple[Path, Path, Path]:
+        """Get the template paths of the minimap, chat, and control panel anchors.
+
+        Args:
+            mode (str): The layout mode, either "fixed_classic" or
+                "resizable_classic".
+
+        Returns:
+            Tuple[Path, Path, Path]: The minimap, chat, and control panel templates.
+        """
+        return (
+            UI_TEMPLATES / MINIMAP_TEMPLATES[mode],
+            UI_TEMPLATES / CHAT_TEMPLATE,
+            UI_TEMPLATES / CONTROL_PANEL_TEMPLATE,
+        )
+
+    @staticmethod
+    def _anchor_matches(
+        client: np.ndarray, template: Path, anchor: layout_cache.Anchor
+    ) -> bool:
+        """Check whether a template still matches a client capture at a cached anchor.
+
+        Args:
+            client (np.ndarray): A BGR capture of the client area.
+            template (Path): The anchor's template image file.
+            anchor (layout_cache.Anchor): The cached (left, top, width, height) of the
+                anchor, relative to the client area.
+
+        Returns:
+            bool: True if the template matches at exactly the cached position, False
+                otherwise (including if the anchor falls outside the capture).
+        """
+        left, top, width, height = anchor
+        crop = client[top : top + height, left : left + width]
+        if left < 0 or top < 0 or crop.shape[:2] != (height, width):
+            return False
+        return imsearch.search_img_in_rect(template, crop) is not None
+
+    def check_layout(
+        self,
+        min_interval: float = 0.0,
+        spot_check: bool = True,
+        retry_interval: float = 30.0,
+    ) -> Literal["skipped", "unchanged", "moved", "reinitialized", "hidden", "failed"]:
+        """Detect a change in the client layout since initialization and recover.
+
+        This is a cheap watchdog meant to be polled throughout a run. It compares the
+        current client geometry (via `Window.rectangle`) to the geometry the regions
+        were built within:
+            - If the client was only moved, every region is rebuilt from its anchor
+                shifted by the same offset, without any template searching.
+            - If the client was resized, the window is fully re-initialized (which
+                itself tries the layout cache first).
+            - If `spot_check` finds that an anchor template no longer matches at its
+                expected position, though the client geometry is unchanged, either
+                the layout mode was switched or the UI is hidden (e.g. by the login
+                screen, a fullscreen interface, or the bank PIN). Only the cached
+                layouts are tried, since a full search can't succeed while the UI is
+                hidden, and the spot check passes again once it's back.
+
+        Args:
+            min_interval (float, optional): The minimum number of seconds between
+                checks. Calls made sooner return "skipped" immediately. Defaults to
+                0.0.
+            spot_check (bool, optional): Whether to verify the anchor templates
+                against a capture of the client. Defaults to True.
+            retry_interval (float, optional): After a re-initialization fails, the
+                number of seconds to wait before searching again, unless the client is
+                moved or resized in the meantime. Defaults to 30.0.
+
+        Returns:
+            Literal["skipped", "unchanged", "moved", "reinitialized", "hidden",
+                "failed"]: What the watchdog did, where "hidden" means the anchors
+                didn't match and no cached layout did either, and "failed" means a
+                full re-initialization failed (now or within `retry_interval`). Either
+                way, the previous regions were kept.
+        """
+        now = time.perf_counter()
+        if now - self._last_layout_check < min_interval:
+            return "skipped"
+        self._last_layout_check = now
+        client_rect = self.rectangle()
+        if self._failed_rect is not None:
+            geometry = (
+                client_rect.left,
+                client_rect.top,
+                client_rect.width,
+                client_rect.height,
+            )
+            if geometry == self._failed_rect and now < self._retry_at:
+                return "failed"
+            return self._reinitialize(client_rect, retry_interval)
+        prev = self._client_rect
+        if prev is None or (client_rect.width, client_rect.height) != (
+            prev.width,
+            prev.height,
+        ):
+            return self._reinitialize(client_rect, retry_interval)
+        if spot_check:
+            client = client_rect.screenshot()
+            templates = self._anchor_templates(self.mode)
+            names = ("minimap", "chat", "control_panel")
+            for name, template in zip(names, templates):
+                rect = self._anchors[name]
+                anchor = (
+                    rect.left - prev.left,
+                    rect.top - prev.top,
+                    rect.width,
+                    rect.height,
+                )
+                if not self._anchor_matches(client, template, anchor):
+                    return self._reinitialize(client_rect, retry_interval, search=False)
+        dx, dy = client_rect.left - prev.left, client_rect.top - prev.top
+        if dx == 0 and dy == 0:
+            return "unchanged"
+        self._translate_layout(dx, dy)
+        self._client_rect = client_rect
+        return "moved"
+
+    def _reinitialize(
+        self, client_rect: Rectangle, retry_interval: float, search: bool = True
+    ) -> Literal["reinitialized", "hidden", "failed"]:
+        """Re-initialize the window on behalf of `check_layout`.
+
+        The regions are re-derived on a copy of the window, which is only swapped in
+        if every region was found, so a failure leaves the previous regions intact.
+        The client area a full search failed within is remembered so that the search
+        isn't repeated on every check (see `retry_interval`). RuneLite isn't brought
+        to the foreground, since the watchdog runs in the middle of a bot's loop.
+
+        Args:
+            client_rect (Rectangle): The current client area.
+            retry_interval (float): How many seconds to wait before searching the
+                same client area again after a failure.
+            search (bool, optional): Whether to search for the UI if no cached layout
+                matches. Defaults to True.
+
+        Returns:
+            Literal["reinitialized", "hidden", "failed"]: "reinitialized" if it
+                succeeded, else "failed" after a full search or "hidden" otherwise.
+        """
+        candidate = copy.copy(self)
+        candidate._anchors = dict(self._anchors)  # Built in place, so don't share it.
+        try:
+            if search:
+                initialized = candidate.initialize(focus=False)
+            else:
+                initialized = candidate._load_cached_layout(client_rect)
+                candidate._client_rect = client_rect
+        except WindowInitializationError:
+            initialized = False
+        if initialized:
+            vars(self).update(vars(candidate))
+            self._failed_rect = None
+            return "reinitialized"
+        if not search:
+            return "hidden"
+        self._failed_rect = (
+            client_rect.left,
+            client_rect.top,
+            client_rect.width,
+            client_rect.height,
+        )
+        self._retry_at = time.perf_counter() + retry_interval
+        return "failed"
+
+    def _translate_layout(self, dx: int, dy: int) -> None:
+        """Rebuild every region after the client window moved by an offset.
+
+        Args:
+            dx (int): The horizontal distance the client moved, in pixels.
+            dy (int): The vertical distance the client moved, in pixels.
+        """
+        mt, chat, cp = (
+            Rectangle(rect.left + dx, rect.top + dy, rect.width, rect.height)
+            for rect in (
+                self._anchors["minimap"],
+                self._anchors["chat"],
+                self._anchors["control_panel"],
+            )
+        )
+        self._build_minimap(mt, self.mode)
+        self._build_chat(chat)
+        self._build_control_panel(cp)
+        self._locate_game_view()
+
+    def changed_regions(self, names: List[str], key: str = "window") -> List[str]:
+        """Get the names of the window regions that changed since their last check.
+
+        The client window is captured only once, and each region is then cropped out of
+        that single capture and compared to its previous crop via
+        `Rectangle.changed_tiles`. This is cheaper than screenshotting each region
+        separately when several regions are polled together.
+
+        Note that the crops ignore each region's `subtract_list`, so `key` should not
+        be shared with callers that diff full `Rectangle.screenshot` captures.
+
+        Args:
+            names (List[str]): The attribute names of the regions to check (e.g.
+                "minimap" or "chat").
+            key (str, optional): The name of the consumer asking. Defaults to "window".
+
+        Returns:
+            List[str]: The subset of `names` whose regions changed, in order.
+        """
+        client_rect = self.rectangle()
+        client = client_rect.screenshot()
+        changed = []
+        for name in names:
+            region: Rectangle = getattr(self, name)
+            x, y = region.left - client_rect.left, region.top - client_rect.top
+            crop = client[y : y + region.height, x : x + region.width]
+            if region.has_changed(key, crop):
+                changed.append(name)
+        return changed
+
     def _gen_subtract_boxes(
         self,
         region_name: str,
@@ -198,25 +581,18 @@ class RuneLiteWindow(Window):
                 )
         return subtract_boxes
 
-    def _locate_minimap(self, client_rect: Rectangle) -> bool:
-        """Locate the minimap area on the clent window.
-
-        This involves not only finding the bounding `Rectangle` for the minimap, but
-        also the bounding `Rectangle` objects for all of its internal positions.
+    def _build_minimap(self, mt: Rectangle, mode: str) -> None:
+        """Create the minimap `Rectangle` objects relative to the located template.
 
         Args:
-            client_rect (Rectangle): The client area to search within.
-
-        Returns:
-            bool: True if the minimap and its contents were located successfully, False
-                otherwise.
+            mt (Rectangle): Where the minimap template of `mode` was found.
+            mode (str): The layout mode, either "fixed_classic" or
+                "resizable_classic".
         """
-        # Note that `mt` refers to the minimap template.
+        self._anchors["minimap"] = mt
+        self.mode = mode
         # Fixed - Classic layout minimap UI.
-        if mt := imsearch.search_img_in_rect(
-            imsearch.BOT_IMAGES / "ui_templates" / "minimap-fixed-classic.png",
-            client_rect,
-        ):
+        if mode == "fixed_classic":
             self._minimap_area = (
                 Rectangle(  # For the `game_view` subtraction rectangle.
                     left=mt.left - 1,
@@ -294,14 +670,8 @@ class RuneLiteWindow(Window):
                 widths=sw.FIXED_MINIMAP_RIGHT_WIDTHS,
                 style="right",
             )
-            self.mode = "fixed_classic"
-            return True
-
         # Resizable - Classic layout minimap UI.
-        if mt := imsearch.search_img_in_rect(
-            imsearch.BOT_IMAGES / "ui_templates" / "minimap-resizable-classic.png",
-            client_rect,
-        ):
+        else:
             self._minimap_area = (
                 Rectangle(  # For the `game_view` subtraction rectangle.
                     left=mt.left, top=mt.top, width=mt.width + 1, height=mt.height + 15
@@ -388,24 +758,14 @@ class RuneLiteWindow(Window):
                 widths=sw.RESIZABLE_MINIMAP_RIGHT_WIDTHS,
                 style="right",
             )
-            self.mode = "resizable_classic"
-            return True
-        print("Failed to find minimap.")
-        return False
-
-    def _locate_chat(self, client_rect: Rectangle) -> bool:
-        """Locate the chatbox area (and sub-areas) on the client bounding `Rectangle`.
 
-        In addition to the chat box, lists of `Rectangle` objects isolating chat tabs,
-        chat history, and chat input are all defined here. Note importantly that the
-        game view is calculated relative to the chat box.
+    def _build_chat(self, chat: Rectangle) -> None:
+        """Create the chatbox `Rectangle` objects relative to the located template.
 
         Args:
-            client_rect (Rectangle): The client area to search within.
-
-        Returns:
-            bool: True if the chatbox was found, False otherwise.
+            chat (Rectangle): Where the chatbox template was found.
         """
+        self._anchors["chat"] = chat
         num_tabs = 7  # Exclude the Report button in this count.
         num_lines = 8  # There are 8 lines of chat history.
         btn_height = 22
@@ -419,105 +779,94 @@ class RuneLiteWindow(Window):
         line_height_ocr_bot_pad = 2
         line_height = 14
         x0 = 2  # Initial x-offset.
-        if chat := imsearch.search_img_in_rect(
-            imsearch.BOT_IMAGES.joinpath("ui_templates", "chat.png"), client_rect
-        ):
-            self.chat_tabs = []
-            for i in range(num_tabs):
-                self.chat_tabs.append(
-                    Rectangle(
-                        left=chat.left + x0 + i * (btn_width + btn_spacing),
-                        top=chat.top + chat.height - btn_height,
-                        width=btn_width,
-                        height=btn_height,
-                    )
+        self.chat_tabs = []
+        for i in range(num_tabs):
+            self.chat_tabs.append(
+                Rectangle(
+                    left=chat.left + x0 + i * (btn_width + btn_spacing),
+                    top=chat.top + chat.height - btn_height,
+                    width=btn_width,
+                    height=btn_height,
                 )
-            self.chat_tabs_all = Rectangle(
-                left=chat.left,
-                top=chat.top + chat.height - btn_height - border_thickness // 2,
-                width=chat.width,
-                height=btn_height + border_thickness,
-            )
-            self.chat_history = []
-            # Set the y-offset to skip the current "Press Enter to Chat..." line. This
-            # offset is purposefully built up from the bottom of the chat window.
-            y0 = (
-                btn_height
-                + border_thickness
-                + input_line_y_offset
-                + line_height
-                + border_thickness_input_hist_separator
-                + line_height
-            )
-            for i in range(num_lines):
-                self.chat_history.append(
-                    Rectangle(
-                        left=chat.left + border_thickness,
-                        top=chat.top + chat.height - y0 - (i * line_height) - 1,
-                        width=chat.width
-                        - 2 * border_thickness
-                        - scrollbar_width
-                        - scrollbar_x_offset,
-                        height=line_height + line_height_ocr_bot_pad,
-                    )
+            )
+        self.chat_tabs_all = Rectangle(
+            left=chat.left,
+            top=chat.top + chat.height - btn_height - border_thickness // 2,
+            width=chat.width,
+            height=btn_height + border_thickness,
+        )
+        self.chat_history = []
+        # Set the y-offset to skip the current "Press Enter to Chat..." line. This
+        # offset is purposefully built up from the bottom of the chat window.
+        y0 = (
+            btn_height
+            + border_thickness
+            + input_line_y_offset
+            + line_height
+            + border_thickness_input_hist_separator
+            + line_height
+        )
+        for i in range(num_lines):
+            self.chat_history.append(
+                Rectangle(
+                    left=chat.left + border_thickness,
+                    top=chat.top + chat.height - y0 - (i * line_height) - 1,
+                    width=chat.width
+                    - 2 * border_thickness
+                    - scrollbar_width
+                    - scrollbar_x_offset,
+                    height=line_height + line_height_ocr_bot_pad,
                 )
-            # Note the seemingly arbitrary pad of -1 for `top` and +2 for `height`.
-            # This is due to the fact that all tokens in `ocr.PLAIN_12` are 16 pixels
-            # tall because they include a 1-pixel tall padding above and below.
-            self.chat_input = Rectangle(
-                left=chat.left + border_thickness,
-                top=chat.top
-                + chat.height
-                - y0
-                + line_height
-                + border_thickness_input_hist_separator,
-                width=chat.width - 2 * border_thickness,
-                height=line_height + line_height_ocr_bot_pad,
-            )
-            self.chat = chat
-            self._chat_area = Rectangle(  # Used for blackening out the game view.
-                chat.left,
-                chat.top - 1,
-                width=chat.width,
-                height=chat.height + line_height_ocr_bot_pad,
-            )
-            return True
-        print("Failed to find chatbox.")
-        return False
+            )
+        # Note the seemingly arbitrary pad of -1 for `top` and +2 for `height`.
+        # This is due to the fact that all tokens in `ocr.PLAIN_12` are 16 pixels
+        # tall because they include a 1-pixel tall padding above and below.
+        self.chat_input = Rectangle(
+            left=chat.left + border_thickness,
+            top=chat.top
+            + chat.height
+            - y0
+            + line_height
+            + border_thickness_input_hist_separator,
+            width=chat.width - 2 * border_thickness,
+            height=line_height + line_height_ocr_bot_pad,
+        )
+        self.chat = chat
+        self._chat_area = Rectangle(  # Used for blackening out the game view.
+            chat.left,
+            chat.top - 1,
+            width=chat.width,
+            height=chat.height + line_height_ocr_bot_pad,
+        )
 
-    def _locate_control_panel(self, client_rect: Rectangle) -> bool:
-        """Locate the control panel area on the client bounding `Rectangle`.
+    def _build_control_panel(self, cp: Rectangle) -> None:
+        """Create control panel `Rectangle` objects relative to the located template.
 
-        Args:
-            client_rect (Rectangle): The client area to search within.
+        Note that the minimap must be built first, since the control panel area used to
+        blacken out the game view depends on it in Fixed - Classic layout mode.
 
-        Returns:
-            bool: True if the control panel was found, False otherwise.
+        Args:
+            cp (Rectangle): Where the control panel template was found.
         """
-        if cp := imsearch.search_img_in_rect(
-            imsearch.BOT_IMAGES / "ui_templates" / "control-panel.png", client_rect
-        ):
-            # Adjusted because the raw template doesn't include a the top border.
-            self.control_panel = Rectangle(
-                left=cp.left, top=cp.top - 1, width=cp.width, height=cp.height + 1
-            )
-            # The `control_panel_area` is for blackening out the game view.
-            self._control_panel_area = self.control_panel
-            if self.mode == "fixed_classic":
-                self._control_panel_area = Rectangle(
-                    left=self._minimap_area.left,
-                    top=self.control_panel.top,
-                    width=self._minimap_area.width,
-                    height=cp.height + 1,
-                )
-            self._locate_hp_prayer_bars()
-            self._locate_cp_tabs()
-            self._locate_inv_slots()
-            self._locate_prayers()
-            self._locate_spells()
-            return True
-        print("Failed to find control panel.")
-        return False
+        self._anchors["control_panel"] = cp
+        # Adjusted because the raw template doesn't include a the top border.
+        self.control_panel = Rectangle(
+            left=cp.left, top=cp.top - 1, width=cp.width, height=cp.height + 1
+        )
+        # The `control_panel_area` is for blackening out the game view.
+        self._control_panel_area = self.control_panel
+        if self.mode == "fixed_classic":
+            self._control_panel_area = Rectangle(
+                left=self._minimap_area.left,
+                top=self.control_panel.top,
+                width=self._minimap_area.width,
+                height=cp.height + 1,
+            )
+        self._locate_hp_prayer_bars()
+        self._locate_cp_tabs()
+        self._locate_inv_slots()
+        self._locate_prayers()
+        self._locate_spells()
 
     def _locate_hp_prayer_bars(self) -> None:
         """Create `Rectangle` objects for the HP and Prayer bars.
@@ -560,20 +909,18 @@ class RuneLiteWindow(Window):
             width=241,
             height=slot_h + 1,  # The bottom tabs are slightly taller than the top ones.
         )
-        self.cp_tabs = []
-        for i in range(2):
-            x = self.control_panel.left + 1
-            y = self.control_panel.top if i == 0 else self.cp_bot.top
-            for j in range(7):
-                slot_w = slot_w_outer if j in [0, 7] else slot_w_inner
-                tab = Rectangle(
-                    left=x,
-                    top=y,
-                    width=slot_w,
-                    height=slot_h,
-                )
-                self.cp_tabs.append(tab)
-                x += slot_w
+        # There are 2 rows of 7 tabs each, and the first tab of each row is wider.
+        widths = np.array([slot_w_outer] + [slot_w_inner] * 6)
+        lefts = self.control_panel.left + 1 + np.cumsum(widths) - widths
+        tops = [self.control_panel.top, self.cp_bot.top]
+        self.cp_tab_grid = RectGrid(
+            [
+                (left, top, width, slot_h)
+                for top in tops
+                for left, width in zip(lefts, widths)
+            ]
+        )
+        self.cp_tabs = self.cp_tab_grid.rects
 
     def _locate_inv_slots(self) -> None:
         """Create and store `Rectangle` objects for each inventory slot.
@@ -594,7 +941,7 @@ class RuneLiteWindow(Window):
             height=251,
         )
         self.cp_inner = self.inventory  # The inner control panel pane is the same area.
-        self.inventory_slots = []  # There are 7 rows and 4 columns to make 28 slots.
+        # There are 7 rows and 4 columns to make 28 slots.
         # Note that the slots overlap slightly to provide more border padding.
         # 1 [38x45] [38x45] [38x45] [38x45] 1
         # 1    1       1       1       1    1
@@ -607,17 +954,17 @@ class RuneLiteWindow(Window):
         # These offsets are calibrated to give generally centered, symmetrical bounding
         # boxes for item slots with an adequate border to enable better template
         # matching. They define the extent to which the slots overlap.
-        x = self.inventory.left + 9
-        y = self.inventory.top + 1
-        for j in range(7):
-            for i in range(4):
-                slot = Rectangle(
-                    left=x + i * slot_w - 1,
-                    top=y + j * slot_h - 1,
-                    width=slot_w + 1,
-                    height=slot_h + 3,
-                )
-                self.inventory_slots.append(slot)
+        self.inventory_grid = RectGrid.lattice(
+            left=self.inventory.left + 8,
+            top=self.inventory.top,
+            rows=7,
+            cols=4,
+            width=slot_w + 1,
+            height=slot_h + 3,
+            step_x=slot_w,
+            step_y=slot_h,
+        )
+        self.inventory_slots = self.inventory_grid.rects
 
     def _locate_prayers(self) -> None:
         """Create and store `Rectangle` objects for each prayer in the prayer menu.
@@ -629,18 +976,18 @@ class RuneLiteWindow(Window):
             cp (Rectangle): `Rectangle` object acting as a bounding box for the control
                 panel area of the RuneLite client UI.
         """
-        self.prayers = []
         slot_w, slot_h = 37, 37  # Dimensions of the bounding box for each prayer.
-        y = self.cp_inner.top + 3
-        for _ in range(6):
-            x = self.cp_inner.left
-            for _ in range(5):
-                self.prayers.append(
-                    Rectangle(left=x, top=y, width=slot_w, height=slot_h)
-                )
-                x += slot_w
-            y += slot_h
-        del self.prayers[29]  # Remove the last slot since it is unused in-game.
+        # There are 6 rows of 5 prayers, but the last slot is unused in-game.
+        self.prayer_grid = RectGrid.lattice(
+            left=self.cp_inner.left,
+            top=self.cp_inner.top + 3,
+            rows=6,
+            cols=5,
+            width=slot_w,
+            height=slot_h,
+            count=29,
+        )
+        self.prayers = self.prayer_grid.rects
 
     def _locate_spells(self) -> None:
         """Create and store `Rectangle` objects for each spell in the spell menu.
@@ -654,18 +1001,18 @@ class RuneLiteWindow(Window):
             cp (Rectangle): `Rectangle` object acting as a bounding box for the control
                 panel area of the RuneLite client UI.
         """
-        self.spellbook_normal = []
         slot_w, slot_h = 26, 24  # Dimensions of the bounding box for each spell.
-        y = self.control_panel.top + 36
-        for _ in range(10):
-            x = self.control_panel.left + 29
-            for _ in range(7):
-                self.spellbook_normal.append(
-                    Rectangle(left=x, top=y, width=slot_w, height=slot_h)
-                )
-                x += slot_w
-            y += slot_h
-        self.spellbook_normal = self.spellbook_normal[:-5]  # Remove blank areas.
+        # There are 10 rows of 7 spells, but the last 5 slots are blank areas.
+        self.spell_grid = RectGrid.lattice(
+            left=self.control_panel.left + 29,
+            top=self.control_panel.top + 36,
+            rows=10,
+            cols=7,
+            width=slot_w,
+            height=slot_h,
+            count=65,
+        )
+        self.spellbook_normal = self.spell_grid.rects
 
     def _locate_game_view(self) -> bool:
         """Locate the game view while the client is in Fixed - Classic layout mode.
@@ -795,6 +1142,8 @@ class RuneLiteWindow(Window):
         for attr_name, attr_value in self.__dict__.items():
             exceptions = ["window_title", "padding_top", "padding_left", "mode"]
             if not attr_name.startswith("_") and attr_name not in exceptions:
+                if isinstance(attr_value, RectGrid):
+                    continue  # Its cells are snapshotted via the matching list.
                 if isinstance(attr_value, list):
                     region_subfolder = outfolder / attr_name
                     region_subfolder.mkdir(exist_ok=True, parents=True)
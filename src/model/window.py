@@ -1,10 +1,10 @@
-from typing import Optional
-
-import pywinctl
-import pywintypes
+from typing import TYPE_CHECKING, Optional
 
 from utilities.geometry import Point, Rectangle
 
+if TYPE_CHECKING:
+    import pywintypes
+
 
 class WindowInitializationError(Exception):
     """Exception raised for errors in the `Window` class."""
@@ -45,7 +45,7 @@ class Window:
         self.padding_left = padding_left
 
     @property
-    def window(self) -> Optional[pywintypes.HANDLE]:
+    def window(self) -> Optional["pywintypes.HANDLE"]:
         """Retrieve the handle of the game client window.
 
         Raises:
@@ -57,6 +57,7 @@ class Window:
                 representing the game client if found, otherwise None. Note that the
                 `pywinctl.Window` object is an aliased version of `pywinctl.Win32Window`.
         """
+        import pywinctl  # Imported lazily so headless windows never load it.
 
         # Attempt to get an exact match for the window title.
         self._client = pywinctl.getWindowsWithTitle(self.window_title)
@@ -73,6 +74,8 @@ class Window:
         Raises:
             WindowInitializationError: If the game client window cannot be focused.
         """
+        import pywintypes  # Windows-only, so imported lazily.
+
         if client := self.window:
             try:
                 client.activate()
@@ -0,0 +1,160 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from utilities.geometry import Point
+
+OBSTACLES_PATH = Path(__file__).parents[2] / "data" / "obstacles.json"
+
+# A directed move between two adjacent world tiles, as ((x1, y1), (x2, y2)).
+Edge = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+class ObstacleOverlay:
+    """A disk-backed record of moves found blocked in-game, for routing around them.
+
+    The collision map used for local pathfinding can't know about everything that
+    blocks our character in-game (e.g. a closed gate, a door that needs a key, or
+    scenery added in an update). Whenever the `Walker` stalls, it blocks the moves
+    just ahead of it on its path, and every later route found by the local pathfinder
+    (see `CollisionMap.find_path`) pays an extra `penalty` tiles for each of those
+    moves. Routes therefore go around known obstacles if there's a reasonable detour,
+    but can still go through if there is none (e.g. the gate may be open next time).
+
+    Each time a move is blocked again, its penalty grows, and entries expire `ttl`
+    seconds after they were last blocked. The overlay is saved to
+    `src/data/obstacles.json` whenever it changes.
+    """
+
+    def __init__(
+        self,
+        path: Path = OBSTACLES_PATH,
+        penalty: float = 64.0,
+        ttl: float = 7 * 24 * 60 * 60,
+    ) -> None:
+        """Initialize an `ObstacleOverlay`, loading any entries saved previously.
+
+        Args:
+            path (Path, optional): The JSON file to persist entries to. Defaults to
+                `OBSTACLES_PATH`.
+            penalty (float, optional): The extra cost, in tiles, of a move each time it
+                is blocked. Defaults to 64.
+            ttl (float, optional): The number of seconds an entry stays valid after it
+                was last blocked. Defaults to one week.
+        """
+        self.path = Path(path)
+        self.penalty = penalty
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        """Load the saved entries.
+
+        Returns:
+            Dict[str, dict]: The saved entries keyed by `_key`, or an empty dictionary
+                if the file is missing or unreadable.
+        """
+        try:
+            with open(self.path, "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _key(a: Point, b: Point) -> str:
+        """Build the key a move is stored under, e.g. "3200,3201>3200,3202".
+
+        Args:
+            a (Point): The tile moved from.
+            b (Point): The tile moved to.
+
+        Returns:
+            str: The key.
+        """
+        return f"{a.x},{a.y}>{b.x},{b.y}"
+
+    def block(self, moves: Iterable[Tuple[Point, Point]]) -> None:
+        """Record that our character couldn't get from some tiles into the next.
+
+        Since the exact edge at fault is unknown, every move into each destination tile
+        from the source tile or any of its neighbors (i.e. every way of cutting the
+        same corner) is blocked. Moves in open ground thus cost nothing extra to avoid,
+        while a lone passage (e.g. a gate) becomes costly to pass through.
+
+        Args:
+            moves (Iterable[Tuple[Point, Point]]): Each (source, destination) pair of
+                neighboring tiles our character couldn't get between.
+        """
+        now = time.time()
+        with self._lock:
+            for a, b in moves:
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        src = Point(a.x + dx, a.y + dy)
+                        if max(abs(src.x - b.x), abs(src.y - b.y)) != 1:
+                            continue  # Only moves into `b` from an adjacent tile.
+                        entry = self._entries.setdefault(
+                            self._key(src, b), {"penalty": 0.0, "blocked": now}
+                        )
+                        entry["penalty"] += self.penalty
+                        entry["blocked"] = now
+            self._save()
+
+    def penalties(self) -> Dict[Edge, float]:
+        """Get the extra cost of every blocked move that hasn't expired.
+
+        Returns:
+            Dict[Edge, float]: Each blocked move's penalty, in tiles.
+        """
+        now = time.time()
+        out = {}
+        with self._lock:
+            for key, entry in self._entries.items():
+                if now - entry["blocked"] > self.ttl:
+                    continue
+                a, b = key.split(">")
+                ax, ay = map(int, a.split(","))
+                bx, by = map(int, b.split(","))
+                out[((ax, ay), (bx, by))] = entry["penalty"]
+        return out
+
+    def _save(self) -> None:
+        """Write every unexpired entry to disk. The caller must hold `_lock`."""
+        now = time.time()
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if now - entry["blocked"] <= self.ttl
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as file:
+            json.dump(self._entries, file)
+
+    def clear(self) -> None:
+        """Delete every entry, both in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self.path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_overlay: Optional[ObstacleOverlay] = None
+_overlay_lock = threading.Lock()
+
+
+def get_obstacle_overlay() -> ObstacleOverlay:
+    """Get the process-wide `ObstacleOverlay`, creating it with the defaults if needed.
+
+    Returns:
+        ObstacleOverlay: The shared overlay.
+    """
+    global _overlay
+    with _overlay_lock:
+        if _overlay is None:
+            _overlay = ObstacleOverlay()
+        return _overlay
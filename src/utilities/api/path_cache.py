@@ -0,0 +1,250 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from utilities.geometry import Point
+
+PATH_CACHE_PATH = Path(__file__).parents[2] / "data" / "path_cache.json"
+
+
+class PathCache:
+    """A disk-backed cache of pathfinding results for routes walked over and over.
+
+    Bots tend to walk the same few routes (e.g. bank to trees and back) thousands of
+    times, and the shortest path between two tiles never changes. Each path found is
+    therefore stored under its host, its destination, and its start tile quantized to
+    a coarse grid, so that trips starting a few tiles apart share an entry. Since
+    every floor spans the same (x, y) tiles, destinations on upper floors are keyed by
+    their plane as well.
+
+    A lookup succeeds if any cached path to the same destination (from the same host)
+    passes within `snap_radius` tiles of the start. The path is then "snapped onto" by
+    cutting it at its closest tile to the start, so nearby starts reuse it as well.
+
+    Entries expire `ttl` seconds after they were stored, and once there are more than
+    `max_entries`, the least-recently used are evicted. The cache is saved to
+    `src/data/path_cache.json` whenever a path is stored (or on `flush`).
+    """
+
+    def __init__(
+        self,
+        path: Path = PATH_CACHE_PATH,
+        ttl: float = 7 * 24 * 60 * 60,
+        max_entries: int = 512,
+        quantum: int = 4,
+        snap_radius: int = 6,
+    ) -> None:
+        """Initialize a `PathCache`, loading any entries saved previously.
+
+        Args:
+            path (Path, optional): The JSON file to persist entries to. Defaults to
+                `PATH_CACHE_PATH`.
+            ttl (float, optional): The number of seconds an entry stays valid.
+                Defaults to one week.
+            max_entries (int, optional): The maximum number of entries kept. Defaults
+                to 512.
+            quantum (int, optional): The side length, in tiles, of the grid squares
+                that start tiles are quantized to. Defaults to 4.
+            snap_radius (int, optional): The maximum distance, in tiles, from the start
+                to a cached path for it to be reused. Defaults to 6.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.quantum = quantum
+        self.snap_radius = snap_radius
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        """Load the saved entries.
+
+        Returns:
+            Dict[str, dict]: The saved entries keyed by `_key`, or an empty dictionary
+                if the file is missing or unreadable.
+        """
+        try:
+            with open(self.path, "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _dest_key(dest: Point) -> str:
+        """Build the part of a key naming the destination.
+
+        Args:
+            dest (Point): The destination tile of the path. If it is a `WorldPoint`
+                above plane 0, the plane is included.
+
+        Returns:
+            str: The destination part, e.g. "3165,3487" or "3165,3487,1".
+        """
+        if plane := getattr(dest, "plane", 0):
+            return f"{dest.x},{dest.y},{plane}"
+        return f"{dest.x},{dest.y}"
+
+    def _key(self, start: Point, dest: Point, host: str) -> str:
+        """Build the key an entry is stored under.
+
+        Args:
+            start (Point): The start tile of the path.
+            dest (Point): The destination tile of the path.
+            host (str): The pathfinder that found the path (e.g. "dax").
+
+        Returns:
+            str: The key, e.g. "dax:801,863:3165,3487", where the middle part is the
+                quantized start.
+        """
+        qx, qy = start.x // self.quantum, start.y // self.quantum
+        return f"{host}:{qx},{qy}:{self._dest_key(dest)}"
+
+    def _is_expired(self, entry: dict, now: float) -> bool:
+        """Determine whether an entry has outlived the TTL.
+
+        Args:
+            entry (dict): The entry.
+            now (float): The current time, in seconds since the epoch.
+
+        Returns:
+            bool: True if the entry expired, False otherwise.
+        """
+        return now - entry["created"] > self.ttl
+
+    def get(self, start: Point, dest: Point, host: str) -> List[Point]:
+        """Look up a cached path, snapping onto it from a nearby start.
+
+        The entry for the start's own grid square is checked first, then every other
+        entry with the same host and destination.
+
+        Args:
+            start (Point): The tile the path should start at (e.g. our position).
+            dest (Point): The destination tile of the path.
+            host (str): The pathfinder the path should have come from.
+
+        Returns:
+            List[Point]: The cached path from its closest tile to `start` onward, or
+                an empty list if no cached path passes close enough.
+        """
+        own_key = self._key(start, dest, host)
+        prefix, suffix = f"{host}:", f":{self._dest_key(dest)}"
+        now = time.time()
+        with self._lock:
+            keys = [own_key] + [
+                key
+                for key in self._entries
+                if key != own_key and key.startswith(prefix) and key.endswith(suffix)
+            ]
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None or self._is_expired(entry, now):
+                    continue
+                steps = np.array(entry["path"])
+                # Chebyshev distance, since diagonal steps cost the same as others.
+                dists = np.abs(steps - (start.x, start.y)).max(axis=1)
+                # Among equally-close tiles, cut at the one nearest the destination.
+                i = len(dists) - 1 - int(dists[::-1].argmin())
+                if dists[i] <= self.snap_radius:
+                    entry["last_used"] = now
+                    self._dirty = True
+                    self.hits += 1
+                    return [Point(int(x), int(y)) for x, y in steps[i:]]
+            self.misses += 1
+            return []
+
+    def put(self, start: Point, dest: Point, host: str, path: List[Point]) -> None:
+        """Store a path, evicting expired and least-recently used entries if needed.
+
+        Args:
+            start (Point): The tile the path starts at.
+            dest (Point): The destination tile of the path.
+            host (str): The pathfinder that found the path.
+            path (List[Point]): The path found.
+        """
+        if not path:
+            return
+        now = time.time()
+        with self._lock:
+            self._entries[self._key(start, dest, host)] = {
+                "path": [[int(p[0]), int(p[1])] for p in path],
+                "created": now,
+                "last_used": now,
+            }
+            entries = self._entries
+            for key in [k for k, e in entries.items() if self._is_expired(e, now)]:
+                del entries[key]
+            if len(entries) > self.max_entries:
+                by_use = sorted(entries, key=lambda k: entries[k]["last_used"])
+                for key in by_use[: len(entries) - self.max_entries]:
+                    del entries[key]
+            self._save()
+
+    def evict_through(self, tiles: Iterable[Point]) -> int:
+        """Delete every entry whose path passes through any of the given tiles.
+
+
+        Args:
+            tiles (Iterable[Point]): The tiles.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+        steps = {(tile.x, tile.y) for tile in tiles}
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if any(tuple(step) in steps for step in entry["path"])
+            ]
+            for key in keys:
+                del self._entries[key]
+            if keys:
+                self._save()
+            return len(keys)
+
+    def _save(self) -> None:
+        """Write every entry to disk. The caller must hold `_lock`."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as file:
+            json.dump(self._entries, file)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write the entries to disk if any were used since they were last saved."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def clear(self) -> None:
+        """Delete every entry, both in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self.path.unlink(missing_ok=True)
+            self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_path_cache: Optional[PathCache] = None
+_path_cache_lock = threading.Lock()
+
+
+def get_path_cache() -> PathCache:
+    """Get the process-wide `PathCache`, creating it with the defaults if needed.
+
+    Returns:
+        PathCache: The shared cache.
+    """
+    global _path_cache
+    with _path_cache_lock:
+        if _path_cache is None:
+            _path_cache = PathCache()
+        return _path_cache
@@ -1,62 +1,508 @@
-import json
-from typing import Any, Dict
+import heapq
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
+import numpy as np
 import requests
-from tenacity import retry, stop_after_attempt, wait_fixed
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_when_event_set,
+    wait_exponential,
+)
 
-from utilities.geometry import List, Point
+from utilities.api.obstacles import Edge, get_obstacle_overlay
+from utilities.api.transitions import Leg, find_route, get_transitions
+from utilities.geometry import List, Point, WorldPoint
+
+COLLISION_MAP_PATH = Path(__file__).parents[2] / "data" / "collision_map.npz"
+
+
+def collision_map_path(plane: int = 0) -> Path:
+    """Get where the collision map of a plane is stored.
+
+    Note that dungeons lie on plane 0 too (far north of the surface), so the ground
+    floor map at `COLLISION_MAP_PATH` may cover them, while each floor above has its
+    own map alongside, e.g. "collision_map_1.npz".
+
+    Args:
+        plane (int, optional): The plane. Defaults to 0.
+
+    Returns:
+        Path: The `.npz` file of the plane's map.
+    """
+    if plane == 0:
+        return COLLISION_MAP_PATH
+    return COLLISION_MAP_PATH.with_name(f"collision_map_{plane}.npz")
+
+
+class CollisionMap:
+    """A tile collision map of the game world for in-process pathfinding.
+
+    The map is a grid of per-tile flags, where row `y - origin.y` and column
+    `x - origin.x` describe world tile (x, y). Each tile's flags combine:
+        - `BLOCKED`: The tile itself can't be stood on (e.g. a tree or water).
+        - `WALL_N`, `WALL_E`, `WALL_S`, `WALL_W`: A wall (e.g. a fence) runs along
+            that edge of the tile, blocking movement across it.
+
+    On disk, a map is a compressed `.npz` archive holding the `flags` array (uint8)
+    and its `origin`, which is compact because the flags are highly repetitive. Maps
+    are imported from public collision data with `utilities.api.shortest_path_data`.
+
+    When a map is created, the moves allowed out of every tile are computed up front
+    with vectorized NumPy operations and packed into one byte per tile, so that the
+    A* inner loop is reduced to bit tests. Like the game itself, diagonal steps cost
+    the same as orthogonal ones, and are only allowed if both orthogonal steps that
+    make them up are also allowed.
+    """
+
+    BLOCKED = 1
+    WALL_N = 2
+    WALL_E = 4
+    WALL_S = 8
+    WALL_W = 16
+
+    # The (dx, dy) of each move, indexed by its bit in `moves`. Note that north is +y.
+    DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, -1), (-1, 1))
+
+    def __init__(self, flags: np.ndarray, origin: Tuple[int, int] = (0, 0)) -> None:
+        """Initialize a `CollisionMap`.
+
+        Args:
+            flags (np.ndarray): A 2D array of tile flags, with shape (height, width).
+            origin (Tuple[int, int], optional): The world (x, y) of `flags[0, 0]`.
+                Defaults to (0, 0).
+        """
+        self.flags = np.asarray(flags, dtype=np.uint8)
+        self.origin = Point(int(origin[0]), int(origin[1]))
+        self.moves = self._compute_moves()
+        # Indexing `bytes` is much faster than indexing an array from pure Python.
+        self._moves_flat = self.moves.tobytes()
+
+    @classmethod
+    def load(cls, path: Path = COLLISION_MAP_PATH) -> "CollisionMap":
+        """Load a collision map saved with `save`.
+
+        Args:
+            path (Path, optional): The `.npz` file. Defaults to `COLLISION_MAP_PATH`.
+
+        Returns:
+            CollisionMap: The loaded map.
+        """
+        with np.load(path) as data:
+            return cls(data["flags"], tuple(data["origin"]))
+
+    def save(self, path: Path = COLLISION_MAP_PATH) -> None:
+        """Save the collision map as a compressed `.npz` archive.
+
+        Args:
+            path (Path, optional): The `.npz` file. Defaults to `COLLISION_MAP_PATH`.
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, flags=self.flags, origin=np.array(self.origin))
+
+    def _compute_moves(self) -> np.ndarray:
+        """Compute which of the 8 moves out of every tile are allowed.
+
+        Returns:
+            np.ndarray: A uint8 array shaped like `flags`, where bit `i` of each tile
+                is set if the move `DIRECTIONS[i]` out of it is allowed.
+        """
+        flags = self.flags
+        walkable = (flags & self.BLOCKED) == 0
+
+        def shifted(a: np.ndarray, dx: int, dy: int) -> np.ndarray:
+            """Get `a` at each tile's neighbor (dx, dy), or False past the edge."""
+            out = np.zeros_like(a)
+            h, w = a.shape
+            out[max(-dy, 0) : h - max(dy, 0), max(-dx, 0) : w - max(dx, 0)] = a[
+                max(dy, 0) : h - max(-dy, 0), max(dx, 0) : w - max(-dx, 0)
+            ]
+            return out
+
+        def clear(wall: int) -> np.ndarray:
+            return (flags & wall) == 0
+
+        # Each orthogonal move needs a walkable target and no wall on either side of
+        # the shared edge.
+        north = walkable & clear(self.WALL_N)
+        north &= shifted(walkable & clear(self.WALL_S), 0, 1)
+        east = walkable & clear(self.WALL_E)
+        east &= shifted(walkable & clear(self.WALL_W), 1, 0)
+        south = walkable & clear(self.WALL_S)
+        south &= shifted(walkable & clear(self.WALL_N), 0, -1)
+        west = walkable & clear(self.WALL_W)
+        west &= shifted(walkable & clear(self.WALL_E), -1, 0)
+
+        # Each diagonal move needs both orthogonal paths around its corner.
+        def diagonal(a, b, a_then_b, b_then_a, dx, dy):
+            first = shifted(a_then_b, *self.DIRECTIONS[a])
+            second = shifted(b_then_a, *self.DIRECTIONS[b])
+            return orth[a] & orth[b] & first & second & shifted(walkable, dx, dy)
+
+        orth = (north, east, south, west)
+        moves = [
+            north,
+            east,
+            south,
+            west,
+            diagonal(0, 1, east, north, 1, 1),
+            diagonal(2, 1, east, south, 1, -1),
+            diagonal(2, 3, west, south, -1, -1),
+            diagonal(0, 3, west, north, -1, 1),
+        ]
+        packed = np.zeros(flags.shape, dtype=np.uint8)
+        for bit, allowed in enumerate(moves):
+            packed |= allowed.astype(np.uint8) << bit
+        return packed
+
+    def contains(self, p: Point) -> bool:
+        """Determine whether a world tile lies within the map.
+
+        Args:
+            p (Point): The world tile.
+
+        Returns:
+            bool: True if the tile is on the map, False otherwise.
+        """
+        h, w = self.flags.shape
+        return 0 <= p.x - self.origin.x < w and 0 <= p.y - self.origin.y < h
+
+    def is_walkable(self, p: Point) -> bool:
+        """Determine whether a world tile can be stood on.
+
+        Args:
+            p (Point): The world tile.
+
+        Returns:
+            bool: True if the tile is on the map and not blocked, False otherwise.
+        """
+        if not self.contains(p):
+            return False
+        return not self.flags[p.y - self.origin.y, p.x - self.origin.x] & self.BLOCKED
+
+    def find_path(
+        self,
+        p1: Point,
+        p2: Point,
+        max_expansions: int = 2_000_000,
+        penalties: Optional[Dict[Edge, float]] = None,
+    ) -> List[Point]:
+        """Find a shortest path between two world tiles with A*.
+
+        Since every step costs at least one tile regardless of direction, the
+        Chebyshev distance is used as the (admissible) heuristic.
+
+        Args:
+            p1 (Point): The start of the path.
+            p2 (Point): The destination of the path.
+            max_expansions (int, optional): The maximum number of tiles to expand
+                before giving up. Defaults to 2,000,000.
+            penalties (Optional[Dict[Edge, float]], optional): Extra costs, in tiles,
+                of specific moves between adjacent world tiles (e.g. those found
+                blocked in-game; see `ObstacleOverlay`). Defaults to None.
+
+        Returns:
+            List[Point]: Every tile along the path from `p1` to `p2` inclusive, or an
+                empty list if either tile is unwalkable or no path was found.
+        """
+        if not (self.is_walkable(p1) and self.is_walkable(p2)):
+            return []
+        w = self.flags.shape[1]
+        x0, y0 = self.origin
+        start = (p1.y - y0) * w + (p1.x - x0)
+        goal = (p2.y - y0) * w + (p2.x - x0)
+        gx, gy = p2.x - x0, p2.y - y0
+        moves = self._moves_flat
+        offsets = [dy * w + dx for dx, dy in self.DIRECTIONS]
+        bits = range(len(offsets))
+        # Key the penalties by flat tile indices, like everything in the inner loop.
+        edge_costs = {
+            ((ay - y0) * w + (ax - x0), (by - y0) * w + (bx - x0)): cost
+            for ((ax, ay), (bx, by)), cost in (penalties or {}).items()
+            if self.contains(Point(ax, ay)) and self.contains(Point(bx, by))
+        }
+
+        g_score = {start: 0}
+        parent = {start: start}
+        # Ties in f are broken toward the deepest entry (i.e. the most negative -g),
+        # which avoids expanding every equally-short path on open ground.
+        frontier = [(max(abs(p1.x - p2.x), abs(p1.y - p2.y)), 0, start)]
+        expansions = 0
+        while frontier:
+            _, neg_g, cur = heapq.heappop(frontier)
+            g = -neg_g
+            if cur == goal:
+                break
+            if g > g_score[cur]:
+                continue  # A stale entry, superseded by a shorter path.
+            expansions += 1
+            if expansions > max_expansions:
+                return []
+            allowed = moves[cur]
+            for bit in bits:
+                if not allowed >> bit & 1:
+                    continue
+                nxt = cur + offsets[bit]
+                new_g = g + 1
+                if edge_costs:
+                    new_g += edge_costs.get((cur, nxt), 0)
+                if new_g < g_score.get(nxt, new_g + 1):
+                    g_score[nxt] = new_g
+                    parent[nxt] = cur
+                    ny, nx = divmod(nxt, w)
+                    h = max(abs(nx - gx), abs(ny - gy))
+                    heapq.heappush(frontier, (new_g + h, -new_g, nxt))
+        else:
+            return []
+
+        path = [goal]
+        while path[-1] != start:
+            path.append(parent[path[-1]])
+        return [Point(i % w + x0, i // w + y0) for i in reversed(path)]
+
+
+_collision_maps: Dict[int, CollisionMap] = {}
+_collision_map_lock = threading.Lock()
+
+
+def get_collision_map(plane: int = 0) -> Optional[CollisionMap]:
+    """Get the process-wide `CollisionMap` of a plane, loading it on first use.
+
+    Args:
+        plane (int, optional): The plane. Defaults to 0.
+
+    Returns:
+        Optional[CollisionMap]: The map at `collision_map_path(plane)`, or None if
+            there is no map on disk.
+    """
+    with _collision_map_lock:
+        path = collision_map_path(plane)
+        if plane not in _collision_maps and path.exists():
+            _collision_maps[plane] = CollisionMap.load(path)
+        return _collision_maps.get(plane)
+
+
+_session: Optional[requests.Session] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_http_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Get the process-wide HTTP session shared by every pathfinding request.
+
+    Reusing one session keeps connections to each host alive between requests, so
+    only the first request to a host pays for the TCP and TLS handshakes.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _session
+    with _http_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the persistent thread pool that remote pathfinding requests are raced on.
+
+    Returns:
+        ThreadPoolExecutor: The shared pool.
+    """
+    global _executor
+    with _http_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(4, thread_name_prefix="pathfinder")
+        return _executor
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Determine whether a failed request is worth retrying.
+
+    Args:
+        exc (BaseException): The exception the request raised.
+
+    Returns:
+        bool: True for connection errors, timeouts, rate limiting, and server errors,
+            False otherwise (e.g. for a malformed request).
+    """
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return False
 
 
 class Pathfinder:
+    # The endpoints of the remote pathfinding services. These are class attributes so
+    # they can be pointed elsewhere (e.g. at a local stub server).
+    DAX_URL = "https://explv-map.siisiqf.workers.dev/"
+    OSRSPF_URL = "https://osrspathfinder.com/find-path"
+    # The (connect, read) timeouts of each request, in seconds.
+    TIMEOUT = (3.05, 10)
+    # How many times a request is attempted, with exponential backoff between
+    # attempts starting from `BACKOFF` seconds.
+    MAX_ATTEMPTS = 4
+    BACKOFF = 0.25
+
     def __init__(self) -> None:
         """Initialize a `Pathfinder` and don't do anything else."""
         pass
 
-    @retry(stop=stop_after_attempt(5), wait=wait_fixed(1))
+    @staticmethod
     def make_api_call(
         url: str,
         headers: Dict[str, str],
         data: Dict[str, Any],
+        cancel: Optional[threading.Event] = None,
     ) -> Dict[str, Any]:
         """Make an API POST request to a pathfinding service.
 
+        Requests go through the shared keep-alive session (see `get_http_session`)
+        with a timeout. Transient failures (see `_is_transient`) are retried with
+        exponential backoff, while other failures are raised immediately.
+
         Args:
             url (str): URL of the API endpoint we are hitting.
             headers (Dict[str, str]): Additional HTTP metadata for the API call.
             data (Dict[str, Any]): The JSON payload to ship with the API call.
+            cancel (Optional[threading.Event], optional): If set (e.g. because another
+                host already answered), no further attempts are made. Defaults to
+                None.
 
         Returns:
             Dict[str, Any]: JSON response dictionary.
         """
-        response = requests.post(url, headers=headers, data=json.dumps(data))
-        response.raise_for_status()
-        return response.json()
+        stop = stop_after_attempt(Pathfinder.MAX_ATTEMPTS)
+        if cancel is not None:
+            stop = stop | stop_when_event_set(cancel)
+        retrying = Retrying(
+            stop=stop,
+            wait=wait_exponential(multiplier=Pathfinder.BACKOFF, max=2),
+            retry=retry_if_exception(_is_transient),
+            reraise=True,
+        )
+        session = get_http_session()
+        for attempt in retrying:
+            with attempt:
+                response = session.post(
+                    url, headers=headers, json=data, timeout=Pathfinder.TIMEOUT
+                )
+                response.raise_for_status()
+                return response.json()
 
     @staticmethod
-    def get_path_osrspf(p1: Point, p2: Point) -> List[Point]:
-        """Retrieve a shortest `WalkPath` between `p1` and `p2` from OSRSpathfinder.
+    def _find_leg(p1: Point, p2: Point, plane: int = 0) -> List[Point]:
+        """Compute a shortest path between two tiles on a plane with A*.
+
+        Moves found blocked in-game are penalized so that paths avoid them where
+        possible (see `ObstacleOverlay`). These are only recorded on plane 0.
 
         Args:
             p1 (Point): The start of the path to be calculated.
             p2 (Point): The destination point of the path to be calculated.
+            plane (int, optional): The plane both points lie on. Defaults to 0.
+
+        Returns:
+            List[Point]: Every tile along the path, or an empty list if the plane has
+                no collision map or no path was found.
+        """
+        if (collision_map := get_collision_map(plane)) is None:
+            path = collision_map_path(plane)
+            print(f"No collision map found at {path}. See shortest_path_data.py.")
+            return []
+        penalties = get_obstacle_overlay().penalties() if plane == 0 else None
+        return collision_map.find_path(p1, p2, penalties=penalties)
+
+    @staticmethod
+    def get_path_local(p1: Point, p2: Point) -> List[Point]:
+        """Compute a shortest path between `p1` and `p2` in-process with A*.
+
+        Unlike the remote services, this involves no network round trips, so routes
+        are computed in well under a second. It requires a collision map of the plane
+        at `collision_map_path` (see `CollisionMap`). Moves found blocked in-game are
+        penalized so that routes avoid them where possible (see `ObstacleOverlay`).
+
+        Note that only a single plane is searched. For routes that may use stairs,
+        ladders, and the like, see `get_route_local`.
+
+        Args:
+            p1 (Point): The start of the path to be calculated. If it is a
+                `WorldPoint`, the path is searched on its plane, otherwise on plane 0.
+            p2 (Point): The destination point of the path to be calculated.
+
+        Returns:
+            List[Point]: Every tile along the path, or an empty list if there is no
+                collision map or no path was found.
+        """
+        return Pathfinder._find_leg(p1, p2, getattr(p1, "plane", 0))
+
+    @staticmethod
+    def get_route_local(p1: WorldPoint, p2: WorldPoint) -> List[Leg]:
+        """Compute a shortest route between two world points in-process, across planes.
+
+        Walking legs are found with A* over each plane's collision map, and joined by
+        the transitions (e.g. stairs, ladders, and dungeon entrances) listed at
+        `TRANSITIONS_PATH` (see `find_route`). A trip into a dungeon or up to another
+        floor is therefore planned end to end, as a single route.
+
+        Args:
+            p1 (WorldPoint): The start of the route to be calculated.
+            p2 (WorldPoint): The destination point of the route to be calculated.
+
+        Returns:
+            List[Leg]: The legs of the route, each walked on a single plane and ending
+                with the transition onto the next, or an empty list if no route was
+                found.
+        """
+        p1, p2 = WorldPoint(*p1), WorldPoint(*p2)
+        return find_route(p1, p2, Pathfinder._find_leg, get_transitions())
+
+    @staticmethod
+    def get_path_osrspf(
+        p1: Point, p2: Point, cancel: Optional[threading.Event] = None
+    ) -> List[WorldPoint]:
+        """Retrieve a shortest `WalkPath` between `p1` and `p2` from OSRSpathfinder.
+
+        Args:
+            p1 (Point): The start of the path to be calculated, on plane 0 unless it
+                is a `WorldPoint`.
+            p2 (Point): The destination point of the path to be calculated, on plane 0
+                unless it is a `WorldPoint`.
+            cancel (Optional[threading.Event], optional): Stops retrying once set.
+                Defaults to None.
 
         Returns:
-            List[Point]: `WalkPath` object scraped from the JSON response from the
-                OSRSpathfinder service.
+            List[WorldPoint]: `WalkPath` object scraped from the JSON response from the
+                OSRSpathfinder service. Its steps may cross planes (see `split_legs`).
         """
-        url = "https://osrspathfinder.com/find-path"
+        url = Pathfinder.OSRSPF_URL
         headers = {
             "Content-Type": "application/json",
         }
+        z1, z2 = getattr(p1, "plane", 0), getattr(p2, "plane", 0)
         payload = {
             "algo": "A_STAR",
-            "start": {"plane": 0, "x": p1.x, "y": p1.y},
-            "end": {"plane": 0, "x": p2.x, "y": p2.y},
+            "start": {"plane": z1, "x": p1.x, "y": p1.y},
+            "end": {"plane": z2, "x": p2.x, "y": p2.y},
         }
         try:
-            response = Pathfinder.make_api_call(url, headers, payload)
+            response = Pathfinder.make_api_call(url, headers, payload, cancel)
             if path_raw := response["result"]["steps"][0]["path"]:
-                return [Point(step["x"], step["y"]) for step in path_raw]
+                return [
+                    WorldPoint(step["x"], step["y"], step.get("plane", z1))
+                    for step in path_raw
+                ]
         except requests.exceptions.HTTPError as exc:  # Handle non-200 statuses.
             print(f"HTTP error: {exc}")
         except Exception as exc:
@@ -64,7 +510,9 @@ class Pathfinder:
         return []
 
     @staticmethod
-    def get_path_dax(p1: Point, p2: Point) -> List[Point]:
+    def get_path_dax(
+        p1: Point, p2: Point, cancel: Optional[threading.Event] = None
+    ) -> List[WorldPoint]:
         """Retrieve a `WalkPath` object representing the shortest path to a destination.
 
         Note that the DAX service provides human-readable error snippets. They are
@@ -82,28 +530,84 @@ class Pathfinder:
             }
 
         Args:
-            p1 (Point): The start of the path to be calculated.
-            p2 (Point): The destination point of the path to be calculated.
+            p1 (Point): The start of the path to be calculated, on plane 0 unless it
+                is a `WorldPoint`.
+            p2 (Point): The destination point of the path to be calculated, on plane 0
+                unless it is a `WorldPoint`.
+            cancel (Optional[threading.Event], optional): Stops retrying once set.
+                Defaults to None.
 
         Returns:
-            List[Point]: `WalkPath` object scraped from the JSON response from the
-                DAX pathfinding service.
+            List[WorldPoint]: `WalkPath` object scraped from the JSON response from the
+                DAX pathfinding service. Its steps may cross planes (see `split_legs`).
         """
-        url = "https://explv-map.siisiqf.workers.dev/"
+        url = Pathfinder.DAX_URL
         headers = {
             "Content-Type": "application/json",
             "Origin": "https://explv.github.io",
         }
+        z1, z2 = getattr(p1, "plane", 0), getattr(p2, "plane", 0)
         payload = {
-            "start": {"x": p1.x, "y": p1.y, "z": 0},
-            "end": {"x": p2.x, "y": p2.y, "z": 0},
+            "start": {"x": p1.x, "y": p1.y, "z": z1},
+            "end": {"x": p2.x, "y": p2.y, "z": z2},
             "player": {"members": True},
         }
         try:
-            if path_raw := Pathfinder.make_api_call(url, headers, payload)["path"]:
-                return [Point(step["x"], step["y"]) for step in path_raw]
+            response = Pathfinder.make_api_call(url, headers, payload, cancel)
+            if path_raw := response["path"]:
+                return [
+                    WorldPoint(step["x"], step["y"], step.get("z", z1))
+                    for step in path_raw
+                ]
         except requests.exceptions.HTTPError as exc:  # Handle non-200 statuses.
             print(f"HTTP error: {exc}")
         except Exception as exc:
             print(f"An unexpected error occurred: {exc}")
         return []
+
+    @staticmethod
+    def get_path_remote(
+        p1: Point,
+        p2: Point,
+        hosts: Optional[Sequence[Callable[..., List[Point]]]] = None,
+        timeout: Optional[float] = 30,
+    ) -> List[Point]:
+        """Race the remote pathfinding services, returning the first valid path.
+
+        Every host is asked at once on a persistent thread pool. As soon as one
+        returns a path, the others are cancelled: requests that haven't started are
+        dropped, and those in flight make no further retries. The latency of a path
+        fetch is therefore that of the fastest host that can answer.
+
+        Args:
+            p1 (Point): The start of the path to be calculated.
+            p2 (Point): The destination point of the path to be calculated.
+            hosts (Optional[Sequence[Callable[..., List[Point]]]], optional): The
+                host getters to race. Defaults to None, meaning DAX and
+                OSRSpathfinder.
+            timeout (Optional[float], optional): The maximum number of seconds to
+                wait for any path. Defaults to 30.
+
+        Returns:
+            List[Point]: The first path found, or an empty list if no host found one
+                in time.
+        """
+        hosts = hosts or (Pathfinder.get_path_dax, Pathfinder.get_path_osrspf)
+        cancel = threading.Event()
+        executor = _get_executor()
+        pending = {executor.submit(host, p1, p2, cancel) for host in hosts}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                done, pending = wait(pending, remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    break  # Timed out.
+                for future in done:
+                    if not future.exception() and (path := future.result()):
+                        return path
+            return []
+        finally:
+            cancel.set()
+            for future in pending:
+                future.cancel()
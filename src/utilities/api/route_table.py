@@ -0,0 +1,271 @@
+import argparse
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if __name__ == "__main__":
+    import sys
+
+    # Go up two levels to facilitate importing from `utilities` below.
+    sys.path[0] = str(Path(sys.path[0]).parents[1])
+
+from utilities.api.pathfinder import Pathfinder
+from utilities.geometry import Point
+from utilities.mappings import locations as loc
+
+ROUTE_TABLE_PATH = Path(__file__).parents[2] / "data" / "route_table.npz"
+
+
+def named_locations() -> Dict[str, Point]:
+    """Get every named destination in `utilities.mappings.locations`.
+
+    Returns:
+        Dict[str, Point]: Each single-tile location (e.g. "GRAND_EXCHANGE") by name,
+            leaving out the hard-coded paths.
+    """
+    return {
+        name: Point(*value)
+        for name, value in vars(loc).items()
+        if name.isupper()
+        and isinstance(value, tuple)
+        and len(value) == 2
+        and all(isinstance(v, int) for v in value)
+    }
+
+
+class RouteTable:
+    """Precomputed paths between named locations, stored in a compact binary file.
+
+    Crossing the map is the slowest thing to pathfind, yet bots only ever cross it
+    between a handful of fixed destinations. A `RouteTable` holds paths between pairs
+    of the locations in `utilities.mappings.locations`, built once, offline (see
+    `build_route_table`), so that walking to a named destination only needs a short
+    live leg onto the nearest precomputed path.
+
+    On disk, a table is a compressed `.npz` archive holding:
+        - `names`: The location names.
+        - `pairs`: The (source, destination) name indices of each route, shape (R, 2).
+        - `offsets`: Where each route starts in `steps`, shape (R + 1,).
+        - `steps`: Every route's tiles, concatenated, as int16 (x, y) pairs.
+
+    Paths are walkable in either direction, so each pair of locations is stored once.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        pairs: np.ndarray,
+        offsets: np.ndarray,
+        steps: np.ndarray,
+    ) -> None:
+        """Initialize a `RouteTable`.
+
+        Args:
+            names (Sequence[str]): The location names.
+            pairs (np.ndarray): The (source, destination) name indices of each route.
+            offsets (np.ndarray): Where each route starts in `steps`, plus the total.
+            steps (np.ndarray): Every route's (x, y) tiles, concatenated.
+        """
+        self.names = [str(name) for name in names]
+        self.pairs = np.asarray(pairs, dtype=np.int16).reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.steps = np.asarray(steps, dtype=np.int16).reshape(-1, 2)
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def from_routes(cls, routes: Dict[Tuple[str, str], List[Point]]) -> "RouteTable":
+        """Pack paths keyed by their (source, destination) names into a table.
+
+        Args:
+            routes (Dict[Tuple[str, str], List[Point]]): The paths.
+
+        Returns:
+            RouteTable: The packed table.
+        """
+        names = sorted({name for pair in routes for name in pair})
+        index = {name: i for i, name in enumerate(names)}
+        pairs = [(index[a], index[b]) for a, b in routes]
+        lengths = [len(path) for path in routes.values()]
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        steps = [tuple(p[:2]) for path in routes.values() for p in path]
+        return cls(names, pairs, offsets, np.array(steps).reshape(-1, 2))
+
+    @classmethod
+    def load(cls, path: Path = ROUTE_TABLE_PATH) -> "RouteTable":
+        """Load a route table saved with `save`.
+
+        Args:
+            path (Path, optional): The `.npz` file. Defaults to `ROUTE_TABLE_PATH`.
+
+        Returns:
+            RouteTable: The loaded table.
+        """
+        with np.load(path) as data:
+            return cls(data["names"], data["pairs"], data["offsets"], data["steps"])
+
+    def save(self, path: Path = ROUTE_TABLE_PATH) -> None:
+        """Save the route table as a compressed `.npz` archive.
+
+        Args:
+            path (Path, optional): The `.npz` file. Defaults to `ROUTE_TABLE_PATH`.
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            names=np.array(self.names),
+            pairs=self.pairs,
+            offsets=self.offsets,
+            steps=self.steps,
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def _steps(self, i: int, reverse: bool = False) -> np.ndarray:
+        """Get the tiles of a route.
+
+        Args:
+            i (int): The route's index.
+            reverse (bool, optional): Whether to walk it backward. Defaults to False.
+
+        Returns:
+            np.ndarray: The route's (x, y) tiles, shape (N, 2).
+        """
+        steps = self.steps[self.offsets[i] : self.offsets[i + 1]]
+        return steps[::-1] if reverse else steps
+
+    def route(self, source: str, dest: str) -> List[Point]:
+        """Get the precomputed path between two named locations.
+
+        Args:
+            source (str): The name of the starting location.
+            dest (str): The name of the destination.
+
+        Returns:
+            List[Point]: The path from `source` to `dest`, or an empty list if the pair
+                isn't in the table.
+        """
+        if source not in self or dest not in self:
+            return []
+        a, b = self._index[source], self._index[dest]
+        for i, (src, dst) in enumerate(self.pairs.tolist()):
+            if (src, dst) in ((a, b), (b, a)):
+                steps = self._steps(i, reverse=src != a)
+                return [Point(int(x), int(y)) for x, y in steps]
+        return []
+
+    def route_to(self, dest: str, start: Point) -> List[Point]:
+        """Get the remainder of the precomputed path to a destination nearest a tile.
+
+        Every route to (or from) `dest` is considered, each oriented to end at `dest`,
+        and the one passing closest to `start` is cut at that closest tile.
+
+        Args:
+            dest (str): The name of the destination.
+            start (Point): The tile to start from (e.g. our position).
+
+        Returns:
+            List[Point]: The path from the closest tile to `start` onward to `dest`, or
+                an empty list if no route leads to `dest`.
+        """
+        if dest not in self:
+            return []
+        d = self._index[dest]
+        best: Optional[Tuple[int, np.ndarray, int]] = None  # (distance, steps, index)
+        for i, (src, dst) in enumerate(self.pairs.tolist()):
+            if d not in (src, dst):
+                continue
+            steps = self._steps(i, reverse=src == d)
+            # Chebyshev distance, since diagonal steps cost the same as others.
+            dists = np.abs(steps.astype(np.int32) - (start.x, start.y)).max(axis=1)
+            # Among equally-close tiles, cut at the one nearest the destination.
+            j = len(dists) - 1 - int(dists[::-1].argmin())
+            if best is None or dists[j] < best[0]:
+                best = (int(dists[j]), steps, j)
+        if best is None:
+            return []
+        _, steps, j = best
+        return [Point(int(x), int(y)) for x, y in steps[j:]]
+
+
+def build_route_table(
+    names: Optional[Sequence[str]] = None,
+    hubs: Optional[Sequence[str]] = None,
+    pathfinder: Callable[[Point, Point], List[Point]] = Pathfinder.get_path_local,
+) -> RouteTable:
+    """Compute the paths between named locations and pack them into a table.
+
+    Args:
+        names (Optional[Sequence[str]], optional): The locations to connect. Defaults
+            to None, meaning every location in `named_locations`.
+        hubs (Optional[Sequence[str]], optional): If given, only routes between each
+            hub and every other location are computed (hub-and-spoke), rather than
+            between every pair. Defaults to None.
+        pathfinder (Callable[[Point, Point], List[Point]], optional): The pathfinder
+            to compute routes with. Defaults to `Pathfinder.get_path_local`.
+
+    Returns:
+        RouteTable: The table of every route found. Pairs without a path (e.g. into a
+            dungeon) are left out.
+    """
+    locations = named_locations()
+    names = list(names or locations)
+    if hubs:
+        pairs = {
+            tuple(sorted((hub, name))) for hub in hubs for name in names if name != hub
+        }
+    else:
+        pairs = {(a, b) for i, a in enumerate(names) for b in names[i + 1 :]}
+    routes = {}
+    for a, b in sorted(pairs):
+        if path := pathfinder(locations[a], locations[b]):
+            routes[(a, b)] = path
+        else:
+            print(f"No path found between {a} and {b}.")
+    return RouteTable.from_routes(routes)
+
+
+_route_table: Optional[RouteTable] = None
+_route_table_lock = threading.Lock()
+
+
+def get_route_table() -> Optional[RouteTable]:
+    """Get the process-wide `RouteTable`, loading it from disk on first use.
+
+    Returns:
+        Optional[RouteTable]: The table at `ROUTE_TABLE_PATH`, or None if there is no
+            table on disk.
+    """
+    global _route_table
+    with _route_table_lock:
+        if _route_table is None and ROUTE_TABLE_PATH.exists():
+            _route_table = RouteTable.load()
+        return _route_table
+
+
+if __name__ == "__main__":
+    """Run this file directly to (re)build the route table, e.g.:
+    python src/utilities/api/route_table.py --hubs GRAND_EXCHANGE VARROCK_SQUARE
+    """
+    parser = argparse.ArgumentParser(description="Build the named-location routes.")
+    parser.add_argument("--names", nargs="*", default=None)
+    parser.add_argument("--hubs", nargs="*", default=None)
+    hosts = ["local", "remote", "dax", "osrspf"]
+    parser.add_argument("--host", choices=hosts, default="local")
+    parser.add_argument("--output", type=Path, default=ROUTE_TABLE_PATH)
+    args = parser.parse_args()
+
+    pathfinders = {
+        "local": Pathfinder.get_path_local,
+        "remote": Pathfinder.get_path_remote,
+        "dax": Pathfinder.get_path_dax,
+        "osrspf": Pathfinder.get_path_osrspf,
+    }
+    table = build_route_table(args.names, args.hubs, pathfinders[args.host])
+    table.save(args.output)
+    print(f"Saved {len(table)} routes between {len(table.names)} locations.")
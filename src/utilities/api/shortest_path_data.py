@@ -0,0 +1,198 @@
+import argparse
+import json
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+if __name__ == "__main__":
+    import sys
+
+    # Go up two levels to facilitate importing from `utilities` below.
+    sys.path[0] = str(Path(sys.path[0]).parents[1])
+
+from utilities.api.pathfinder import CollisionMap, collision_map_path
+from utilities.api.transitions import TRANSITIONS_PATH
+
+# The side length of a map region, in tiles, and the number of planes in the game.
+REGION_SIZE = 64
+PLANES = 4
+# Transports with any of these requirements are left out, since bots can't tell
+# whether they're met.
+REQUIREMENT_COLUMNS = ("Skills", "Items", "Quests", "Varbits", "VarPlayers")
+
+
+def read_regions(zip_path: Path) -> Dict[Tuple[int, int], np.ndarray]:
+    """Read the per-region movement flags of the shortest-path plugin's map.
+
+    The RuneLite shortest-path plugin (github.com/Skretzo/shortest-path) ships its
+    collision data as "collision-map.zip", holding one file per 64x64 map region,
+    named "{region_x}_{region_y}". Each file is a Java `BitSet` in little-endian byte
+    order, with 2 flags per tile: whether the tile can be left northward, and whether
+    it can be left eastward. Bit `((plane * 64 + y) * 64 + x) * 2 + flag` describes
+    local tile (x, y) of the region, and trailing planes with no set bits are cut
+    off.
+
+    Args:
+        zip_path (Path): The "collision-map.zip" file.
+
+    Returns:
+        Dict[Tuple[int, int], np.ndarray]: A bool array shaped (4, 64, 64, 2), indexed
+            by [plane, y, x, flag], for each (region_x, region_y).
+    """
+    size = PLANES * REGION_SIZE * REGION_SIZE * 2
+    regions = {}
+    with zipfile.ZipFile(zip_path) as archive:
+        for name in archive.namelist():
+            region_x, region_y = map(int, Path(name).name.split("_"))
+            data = np.frombuffer(archive.read(name), dtype=np.uint8)
+            bits = np.unpackbits(data, bitorder="little")[:size].astype(bool)
+            bits = np.pad(bits, (0, size - bits.size))
+            regions[(region_x, region_y)] = bits.reshape(
+                PLANES, REGION_SIZE, REGION_SIZE, 2
+            )
+    return regions
+
+
+def build_collision_map(
+    regions: Dict[Tuple[int, int], np.ndarray], plane: int
+) -> CollisionMap:
+    """Build the `CollisionMap` of a plane from the shortest-path plugin's regions.
+
+    The map covers the bounding box of every region with data on the plane, and any
+    tile outside of those regions is blocked. The plugin's "can leave northward" and
+    "can leave eastward" flags become walls: a tile gets a wall along each edge it
+    can't be left across, where leaving southward (or westward) is the same as the
+    southern (or western) neighbor leaving northward (or eastward). A tile that can't
+    be left at all is `BLOCKED`.
+
+    Args:
+        regions (Dict[Tuple[int, int], np.ndarray]): The regions from `read_regions`.
+        plane (int): The plane to build the map of.
+
+    Raises:
+        ValueError: If no region has data on `plane`.
+
+    Returns:
+        CollisionMap: The plane's collision map.
+    """
+    on_plane = {
+        key: flags[plane] for key, flags in regions.items() if flags[plane].any()
+    }
+    if not on_plane:
+        raise ValueError(f"No region has collision data on plane {plane}.")
+    xs, ys = zip(*on_plane)
+    x0, y0 = min(xs), min(ys)
+    shape = ((max(ys) - y0 + 1) * REGION_SIZE, (max(xs) - x0 + 1) * REGION_SIZE)
+    north, east = np.zeros(shape, dtype=bool), np.zeros(shape, dtype=bool)
+    for (region_x, region_y), flags in on_plane.items():
+        row = (region_y - y0) * REGION_SIZE
+        col = (region_x - x0) * REGION_SIZE
+        north[row : row + REGION_SIZE, col : col + REGION_SIZE] = flags[..., 0]
+        east[row : row + REGION_SIZE, col : col + REGION_SIZE] = flags[..., 1]
+    south, west = np.zeros_like(north), np.zeros_like(east)
+    south[1:] = north[:-1]
+    west[:, 1:] = east[:, :-1]
+
+    flags = np.zeros(shape, dtype=np.uint8)
+    flags[~(north | east | south | west)] |= CollisionMap.BLOCKED
+    for allowed, wall in (
+        (north, CollisionMap.WALL_N),
+        (east, CollisionMap.WALL_E),
+        (south, CollisionMap.WALL_S),
+        (west, CollisionMap.WALL_W),
+    ):
+        flags[~allowed] |= wall
+    return CollisionMap(flags, (x0 * REGION_SIZE, y0 * REGION_SIZE))
+
+
+def _parse_tile(text: str) -> List[int]:
+    """Parse a tile written as "x y plane".
+
+    Args:
+        text (str): The tile.
+
+    Returns:
+        List[int]: The [x, y, plane] of the tile, or an empty list if `text` isn't one.
+    """
+    values = text.split()
+    if len(values) != 3 or not all(v.lstrip("-").isdigit() for v in values):
+        return []
+    return [int(v) for v in values]
+
+
+def read_transports(tsv_paths: Sequence[Path]) -> List[dict]:
+    """Read the shortest-path plugin's transports as entries of `transitions.json`.
+
+    The plugin lists transports (e.g. "transports.tsv" and "agility_shortcuts.tsv")
+    as tab-separated values under a header line starting with "#". Columns are found
+    by their header, so both the layout with separate "menuOption", "menuTarget", and
+    "objectID" columns and the older one with a combined column are read. Transports
+    without a fixed origin (e.g. teleports) or with requirements (see
+    `REQUIREMENT_COLUMNS`) are left out. A transport's "Duration", in game ticks, is
+    used as its cost, since about a tile is walked per tick.
+
+    Args:
+        tsv_paths (Sequence[Path]): The transport files.
+
+    Returns:
+        List[dict]: The transitions, in the format of `load_transitions`.
+    """
+    entries = []
+    for tsv_path in tsv_paths:
+        header: List[str] = []
+        for line in Path(tsv_path).read_text(encoding="utf-8").splitlines():
+            if line.startswith("#"):
+                if not header and "Origin" in line:
+                    header = [col.strip() for col in line.lstrip("# ").split("\t")]
+                continue
+            if not header or not line.strip():
+                continue
+            row = dict(zip(header, (value.strip() for value in line.split("\t"))))
+            source = _parse_tile(row.get("Origin", ""))
+            dest = _parse_tile(row.get("Destination", ""))
+            if not source or not dest or any(row.get(c) for c in REQUIREMENT_COLUMNS):
+                continue
+            if "menuOption" in row:
+                action, name = row["menuOption"], row.get("menuTarget", "")
+            else:
+                words = row.get("menuOption menuTarget objectID", "").split()
+                action, name = " ".join(words[:1]), " ".join(words[1:-1])
+            entry = {"source": source, "dest": dest, "name": name, "action": action}
+            if row.get("Duration", "").isdigit():
+                entry["cost"] = int(row["Duration"])
+            entries.append(entry)
+    return entries
+
+
+if __name__ == "__main__":
+    """Run this file directly to import the pathfinding data, e.g.:
+    python src/utilities/api/shortest_path_data.py --collision-map collision-map.zip
+        --transports transports.tsv agility_shortcuts.tsv
+    with the files found under "src/main/resources" in the shortest-path plugin's
+    repository. The route table (see `route_table.py`) can be rebuilt afterward.
+    """
+    parser = argparse.ArgumentParser(description="Import the pathfinding data.")
+    parser.add_argument("--collision-map", type=Path, default=None)
+    parser.add_argument("--planes", type=int, nargs="*", default=list(range(PLANES)))
+    parser.add_argument("--transports", type=Path, nargs="*", default=[])
+    args = parser.parse_args()
+
+    if args.collision_map is not None:
+        regions = read_regions(args.collision_map)
+        for plane in args.planes:
+            try:
+                collision_map = build_collision_map(regions, plane)
+            except ValueError as e:
+                print(e)
+                continue
+            collision_map.save(collision_map_path(plane))
+            height, width = collision_map.flags.shape
+            print(f"Saved the {width}x{height} tile map of plane {plane}.")
+    if args.transports:
+        entries = read_transports(args.transports)
+        TRANSITIONS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(TRANSITIONS_PATH, "w") as file:
+            json.dump(entries, file, indent=2)
+        print(f"Saved {len(entries)} transitions.")
@@ -0,0 +1,243 @@
+import heapq
+import itertools
+import json
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from utilities.geometry import Point, WorldPoint
+
+TRANSITIONS_PATH = Path(__file__).parents[2] / "data" / "transitions.json"
+
+# Finds a walking path between two tiles on a given plane, or an empty list.
+LegFinder = Callable[[Point, Point, int], List[Point]]
+
+
+class Transition(NamedTuple):
+    """A way to move between two tiles other than by walking (e.g. a ladder).
+
+    Attributes:
+        source (WorldPoint): The tile to stand on to use the transition.
+        dest (WorldPoint): The tile our character ends up on.
+        name (str): What is used (e.g. "Ladder" or "Staircase"), for logging and for
+            the bot to recognize it by.
+        action (str): The menu option that uses it (e.g. "Climb-down").
+        cost (int): How many tiles of walking using it is worth, including any
+            animation. Defaults to 2.
+    """
+
+    source: WorldPoint
+    dest: WorldPoint
+    name: str = ""
+    action: str = ""
+    cost: int = 2
+
+
+class Leg(NamedTuple):
+    """One part of a route, walked on a single plane.
+
+    Attributes:
+        plane (int): The plane the leg is walked on.
+        path (List[Point]): Every tile along the leg.
+        transition (Optional[Transition]): The transition used at the end of the leg
+            to get onto the next one, or None if this is the last leg.
+    """
+
+    plane: int
+    path: List[Point]
+    transition: Optional[Transition]
+
+
+def _chebyshev(a: Tuple[int, ...], b: Tuple[int, ...]) -> int:
+    """Get the number of tiles between two tiles, ignoring their planes.
+
+    Args:
+        a (Tuple[int, ...]): The first tile, as (x, y[, plane]).
+        b (Tuple[int, ...]): The second tile, as (x, y[, plane]).
+
+    Returns:
+        int: The Chebyshev distance between `a` and `b`.
+    """
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+
+def load_transitions(path: Path = TRANSITIONS_PATH) -> List[Transition]:
+    """Load a list of transitions from a JSON file.
+
+    The file holds a list of objects, each shaped like:
+        {
+            "source": [3200, 3200, 0],
+            "dest": [3200, 9600, 0],
+            "name": "Staircase",
+            "action": "Climb-down",
+            "cost": 3
+        }
+    where "source" and "dest" are (x, y, plane) world points, and every other key is
+    optional (see `Transition`).
+
+    Args:
+        path (Path, optional): The JSON file. Defaults to `TRANSITIONS_PATH`.
+
+    Returns:
+        List[Transition]: The transitions, or an empty list if the file is missing.
+    """
+    try:
+        with open(path, "r") as file:
+            entries = json.load(file)
+    except FileNotFoundError:
+        return []
+    return [
+        Transition(
+            WorldPoint(*entry["source"]),
+            WorldPoint(*entry["dest"]),
+            entry.get("name", ""),
+            entry.get("action", ""),
+            entry.get("cost", 2),
+        )
+        for entry in entries
+    ]
+
+
+def find_route(
+    p1: WorldPoint,
+    p2: WorldPoint,
+    find_leg: LegFinder,
+    transitions: Sequence[Transition] = (),
+) -> List[Leg]:
+    """Find a shortest route between two world points, possibly across planes.
+
+    The route is planned over a small graph whose nodes are the start, the far side of
+    each transition, and the destination. Getting from one node to the next means
+    walking to a transition's source on the same plane and using it (or walking to the
+    destination). The search is Dijkstra's algorithm with lazily-evaluated edges: each
+    walking leg is first queued at its Chebyshev distance, a lower bound on its length,
+    and only pathfound (with `find_leg`) once that bound reaches the front of the
+    queue. Legs that can't possibly lie on the shortest route are never pathfound, so
+    a route across several floors costs little more than the legs it's made of.
+
+    Args:
+        p1 (WorldPoint): The start of the route.
+        p2 (WorldPoint): The destination of the route.
+        find_leg (LegFinder): Finds a walking path between two tiles on a plane, e.g.
+            by A* over that plane's collision map.
+        transitions (Sequence[Transition], optional): The known transitions. Defaults
+            to none, meaning the route can only be a single leg.
+
+    Returns:
+        List[Leg]: The legs of the route, in order, or an empty list if there is no
+            route.
+    """
+    start, goal = -1, len(transitions)
+
+    def position(node: int) -> WorldPoint:
+        """Get where our character stands upon reaching a node."""
+        return p1 if node == start else transitions[node].dest
+
+    def target(node: int) -> WorldPoint:
+        """Get the tile walked to in order to reach a node."""
+        return p2 if node == goal else transitions[node].source
+
+    def extra(node: int) -> int:
+        """Get the cost of reaching a node beyond walking to `target(node)`."""
+        return 0 if node == goal else transitions[node].cost
+
+    # Queue entries are (cost, tiebreak, node, previous node, path), where a path of
+    # None means the cost is only a lower bound, because the leg isn't pathfound yet.
+    tiebreak = itertools.count()
+    frontier = [(0, next(tiebreak), start, start, [])]
+    dist: Dict[int, int] = {}
+    parent: Dict[int, Tuple[int, List[Point]]] = {}
+    while frontier:
+        cost, _, node, prev, path = heapq.heappop(frontier)
+        if node in dist:
+            continue
+        if path is None:
+            a, b = position(prev), target(node)
+            if path := find_leg(Point(a.x, a.y), Point(b.x, b.y), a.plane):
+                cost = dist[prev] + len(path) - 1 + extra(node)
+                heapq.heappush(frontier, (cost, next(tiebreak), node, prev, path))
+            continue
+        dist[node], parent[node] = cost, (prev, path)
+        if node == goal:
+            break
+        here = position(node)
+        for nxt in range(goal + 1):
+            there = target(nxt)
+            if nxt not in dist and there.plane == here.plane:
+                bound = cost + _chebyshev(here, there) + extra(nxt)
+                heapq.heappush(frontier, (bound, next(tiebreak), nxt, node, None))
+    else:
+        return []
+
+    legs = []
+    node = goal
+    while node != start:
+        prev, path = parent[node]
+        transition = None if node == goal else transitions[node]
+        legs.append(Leg(position(prev).plane, path, transition))
+        node = prev
+    return legs[::-1]
+
+
+def split_legs(
+    steps: Sequence[Tuple[int, ...]],
+    transitions: Sequence[Transition] = (),
+    max_gap: int = 16,
+) -> List[Leg]:
+    """Split a path that may cross planes (e.g. from a remote pathfinder) into legs.
+
+    A transition is assumed wherever consecutive steps change plane or lie more than
+    `max_gap` tiles apart (e.g. a ladder into a dungeon, whose tiles lie far north of
+    the surface on plane 0). Each is matched to the closest known transition, and if
+    none fits, an unnamed one is made up from the two steps.
+
+    Args:
+        steps (Sequence[Tuple[int, ...]]): The path, as (x, y[, plane]) world points.
+        transitions (Sequence[Transition], optional): The known transitions. Defaults
+            to none.
+        max_gap (int, optional): The most tiles apart two consecutive steps on the
+            same plane may be for walking between them. Defaults to 16.
+
+    Returns:
+        List[Leg]: The legs of the path, in order, or an empty list if it is empty.
+    """
+    steps = [WorldPoint(*step) for step in steps]
+    legs = []
+    begin = 0
+    for i in range(1, len(steps) + 1):
+        if i < len(steps):
+            a, b = steps[i - 1], steps[i]
+            if a.plane == b.plane and _chebyshev(a, b) <= max_gap:
+                continue
+        path = [Point(step.x, step.y) for step in steps[begin:i]]
+        transition = None
+        if i < len(steps):
+            fits = [
+                (_chebyshev(t.source, a) + _chebyshev(t.dest, b), t)
+                for t in transitions
+                if t.source.plane == a.plane and t.dest.plane == b.plane
+            ]
+            offset, transition = min(fits, default=(None, None), key=lambda f: f[0])
+            if offset is None or offset > 4:
+                transition = Transition(a, b)
+        legs.append(Leg(steps[begin].plane, path, transition))
+        begin = i
+    return legs
+
+
+_transitions: Optional[List[Transition]] = None
+_transitions_lock = threading.Lock()
+
+
+def get_transitions() -> List[Transition]:
+    """Get the process-wide list of transitions, loading it from disk on first use.
+
+    Returns:
+        List[Transition]: The transitions at `TRANSITIONS_PATH`, or an empty list if
+            there are none on disk.
+    """
+    global _transitions
+    with _transitions_lock:
+        if _transitions is None:
+            _transitions = load_transitions()
+        return _transitions
@@ -0,0 +1,452 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import cv2
+import numpy as np
+
+if __name__ == "__main__":
+    import sys
+
+    # Go up one level to facilitate importing from `utilities` and `model` below.
+    sys.path[0] = str(Path(sys.path[0]).parents[0])
+
+import utilities.ocr as ocr
+from model.recorded_window import RecordedWindow
+from utilities.color_util import ColorPalette, isolate_colors, isolate_contours
+from utilities.compass import get_compass_engine
+from utilities.extract_contours import extract_contours
+from utilities.img_search import BOT_IMAGES, PATH_IMG, search_img_in_rect
+
+SNAPSHOTS = PATH_IMG / "screen_regions" / "fixed_classic" / "snapshot"
+CLIENT_VIEW = PATH_IMG / "explanatory" / "ui_templates" / "full-interface.png"
+RESULTS_DIR = Path(__file__).parents[2] / "benchmarks"
+
+
+class BenchmarkCheckError(Exception):
+    """Exception raised when a benchmarked function doesn't return what it should."""
+
+
+class Benchmark(NamedTuple):
+    """A named function to time, optionally served captures by a recorded window.
+
+    While a benchmark with a `window` is timed, every `Rectangle.screenshot` is served
+    from the window's recorded image (see `model.recorded_window.RecordedWindow`).
+
+    If a benchmark has a `check`, the function's result is passed to it before timing,
+    and the benchmark fails rather than being timed if it returns False. A function
+    that fails on its fixture (e.g. a search that finds nothing) usually takes an
+    early exit, so its time says little about the work done when it succeeds.
+    """
+
+    name: str
+    fn: Callable[[], object]
+    window: Optional[RecordedWindow] = None
+    check: Optional[Callable[[object], bool]] = None
+
+
+def _load_snapshot(name: str) -> np.ndarray:
+    """Load a region snapshot written by `RuneLiteWindow._snapshot_all_window_regions`.
+
+    Snapshots are saved with `matplotlib.pyplot.imsave`, which writes BGR captures as
+    if they were RGB, so the channels are swapped back to recover the original BGR.
+
+    Args:
+        name (str): The snapshot's path relative to `SNAPSHOTS`.
+
+    Raises:
+        FileNotFoundError: If the snapshot could not be read.
+
+    Returns:
+        np.ndarray: The BGR region capture.
+    """
+    img = cv2.imread(str(SNAPSHOTS / name), cv2.IMREAD_COLOR)
+    if img is None:
+        raise FileNotFoundError(f"Missing benchmark fixture: {SNAPSHOTS / name}")
+    return cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+
+
+def _paste(background: np.ndarray, template: Path) -> np.ndarray:
+    """Paste the opaque pixels of a template onto the center of a BGR capture.
+
+    Args:
+        background (np.ndarray): The BGR capture, which is left unmodified.
+        template (Path): The path to a BGRA template (e.g. an item icon).
+
+    Returns:
+        np.ndarray: A copy of the capture with the template pasted onto it.
+    """
+    img = background.copy()
+    icon = cv2.imread(str(template), cv2.IMREAD_UNCHANGED)
+    height, width = icon.shape[:2]
+    top = (img.shape[0] - height) // 2
+    left = (img.shape[1] - width) // 2
+    area = img[top : top + height, left : left + width]
+    opaque = icon[:, :, 3] > 0
+    area[opaque] = icon[:, :, :3][opaque]
+    return img
+
+
+def _check(bench: Benchmark) -> None:
+    """Make sure a benchmark's function returns what it should before it's timed.
+
+    Args:
+        bench (Benchmark): The benchmark.
+
+    Raises:
+        BenchmarkCheckError: If the benchmark's `check` rejects the result.
+    """
+    if bench.check is not None and not bench.check(result := bench.fn()):
+        raise BenchmarkCheckError(f"Unexpected result: {repr(result)[:60]}")
+
+
+def _time(fn: Callable[[], object], repeat: int, warmup: int) -> Dict[str, float]:
+    """Time repeated calls of a function.
+
+    Args:
+        fn (Callable[[], object]): The function to time.
+        repeat (int): How many timed calls to make.
+        warmup (int): How many untimed calls to make first (e.g. to fill caches).
+
+    Returns:
+        Dict[str, float]: The number of calls and the mean, median, standard
+            deviation, minimum, and maximum call time, in milliseconds.
+    """
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "n": repeat,
+        "mean_ms": statistics.fmean(times),
+        "median_ms": statistics.median(times),
+        "stdev_ms": statistics.stdev(times) if repeat > 1 else 0.0,
+        "min_ms": min(times),
+        "max_ms": max(times),
+    }
+
+
+def _ocr_benchmarks(cp: ColorPalette) -> List[Benchmark]:
+    """Build the OCR benchmarks: `scrape_text` per font, and `find_textbox`.
+
+    Args:
+        cp (ColorPalette): The color palette.
+
+    Returns:
+        List[Benchmark]: The benchmarks.
+    """
+    white = [cp.bgr.OFF_WHITE_TEXT, cp.bgr.OFF_CYAN_TEXT]
+    chat_colors = [cp.bgr.BLACK, cp.bgr.BLUE]
+    # Each font is scraped from the region it is most commonly read from, along with
+    # text the scrape must contain. No fixture holds quill text, so the quill fonts
+    # time a scan of the chat that finds nothing, and their results aren't checked.
+    cases = {
+        "plain_11": ("hp_orb_text.png", [cp.bgr.ORB_TEXT_100_90], "44"),
+        "plain_12": ("chat.png", chat_colors, "Welcome"),
+        "bold_12": ("mouseover.png", white, "Magic"),
+        "quill": ("chat.png", chat_colors, None),
+        "quill_8": ("chat.png", chat_colors, None),
+    }
+    benchmarks = []
+    for font_name, (fixture, colors, expected) in cases.items():
+        win = RecordedWindow(_load_snapshot(fixture))
+        rect, font = win.rectangle(), getattr(ocr, font_name.upper())
+
+        def scrape(rect=rect, font=font, colors=colors):
+            return ocr.scrape_text(rect, font, colors)
+
+        def check(text, expected=expected):
+            return expected in text
+
+        benchmarks.append(
+            Benchmark(
+                f"ocr.scrape_text[{font_name}]",
+                scrape,
+                win,
+                check if expected is not None else None,
+            )
+        )
+
+    chat = RecordedWindow(_load_snapshot("chat.png"))
+    words = ["Welcome", "Old", "RuneScape"]
+
+    def find_textbox():
+        return ocr.find_textbox(words, chat.rectangle(), ocr.PLAIN_12, chat_colors)
+
+    benchmarks.append(Benchmark("ocr.find_textbox[plain_12]", find_textbox, chat, bool))
+    return benchmarks
+
+
+def _img_search_benchmarks(client: np.ndarray) -> List[Benchmark]:
+    """Build the template matching benchmarks at inventory-slot and client sizes.
+
+    Args:
+        client (np.ndarray): A BGR capture of the full client window.
+
+    Returns:
+        List[Benchmark]: The benchmarks.
+    """
+    logs = BOT_IMAGES / "power_chopper" / "logs.png"
+    # The slot snapshot is empty, so the logs are pasted into it to be found.
+    empty_slot = _load_snapshot("inventory_slots/inventory_slots_0.png")
+    slot = RecordedWindow(_paste(empty_slot, logs))
+    full = RecordedWindow(client)
+    minimap = BOT_IMAGES / "ui_templates" / "minimap-fixed-classic.png"
+    return [
+        Benchmark(
+            "img_search.search_img_in_rect[slot]",
+            lambda: search_img_in_rect(logs, slot.rectangle()),
+            slot,
+            bool,
+        ),
+        Benchmark(
+            "img_search.search_img_in_rect[client]",
+            lambda: search_img_in_rect(minimap, full.rectangle()),
+            full,
+            bool,
+        ),
+    ]
+
+
+def _color_benchmarks(cp: ColorPalette) -> List[Benchmark]:
+    """Build the color isolation and contour extraction benchmarks.
+
+    Args:
+        cp (ColorPalette): The color palette.
+
+    Returns:
+        List[Benchmark]: The benchmarks.
+    """
+    game_view = _load_snapshot("game_view.png")
+    chat = _load_snapshot("chat.png")
+    # The cyan text in the game view is made up of many small contours.
+    mask = isolate_contours(game_view, cp.hsv.OFF_CYAN_TEXT)
+    return [
+        Benchmark(
+            "color_util.isolate_colors[chat]",
+            lambda: isolate_colors(chat, [cp.bgr.BLACK, cp.bgr.BLUE]),
+            check=np.any,
+        ),
+        Benchmark(
+            "color_util.isolate_contours[game_view]",
+            lambda: isolate_contours(game_view, cp.hsv.OFF_CYAN_TEXT),
+            check=np.any,
+        ),
+        Benchmark(
+            "extract_contours.extract_contours[game_view]",
+            lambda: extract_contours(mask),
+            check=bool,
+        ),
+    ]
+
+
+def _compass_benchmarks() -> List[Benchmark]:
+    """Build the compass angle benchmark (the work done by `get_compass_angle`).
+
+    Returns:
+        List[Benchmark]: The benchmarks.
+    """
+    compass = _load_snapshot("compass_orb.png")
+    engine = get_compass_engine("fixed_classic")
+    return [Benchmark("compass.get_compass_angle", lambda: engine.angle(compass))]
+
+
+def _window_benchmarks(client: np.ndarray) -> List[Benchmark]:
+    """Build the window initialization benchmark.
+
+    Args:
+        client (np.ndarray): A BGR capture of the full client window.
+
+    Returns:
+        List[Benchmark]: The benchmarks.
+    """
+    win = RecordedWindow(client)
+    return [Benchmark("runelite_window.initialize", win.initialize, win, lambda ok: ok)]
+
+
+def collect_benchmarks(client_path: Path = CLIENT_VIEW) -> List[Benchmark]:
+    """Build every benchmark over the fixtures bundled in `src/img`.
+
+    Args:
+        client_path (Path, optional): A standard (RGB) PNG of the full client window,
+            in the fixed classic layout, used to benchmark full-client template
+            matching and window initialization. Defaults to `CLIENT_VIEW`.
+
+    Raises:
+        FileNotFoundError: If a fixture could not be read.
+
+    Returns:
+        List[Benchmark]: The benchmarks.
+    """
+    cp = ColorPalette()
+    client = cv2.imread(str(client_path), cv2.IMREAD_COLOR)
+    if client is None:
+        raise FileNotFoundError(f"Missing benchmark fixture: {client_path}")
+    return (
+        _ocr_benchmarks(cp)
+        + _img_search_benchmarks(client)
+        + _color_benchmarks(cp)
+        + _compass_benchmarks()
+        + _window_benchmarks(client)
+    )
+
+
+def _git_commit() -> Optional[str]:
+    """Get the current git commit hash, if the source tree is a git checkout.
+
+    Returns:
+        Optional[str]: The commit hash, or None if it couldn't be determined.
+    """
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        )
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark],
+    repeat: int = 20,
+    warmup: int = 2,
+    name_filter: str = "",
+) -> Dict[str, object]:
+    """Time a set of benchmarks.
+
+    A benchmark that raises, or whose result fails its check, is recorded with its
+    error rather than stopping the run.
+
+    Args:
+        benchmarks (List[Benchmark]): The benchmarks to run.
+        repeat (int, optional): How many timed calls to make per benchmark. Defaults
+            to 20.
+        warmup (int, optional): How many untimed calls to make first. Defaults to 2.
+        name_filter (str, optional): Only run benchmarks whose name contains this
+            substring. Defaults to "", running everything.
+
+    Returns:
+        Dict[str, object]: The results, with run metadata under "meta" and each
+            benchmark's timings (see `_time`) under "results", keyed by name.
+    """
+    results = {}
+    for bench in benchmarks:
+        if name_filter not in bench.name:
+            continue
+        try:
+            if bench.window is not None:
+                with bench.window:
+                    _check(bench)
+                    results[bench.name] = _time(bench.fn, repeat, warmup)
+            else:
+                _check(bench)
+                results[bench.name] = _time(bench.fn, repeat, warmup)
+        except Exception as exc:
+            results[bench.name] = {"error": f"{type(exc).__name__}: {exc}"}
+        print(f"{bench.name:<48} {_describe(results[bench.name])}")
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+            "repeat": repeat,
+            "warmup": warmup,
+        },
+        "results": results,
+    }
+
+
+def _describe(result: Dict[str, object]) -> str:
+    """Summarize one benchmark's result for the console.
+
+    Args:
+        result (Dict[str, object]): The benchmark's timings or error.
+
+    Returns:
+        str: The median and minimum time, or the error.
+    """
+    if "error" in result:
+        return f"ERROR {result['error']}"
+    return f"median {result['median_ms']:9.3f} ms   min {result['min_ms']:9.3f} ms"
+
+
+def compare_results(
+    baseline: Dict[str, object], current: Dict[str, object], threshold: float = 0.1
+) -> List[str]:
+    """Find the benchmarks that got slower between two runs.
+
+    Args:
+        baseline (Dict[str, object]): The results of an earlier run.
+        current (Dict[str, object]): The results of this run.
+        threshold (float, optional): The relative increase in median time above which
+            a benchmark counts as regressed. Defaults to 0.1 (i.e. 10% slower).
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name, {})
+        if "median_ms" not in result or "median_ms" not in before:
+            continue
+        ratio = result["median_ms"] / max(before["median_ms"], 1e-9)
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {before['median_ms']:.3f} ms -> {result['median_ms']:.3f} ms"
+                f" ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+if __name__ == "__main__":
+    """Run this file directly to benchmark the computer vision hot paths.
+
+    No game client (or even a display) is needed, since every capture is served from
+    fixtures. Results are written as JSON so that runs can be compared across commits,
+    e.g.:
+        python src/utilities/benchmark.py --output before.json
+        (check out another commit)
+        python src/utilities/benchmark.py --output after.json --compare before.json
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the vision pipeline.")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--filter", default="", help="Only run matching benchmarks.")
+    parser.add_argument("--client", type=Path, default=CLIENT_VIEW)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    benchmarks = collect_benchmarks(args.client)
+    report = run_benchmarks(benchmarks, args.repeat, args.warmup, args.filter)
+    output = args.output
+    if output is None:
+        commit = (report["meta"]["commit"] or "unknown")[:10]
+        output = RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+    failed = any("error" in result for result in report["results"].values())
+    regressions = []
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare_results(baseline, report, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+    sys.exit(1 if failed or regressions else 0)
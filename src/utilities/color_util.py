@@ -11,6 +11,8 @@ if __name__ == "__main__":
     # Go up a level to facilitate importing from `utilities`.
     sys.path[0] = os.path.dirname(sys.path[0])
 
+from utilities.frame import Frame
+
 ColorTuple = Union[
     Tuple[Tuple[int, int, int], Tuple[int, int, int]], Tuple[int, int, int]
 ]
@@ -286,7 +288,9 @@ def isolate_colors(image: cv2.Mat, colors: Union[Color, List[Color]]) -> cv2.Mat
     return mask
 
 
-def isolate_contours(image: cv2.Mat, color: Union[Color, List[Color]]) -> np.array:
+def isolate_contours(
+    image: Union[cv2.Mat, Frame], color: Union[Color, List[Color]]
+) -> np.array:
     """Threshold a BGR image to isolate HSV-colored regions as filled-in contours.
 
     HSV color space is often preferred over BGR for finding contours in an image
@@ -294,8 +298,13 @@ def isolate_contours(image: cv2.Mat, color: Union[Color, List[Color]]) -> np.arr
     separation makes it more robust to changes in lighting conditions, which can affect
     the appearance of objects in an image.
 
+    If a `Frame` is provided, its cached HSV and grayscale conversions (and any
+    identical color mask) are reused rather than recomputed, which matters when several
+    detectors inspect the same capture in the same tick.
+
     Args:
-        image (cv2.Mat):  BGR matrix image to threshold to `color`.
+        image (Union[cv2.Mat, Frame]): BGR matrix image (or a `Frame` wrapping one) to
+            threshold to `color`.
         color (Union[Color, List[Color]]): One or several HSV `Color` objects to
             isolate.
 
@@ -304,15 +313,13 @@ def isolate_contours(image: cv2.Mat, color: Union[Color, List[Color]]) -> np.arr
             `color`-colored objects) completely filled-in with white, and black
             everywhere else. Remember that a thresholded image has no color format.
     """
-    # Convert from BGR  (returned by `Rect.screenshot`) to HSV color space.
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+    # Wrap the BGR image (returned by `Rect.screenshot`) to memoize conversions.
+    frame = image if isinstance(image, Frame) else Frame(image)
     # Create a mask with pixels within range as white and all others as black.
-    mask = cv2.inRange(image, color.lo, color.hi)
-    # Apply the `mask` to keep only colored pixels in `image` that correspond to white
-    # pixels in `mask` (i.e. get the masked region, but with colored pixels).
-    result = cv2.bitwise_and(image, image, mask=mask)
-    result = cv2.cvtColor(result, cv2.COLOR_HSV2BGR)
-    result = cv2.cvtColor(result, cv2.COLOR_BGR2GRAY)  # Convert result to grayscale.
+    mask = frame.mask(color)
+    # Apply the `mask` to keep only the grayscale intensity of pixels in `image` that
+    # correspond to white pixels in `mask` (i.e. get the masked region in grayscale).
+    result = cv2.bitwise_and(frame.gray, frame.gray, mask=mask)
     # Threshold the result: pixel strength < 50 to black (0), >= 50 to white (255).
     _, result = cv2.threshold(result, 50, 255, cv2.THRESH_BINARY)
     # Find external contours, which are outlines or curves that represent the
@@ -0,0 +1,201 @@
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional
+
+PoolMode = Literal["thread", "process"]
+
+
+class WorkerPool:
+    """A persistent, shared pool of workers for CPU-bound computer vision.
+
+    Creating a `ThreadPoolExecutor` for every call (as the compass search used to do)
+    puts thread spin-up and tear-down on the per-frame path. A `WorkerPool` is created
+    once and kept for the life of the bot runtime, so workers are reused across calls.
+
+    Two modes are supported:
+        - "thread" (default): Best for OpenCV and NumPy work, which releases the GIL
+            for most heavy operations (e.g. `cv2.matchTemplate`), so threads run truly
+            in parallel without the cost of copying images between processes.
+        - "process": Best for pure-Python work that holds the GIL. Submitted callables
+            and their arguments must be picklable (i.e. module-level functions).
+
+    The pool also keeps simple counters so that its load can be monitored. See
+    `metrics`.
+
+    Example:
+        pool = get_worker_pool()
+        futures = [pool.submit(cv2.matchTemplate, img, t, cv2.TM_CCOEFF_NORMED)
+                   for t in templates]
+        correlations = [f.result() for f in futures]
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, mode: PoolMode = "thread"
+    ) -> None:
+        """Initialize a `WorkerPool`.
+
+        Args:
+            max_workers (Optional[int], optional): The maximum number of workers.
+                Defaults to None, meaning the number of CPUs (at least 2).
+            mode (PoolMode, optional): Either "thread" or "process". Defaults to
+                "thread".
+
+        Raises:
+            ValueError: If `mode` is not "thread" or "process".
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown worker pool mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers or max(os.cpu_count() or 1, 2)
+        executor_cls = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+        kwargs = {"thread_name_prefix": "vision"} if mode == "thread" else {}
+        self._executor: Executor = executor_cls(max_workers=self.max_workers, **kwargs)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Schedule a callable to run on the pool.
+
+        Args:
+            fn (Callable): The function to run. In "process" mode, it must be
+                picklable.
+            *args: Positional arguments for `fn`.
+            **kwargs: Keyword arguments for `fn`.
+
+        Returns:
+            Future: A future holding the eventual result of `fn(*args, **kwargs)`.
+        """
+        with self._lock:
+            self.submitted += 1
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def map(self, fn: Callable, *iterables: Iterable) -> List[Any]:
+        """Run a callable over several iterables on the pool and wait for the results.
+
+        Args:
+            fn (Callable): The function to run. In "process" mode, it must be
+                picklable.
+            *iterables (Iterable): Iterables of arguments, zipped together as with the
+                built-in `map`.
+
+        Returns:
+            List[Any]: The results, in the same order as the inputs.
+        """
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+        return [future.result() for future in futures]
+
+    def _on_done(self, future: Future) -> None:
+        """Update the counters once a submitted callable finishes.
+
+        Args:
+            future (Future): The finished future.
+        """
+        with self._lock:
+            self.completed += 1
+            if not future.cancelled() and future.exception() is not None:
+                self.failed += 1
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of submitted callables that have not finished yet.
+
+        Returns:
+            int: The number of queued plus running callables.
+        """
+        return self.submitted - self.completed
+
+    @property
+    def queue_depth(self) -> int:
+        """Get the number of submitted callables still waiting for a free worker.
+
+        Returns:
+            int: The number of queued (not yet running) callables.
+        """
+        return max(self.in_flight - self.max_workers, 0)
+
+    @property
+    def utilization(self) -> float:
+        """Get the fraction of workers that are currently busy.
+
+        Returns:
+            float: A value from 0 (idle) to 1 (every worker busy).
+        """
+        return min(self.in_flight, self.max_workers) / self.max_workers
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get a snapshot of the pool's load.
+
+        Returns:
+            Dict[str, Any]: The mode, worker count, queue depth, utilization, and
+                lifetime submitted/completed/failed counts.
+        """
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "queue_depth": self.queue_depth,
+                "utilization": self.utilization,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and release the workers.
+
+        Args:
+            wait (bool, optional): Whether to wait for pending callables to finish.
+                Defaults to True.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+
+_pool: Optional[WorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    """Get the process-wide `WorkerPool`, creating a default thread pool if needed.
+
+    Returns:
+        WorkerPool: The shared pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WorkerPool()
+        return _pool
+
+
+def configure_worker_pool(
+    max_workers: Optional[int] = None, mode: PoolMode = "thread"
+) -> WorkerPool:
+    """Replace the process-wide `WorkerPool` with a newly-configured one.
+
+    The previous pool (if any) is shut down after its pending work finishes.
+
+    Args:
+        max_workers (Optional[int], optional): The maximum number of workers. Defaults
+            to None, meaning the number of CPUs (at least 2).
+        mode (PoolMode, optional): Either "thread" or "process". Defaults to "thread".
+
+    Returns:
+        WorkerPool: The new shared pool.
+    """
+    global _pool
+    with _pool_lock:
+        old, _pool = _pool, WorkerPool(max_workers, mode)
+    if old is not None:
+        old.shutdown(wait=True)
+    return _pool
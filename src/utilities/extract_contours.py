@@ -44,15 +44,23 @@ def extract_contours(image: cv2.Mat) -> List[RuneLiteObject]:
     objs: List[RuneLiteObject] = []
 
     for contour in contours:
+        x, y, width, height = cv2.boundingRect(contour)  # Bounding rectangle coords.
         # Create a mask from the contour and find all points within the contour area.
-        # Note that mask is made up of (y, x) coordinates because it feels more natural
-        # to reference pixels in a rectangle via a row-column lookup style.
+        # The mask only spans the contour's bounding rectangle (rather than the entire
+        # image), so the contour is shifted into the mask and the points found within
+        # it are shifted back out. Note that the mask is made up of (y, x) coordinates
+        # because it feels more natural to reference pixels in a rectangle via a
+        # row-column lookup style.
         mask = cv2.drawContours(
-            np.zeros_like(image), [contour], -1, 255, thickness=cv2.FILLED
+            np.zeros((height, width), dtype=np.uint8),
+            [contour],
+            -1,
+            255,
+            thickness=cv2.FILLED,
+            offset=(-x, -y),
         )
         # Find all points within the contour area (including the boundary).
-        domain = np.column_stack(np.where(mask == 255))  # These are (y, x) coordinates!
-        x, y, width, height = cv2.boundingRect(contour)  # Bounding rectangle coords.
+        domain = np.argwhere(mask == 255) + (y, x)  # These are (y, x) coordinates!
         area = width * height
 
         # If the area of the bounding rectangle is less that 125 x 125 pixels, consider
@@ -70,28 +78,62 @@ def extract_contours(image: cv2.Mat) -> List[RuneLiteObject]:
                 )
             )
         # If the area is large, divide it into 50 x 50 chunks to analyze separately.
-        elif area > 125 * 125:
-            chunk_width, chunk_height = 50, 50
-            for i in range(0, height, chunk_height):
-                for j in range(0, width, chunk_width):
-                    sub_image = image[
-                        y + i : y + i + chunk_height, x + j : x + j + chunk_width
-                    ]
-                    if cv2.countNonZero(sub_image) > 0:  # Check for white pixels.
-                        x_offset, y_offset = x + j, y + i
-                        sub_width, sub_height = (
-                            min(chunk_width, width - j),
-                            min(chunk_height, height - i),
-                        )
-                        objs.append(
-                            RuneLiteObject(
-                                xmin=x_offset,
-                                xmax=x_offset + sub_width,
-                                ymin=y_offset,
-                                ymax=y_offset + sub_height,
-                                width=sub_width,
-                                height=sub_height,
-                                domain=domain,  # Domain remains unchanged!
-                            )
-                        )
+        else:
+            objs.extend(_chunk_large_object(image, x, y, width, height, domain))
     return objs
+
+
+def _chunk_large_object(
+    image: cv2.Mat,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    domain: np.ndarray,
+    chunk_size: int = 50,
+) -> List[RuneLiteObject]:
+    """Split a large object into square chunks, keeping only the non-empty chunks.
+
+    Rather than looping over each chunk in Python, the cropped binary mask is padded to
+    a whole number of chunks and reshaped into a (rows, chunk, cols, chunk) block view,
+    which is reduced with a single `any` call to find which chunks contain white
+    pixels. The bounds of all non-empty chunks are then computed in one operation.
+
+    Args:
+        image (cv2.Mat): The binary mask that the large object was found in.
+        x (int): The leftmost x-coordinate of the object's bounding rectangle.
+        y (int): The topmost y-coordinate of the object's bounding rectangle.
+        width (int): The width of the object's bounding rectangle.
+        height (int): The height of the object's bounding rectangle.
+        domain (np.ndarray): The (y, x) points inside the object outline, shared by
+            every chunk.
+        chunk_size (int, optional): The side length of each chunk in pixels. Defaults
+            to 50.
+
+    Returns:
+        List[RuneLiteObject]: One `RuneLiteObject` per non-empty chunk, ordered
+            row-by-row from the top-left chunk.
+    """
+    rows, cols = -(-height // chunk_size), -(-width // chunk_size)  # Ceiling division.
+    padded = np.zeros((rows * chunk_size, cols * chunk_size), dtype=bool)
+    padded[:height, :width] = image[y : y + height, x : x + width] != 0
+    occupied = padded.reshape(rows, chunk_size, cols, chunk_size).any(axis=(1, 3))
+    i, j = np.nonzero(occupied)  # Row-major order, like a nested row-column loop.
+    xmins = x + j * chunk_size
+    ymins = y + i * chunk_size
+    widths = np.minimum(chunk_size, width - j * chunk_size)
+    heights = np.minimum(chunk_size, height - i * chunk_size)
+    return [
+        RuneLiteObject(
+            xmin=xmin,
+            xmax=xmin + w,
+            ymin=ymin,
+            ymax=ymin + h,
+            width=w,
+            height=h,
+            domain=domain,  # Domain remains unchanged!
+        )
+        for xmin, ymin, w, h in zip(
+            xmins.tolist(), ymins.tolist(), widths.tolist(), heights.tolist()
+        )
+    ]
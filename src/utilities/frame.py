@@ -0,0 +1,142 @@
+import time
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+if TYPE_CHECKING:
+    from utilities.color_util import Color
+
+
+class Frame:
+    """Wrap a single BGR capture and memoize the representations derived from it.
+
+    Detectors routinely convert the same screenshot into the same color spaces: for
+    example, `isolate_contours`, `RuneLiteBot.friends_nearby`, and
+    `RuneLiteBot.has_hp_bar` each used to call `cv2.cvtColor(img, cv2.COLOR_BGR2HSV)`
+    on their own copy of the game view. A `Frame` performs each conversion (HSV,
+    grayscale, and per-color binary masks) at most once, the first time it is asked
+    for, and hands the cached result to every later consumer.
+
+    Derived arrays are shared between consumers, so treat them as read-only. Copy an
+    array first if it needs to be drawn on or modified in place.
+
+    Example:
+        frame = self.win.game_view.capture()
+        objs = extract_contours(isolate_contours(frame, self.cp.hsv.CYAN_MARK))
+        friends = frame.mask(self.cp.hsv.GREEN)  # Reuses the HSV conversion above.
+    """
+
+    def __init__(self, bgr: np.ndarray, timestamp: Optional[float] = None) -> None:
+        """Initialize a `Frame`.
+
+        Args:
+            bgr (np.ndarray): The OpenCV-style BGR image (e.g. as returned by
+                `Rectangle.screenshot`).
+            timestamp (Optional[float], optional): The `time.perf_counter` value of
+                the capture. Defaults to None, meaning now.
+        """
+        self.bgr = bgr
+        self.timestamp = time.perf_counter() if timestamp is None else timestamp
+        self._hsv: Optional[np.ndarray] = None
+        self._gray: Optional[np.ndarray] = None
+        self._masks: Dict[tuple, np.ndarray] = {}
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Get the shape of the underlying BGR image.
+
+        Returns:
+            Tuple[int, ...]: The (rows, cols, channels) shape of `self.bgr`.
+        """
+        return self.bgr.shape
+
+    @property
+    def age(self) -> float:
+        """Get the number of seconds since this `Frame` was captured.
+
+        Returns:
+            float: The age of this `Frame` in seconds.
+        """
+        return time.perf_counter() - self.timestamp
+
+    @property
+    def hsv(self) -> np.ndarray:
+        """Get the OpenCV-style HSV representation, converting on first access.
+
+        Returns:
+            np.ndarray: The HSV image.
+        """
+        if self._hsv is None:
+            self._hsv = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2HSV)
+        return self._hsv
+
+    @property
+    def gray(self) -> np.ndarray:
+        """Get the grayscale representation, converting on first access.
+
+        Returns:
+            np.ndarray: The single-channel grayscale image.
+        """
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2GRAY)
+        return self._gray
+
+    def mask(
+        self,
+        colors: Union["Color", List["Color"]],
+        space: Literal["hsv", "bgr"] = "hsv",
+    ) -> np.ndarray:
+        """Get a binary mask of the pixels within any of several color ranges.
+
+        Masks are memoized by color space and color bounds, so asking twice for the
+        same colors (even through different `Color` instances) thresholds only once.
+        Thresholding behaves exactly like `isolate_colors`.
+
+        Args:
+            colors (Union[Color, List[Color]]): A `Color` or list of `Color` objects to
+                isolate, in the format given by `space`.
+            space (Literal["hsv", "bgr"], optional): The color space to threshold in.
+                Defaults to "hsv".
+
+        Returns:
+            np.ndarray: The binary mask, with pixels within range as white (255) and
+                all others as black (0).
+        """
+        from utilities.color_util import isolate_colors
+
+        if not isinstance(colors, list):
+            colors = [colors]
+        key = (space,) + tuple(
+            (tuple(np.ravel(c.lo).tolist()), tuple(np.ravel(c.hi).tolist()))
+            for c in colors
+        )
+        if key not in self._masks:
+            image = self.hsv if space == "hsv" else self.bgr
+            self._masks[key] = isolate_colors(image, colors)
+        return self._masks[key]
+
+    def crop(self, left: int, top: int, width: int, height: int) -> "Frame":
+        """Get a sub-region of this `Frame` without recapturing or reconverting.
+
+        Any representation already computed for this `Frame` is sliced (not copied)
+        into the cropped `Frame`, so cropping after conversion is free.
+
+        Args:
+            left (int): The leftmost x-coordinate, relative to this `Frame`.
+            top (int): The topmost y-coordinate, relative to this `Frame`.
+            width (int): The width of the sub-region.
+            height (int): The height of the sub-region.
+
+        Returns:
+            Frame: The cropped `Frame`, sharing this `Frame`'s timestamp.
+        """
+        rows = slice(max(top, 0), max(top + height, 0))
+        cols = slice(max(left, 0), max(left + width, 0))
+        sub = Frame(self.bgr[rows, cols], timestamp=self.timestamp)
+        if self._hsv is not None:
+            sub._hsv = self._hsv[rows, cols]
+        if self._gray is not None:
+            sub._gray = self._gray[rows, cols]
+        sub._masks = {key: mask[rows, cols] for key, mask in self._masks.items()}
+        return sub
@@ -0,0 +1,106 @@
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class FrameDiffer:
+    """Detect which tiles of a region changed between consecutive captures.
+
+    Many polling loops re-run expensive computer vision (e.g. OCR or template
+    matching) on frames that haven't changed at all since the last check. A
+    `FrameDiffer` remembers the previous capture of a region and compares it to the
+    current one tile-by-tile: the absolute per-pixel difference is reduced to a single
+    mean intensity per tile (i.e. a block-wise downsampled absolute difference), and
+    any tile whose mean difference exceeds `threshold` is considered dirty.
+
+    Downstream detectors can then skip work entirely when nothing changed, or only
+    re-examine the dirty tiles.
+    """
+
+    def __init__(self, tile_size: int = 16, threshold: float = 2.0) -> None:
+        """Initialize a `FrameDiffer`.
+
+        Args:
+            tile_size (int, optional): The side length of each square tile in pixels.
+                Defaults to 16.
+            threshold (float, optional): The mean absolute intensity difference (0 to
+                255) above which a tile is considered changed. Note that a handful of
+                fully-changed pixels in a 16x16 tile (e.g. a new character of text)
+                comfortably exceeds the default. Defaults to 2.0.
+        """
+        self.tile_size = tile_size
+        self.threshold = threshold
+        self.prev: Optional[np.ndarray] = None
+        self.tiles: Optional[np.ndarray] = None
+
+    def reset(self) -> None:
+        """Forget the previous capture so that the next update is fully dirty."""
+        self.prev = None
+        self.tiles = None
+
+    def update(self, frame: np.ndarray) -> np.ndarray:
+        """Compare a new capture to the previous one and remember the new capture.
+
+        Args:
+            frame (np.ndarray): The current BGR (or single-channel) capture.
+
+        Returns:
+            np.ndarray: A boolean array of shape (rows, cols) with one element per tile,
+                True where the tile changed. Every tile is considered changed if there
+                is no previous capture of the same shape.
+        """
+        t = self.tile_size
+        h, w = frame.shape[:2]
+        rows, cols = -(-h // t), -(-w // t)  # Ceiling division.
+        if self.prev is None or self.prev.shape != frame.shape:
+            self.tiles = np.ones((rows, cols), dtype=bool)
+        else:
+            diff = cv2.absdiff(frame, self.prev)
+            if diff.ndim == 3:
+                diff = diff.max(axis=2)
+            # Pad to a whole number of tiles, then reduce each tile to its mean via a
+            # (rows, t, cols, t) block view. Edge tiles are averaged over only the
+            # pixels they actually contain.
+            padded = np.zeros((rows * t, cols * t), dtype=np.float32)
+            padded[:h, :w] = diff
+            sums = padded.reshape(rows, t, cols, t).sum(axis=(1, 3))
+            counts = np.outer(
+                np.minimum(t, h - np.arange(rows) * t),
+                np.minimum(t, w - np.arange(cols) * t),
+            )
+            self.tiles = sums / counts > self.threshold
+        self.prev = frame.copy()
+        return self.tiles
+
+    def changed(self, frame: np.ndarray) -> bool:
+        """Determine whether any tile changed since the previous capture.
+
+        Args:
+            frame (np.ndarray): The current BGR (or single-channel) capture.
+
+        Returns:
+            bool: True if any tile changed (or there is no previous capture), False
+                otherwise.
+        """
+        return bool(self.update(frame).any())
+
+    def dirty_bbox(self) -> Optional[Tuple[int, int, int, int]]:
+        """Get the pixel bounding box enclosing every changed tile of the last update.
+
+        Returns:
+            Optional[Tuple[int, int, int, int]]: The bounding box as (xmin, ymin, xmax,
+                ymax) relative to the captured region (clipped to its size), or None if
+                nothing changed.
+        """
+        if self.tiles is None or not self.tiles.any():
+            return None
+        t = self.tile_size
+        rows, cols = np.nonzero(self.tiles)
+        h, w = self.prev.shape[:2]
+        return (
+            int(cols.min()) * t,
+            int(rows.min()) * t,
+            min((int(cols.max()) + 1) * t, w),
+            min((int(rows.max()) + 1) * t, h),
+        )
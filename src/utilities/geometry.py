@@ -1,16 +1,86 @@
 import math
-from typing import List, NamedTuple
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import cv2
 import mss
 import numpy as np
 
 import utilities.random_util as rd
+from utilities.frame import Frame
+from utilities.frame_diff import FrameDiffer
 
 Point = NamedTuple("Point", x=int, y=int)
+DistMeasure = Literal["absolute", "vertical", "horizontal"]
+
+
+class WorldPoint(NamedTuple):
+    """A world tile along with its plane (i.e. floor, where 0 is ground level)."""
+
+    x: int
+    y: int
+    plane: int = 0
+
 
 # TO DO: Remove this global variable. This is a temporary fix for a bug in mss.
-sct = mss.mss()
+try:
+    sct = mss.mss()
+except mss.ScreenShotError:  # No display to capture (e.g. a CI box).
+    sct = None
+
+# Replaces live screen capture for every `Rectangle` when set (see
+# `set_capture_source`).
+CaptureSource = Callable[["Rectangle"], np.ndarray]
+_capture_source: Optional[CaptureSource] = None
+
+
+def grab_screen(rect: "Rectangle") -> np.ndarray:
+    """Capture an area of the live screen, ignoring any installed capture source.
+
+    Args:
+        rect (Rectangle): The area to capture.
+
+    Returns:
+        np.ndarray: The BGR pixels of `rect`.
+    """
+    # `mss.mss()` is the primary interface for interacting with the library, allowing
+    # us to capture screenshots. The created mss instance holds information about
+    # available monitors and provides the tools to grab images.
+    with mss.mss() as sct:
+        monitor = rect.to_dict()
+        screenshot = sct.grab(monitor)
+        img = np.array(screenshot)
+        return img[:, :, :3]  # Truncate the alpha channel.
+
+
+def set_capture_source(source: Optional[CaptureSource]) -> Optional[CaptureSource]:
+    """Serve `Rectangle.screenshot` from somewhere other than the live screen.
+
+    This lets the whole computer vision stack run against recorded frames, without a
+    game client or even a display (see `model.recorded_window.RecordedWindow`).
+
+    Args:
+        source (Optional[CaptureSource]): A callable that takes a `Rectangle` and
+            returns a new BGR image array of its exact size, which the caller is free
+            to modify. Pass None to restore live screen capture.
+
+    Returns:
+        Optional[CaptureSource]: The previously-installed source, if any, so that it
+            can be restored later.
+    """
+    global _capture_source
+    previous, _capture_source = _capture_source, source
+    return previous
 
 
 class Rectangle:
@@ -100,17 +170,14 @@ class Rectangle:
         The `grab` method stores pixel data as BGRA; after conversion to a NumPy array,
         we discard the alpha channel to retain only BGR.
 
+        If a capture source was installed with `set_capture_source`, the image is taken
+        from it instead of the screen.
+
         Returns:
             cv2.Mat: NumPy array of BGR color tuples representing the captured image.
         """
-        # `mss.mss()` is the primary interface for interacting with the library,
-        # allowing us to capture screenshots. The created mss instance holds
-        # information about available monitors and provides the tools to grab images.
-        with mss.mss() as sct:
-            monitor = self.to_dict()
-            screenshot = sct.grab(monitor)
-            img = np.array(screenshot)
-            img_bgr = img[:, :, :3]  # Truncate the alpha channel.
+        source = grab_screen if _capture_source is None else _capture_source
+        img_bgr = source(self)
 
         if self.subtract_list:
             for area in self.subtract_list:
@@ -120,6 +187,71 @@ class Rectangle:
                 ] = 0
         return img_bgr
 
+    def capture(self, max_age: float = 0.0) -> Frame:
+        """Capture this `Rectangle` as a `Frame` that memoizes derived representations.
+
+        Several detectors looking at the same `Rectangle` within the same game tick
+        (e.g. finding marked objects in `Bot.win.game_view` and checking for an HP bar)
+        can share one capture, and thereby one HSV conversion, by passing a small
+        `max_age`.
+
+        Args:
+            max_age (float, optional): The maximum age in seconds of the previous
+                capture of this `Rectangle` for it to be reused instead of taking a
+                new screenshot. Defaults to 0.0, which always takes a new screenshot.
+
+        Returns:
+            Frame: The (possibly reused) capture of this `Rectangle`.
+        """
+        frame: Optional[Frame] = self.__dict__.get("_frame")
+        if frame is None or time.perf_counter() - frame.timestamp > max_age:
+            frame = self._frame = Frame(self.screenshot())
+        return frame
+
+    def changed_tiles(
+        self, key: str = "default", frame: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Get the tiles of this `Rectangle` that changed since the previous capture.
+
+        Each distinct `key` keeps its own previous capture, so that independent
+        consumers polling the same `Rectangle` (e.g. two detectors both looking at
+        `Bot.win.game_view`) don't hide changes from one another.
+
+        Args:
+            key (str, optional): The name of the consumer asking. Defaults to
+                "default".
+            frame (Optional[np.ndarray], optional): A capture of this `Rectangle` to
+                use instead of taking a new screenshot. Defaults to None.
+
+        Returns:
+            np.ndarray: A boolean array with one element per 16x16 tile, True where
+                the tile changed. See `utilities.frame_diff.FrameDiffer`.
+        """
+        if "_differs" not in self.__dict__:
+            self._differs: Dict[str, FrameDiffer] = {}
+        differ = self._differs.setdefault(key, FrameDiffer())
+        return differ.update(self.screenshot() if frame is None else frame)
+
+    def has_changed(
+        self, key: str = "default", frame: Optional[np.ndarray] = None
+    ) -> bool:
+        """Determine whether this `Rectangle` changed since the previous capture.
+
+        This is a cheap check to run before expensive computer vision, which can be
+        skipped entirely if its inputs are identical to last time.
+
+        Args:
+            key (str, optional): The name of the consumer asking. Defaults to
+                "default".
+            frame (Optional[np.ndarray], optional): A capture of this `Rectangle` to
+                use instead of taking a new screenshot. Defaults to None.
+
+        Returns:
+            bool: True if any tile changed (or this is the first check for `key`),
+                False otherwise.
+        """
+        return bool(self.changed_tiles(key, frame).any())
+
     def random_point(self) -> Point:
         """Generate a random point within this `Rectangle`.
 
@@ -227,6 +359,213 @@ class Rectangle:
         return self.__str__()
 
 
+class RectGrid:
+    """An array-backed grid of `Rectangle` cells (e.g. inventory slots or prayers).
+
+    Grids of UI cells used to be plain lists of `Rectangle` objects, so any per-cell
+    analysis meant iterating over the cells and (usually) screenshotting each one
+    separately. A `RectGrid` stores the bounds of every cell in a single (N, 4) NumPy
+    array of (left, top, width, height) rows, in the same order as the old lists, so
+    that all cells can be analyzed together from a single capture.
+
+    Grids built with `RectGrid.lattice` are regular: every cell has the same size and
+    consecutive rows and columns are a fixed step apart (cells may overlap, as
+    inventory slots do). A capture of a regular grid can be sliced into all of its
+    cells at once as a strided view, without copying any pixels. See `view`.
+
+    Indexing and iterating over a `RectGrid` yields ordinary `Rectangle` objects, so it
+    remains a drop-in replacement for a list of cells.
+
+    Example:
+        cells = self.win.inventory_grid.cells()  # Shape (28, 39, 43, 3).
+        blank = cells.std(axis=(1, 2, 3)) < 5  # Flat-colored slots, in one operation.
+    """
+
+    def __init__(
+        self,
+        bounds: np.ndarray,
+        shape: Optional[Tuple[int, int]] = None,
+        step: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """Initialize a `RectGrid`.
+
+        Args:
+            bounds (np.ndarray): An (N, 4) array of (left, top, width, height) rows,
+                one per cell.
+            shape (Optional[Tuple[int, int]], optional): The (rows, cols) of a regular
+                lattice, in row-major order. Note that a lattice may have fewer than
+                rows * cols cells if trailing cells are unused. Defaults to None for an
+                irregular grid.
+            step (Optional[Tuple[int, int]], optional): The (x, y) distance in pixels
+                between consecutive columns and rows of a regular lattice. Defaults to
+                None for an irregular grid.
+        """
+        self.bounds = np.asarray(bounds, dtype=int).reshape(-1, 4)
+        self.shape = shape
+        self.step = step
+        self._rects = [Rectangle(*map(int, row)) for row in self.bounds]
+
+    @classmethod
+    def lattice(
+        cls,
+        left: int,
+        top: int,
+        rows: int,
+        cols: int,
+        width: int,
+        height: int,
+        step_x: Optional[int] = None,
+        step_y: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> "RectGrid":
+        """Create a regular, row-major grid of equally-sized cells.
+
+        Args:
+            left (int): The leftmost x-coordinate of the first cell.
+            top (int): The topmost y-coordinate of the first cell.
+            rows (int): The number of rows.
+            cols (int): The number of columns.
+            width (int): The width of each cell.
+            height (int): The height of each cell.
+            step_x (Optional[int], optional): The x-distance between consecutive
+                columns. Defaults to None, meaning `width` (i.e. touching cells).
+            step_y (Optional[int], optional): The y-distance between consecutive rows.
+                Defaults to None, meaning `height` (i.e. touching cells).
+            count (Optional[int], optional): The number of cells to keep, dropping any
+                trailing cells (e.g. unused slots at the end of the last row). Defaults
+                to None, meaning rows * cols.
+
+        Returns:
+            RectGrid: The regular grid.
+        """
+        step_x = width if step_x is None else step_x
+        step_y = height if step_y is None else step_y
+        j, i = np.meshgrid(np.arange(rows), np.arange(cols), indexing="ij")
+        bounds = np.column_stack(
+            (
+                left + i.ravel() * step_x,
+                top + j.ravel() * step_y,
+                np.full(rows * cols, width),
+                np.full(rows * cols, height),
+            )
+        )
+        return cls(bounds[:count], shape=(rows, cols), step=(step_x, step_y))
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __getitem__(self, i):
+        return self._rects[i]
+
+    def __iter__(self) -> Iterator[Rectangle]:
+        return iter(self._rects)
+
+    @property
+    def rects(self) -> List[Rectangle]:
+        """Get the cells as a list of `Rectangle` objects.
+
+        Returns:
+            List[Rectangle]: The cells, in order. The same objects are returned on
+                every call.
+        """
+        return self._rects
+
+    @property
+    def is_regular(self) -> bool:
+        """Determine whether this grid is a regular lattice that supports `view`.
+
+        Returns:
+            bool: True if every cell has the same size and a fixed step apart.
+        """
+        return self.shape is not None and self.step is not None
+
+    @property
+    def rect(self) -> Rectangle:
+        """Get the smallest `Rectangle` enclosing every cell.
+
+        Returns:
+            Rectangle: The bounding `Rectangle` of the grid.
+        """
+        left, top = self.bounds[:, :2].min(axis=0)
+        right = (self.bounds[:, 0] + self.bounds[:, 2]).max()
+        bottom = (self.bounds[:, 1] + self.bounds[:, 3]).max()
+        return Rectangle(int(left), int(top), int(right - left), int(bottom - top))
+
+    def capture(self) -> np.ndarray:
+        """Screenshot the bounding `Rectangle` of the grid once.
+
+        Returns:
+            np.ndarray: The BGR capture of `self.rect`.
+        """
+        return self.rect.screenshot()
+
+    def view(self, img: Optional[np.ndarray] = None) -> np.ndarray:
+        """Slice a capture of a regular grid into all of its cells without copying.
+
+        The result is a strided view into `img`: element [r, c] is the (height, width)
+        cell at row `r` and column `c`, sharing memory with `img` (so overlapping
+        cells share pixels). Note that trailing cells beyond `len(self)` are included,
+        since a view must be rectangular.
+
+        Args:
+            img (Optional[np.ndarray], optional): A capture of `self.rect`, such as the
+                result of `capture`. Defaults to None, taking a new capture.
+
+        Raises:
+            ValueError: If this grid is not regular.
+
+        Returns:
+            np.ndarray: A read-only view of shape (rows, cols, height, width) followed
+                by any channel axes of `img`.
+        """
+        if not self.is_regular:
+            raise ValueError("Only a regular `RectGrid` can be viewed as an array.")
+        img = self.capture() if img is None else img
+        rows, cols = self.shape
+        step_x, step_y = self.step
+        x0, y0 = self.bounds[0, :2] - self.bounds[:, :2].min(axis=0)
+        width, height = self.bounds[0, 2:]
+        # Pad the capture if trailing (unused) cells would fall outside of it.
+        need_h = y0 + (rows - 1) * step_y + height
+        need_w = x0 + (cols - 1) * step_x + width
+        if img.shape[0] < need_h or img.shape[1] < need_w:
+            pad_h, pad_w = max(need_h - img.shape[0], 0), max(need_w - img.shape[1], 0)
+            img = np.pad(img, [(0, pad_h), (0, pad_w)] + [(0, 0)] * (img.ndim - 2))
+        sy, sx = img.strides[:2]
+        return np.lib.stride_tricks.as_strided(
+            img[y0:, x0:],
+            shape=(rows, cols, height, width) + img.shape[2:],
+            strides=(step_y * sy, step_x * sx, sy, sx) + img.strides[2:],
+            writeable=False,
+        )
+
+    def cells(self, img: Optional[np.ndarray] = None) -> np.ndarray:
+        """Slice a capture of the grid into a stack of all of its cells.
+
+        Regular grids are sliced via `view`. Irregular grids (e.g. control panel tabs
+        of differing widths) are zero-padded to the size of the largest cell.
+
+        Args:
+            img (Optional[np.ndarray], optional): A capture of `self.rect`, such as the
+                result of `capture`. Defaults to None, taking a new capture.
+
+        Returns:
+            np.ndarray: An array of shape (N, height, width) followed by any channel
+                axes of `img`, with one cell per element in the order of this grid.
+        """
+        img = self.capture() if img is None else img
+        if self.is_regular:
+            stacked = self.view(img)
+            return stacked.reshape((-1,) + stacked.shape[2:])[: len(self)]
+        offsets = self.bounds[:, :2] - self.bounds[:, :2].min(axis=0)
+        height, width = self.bounds[:, 3].max(), self.bounds[:, 2].max()
+        out = np.zeros((len(self), height, width) + img.shape[2:], dtype=img.dtype)
+        for k, ((x, y), (w, h)) in enumerate(zip(offsets, self.bounds[:, 2:])):
+            cell = img[y : y + h, x : x + w]
+            out[k, : cell.shape[0], : cell.shape[1]] = cell
+        return out
+
+
 class RuneLiteObject:
     """A `RuneLiteObject` represents object on the screen, bounded by a `Rectangle`.
 
@@ -445,6 +784,229 @@ class RuneLiteObject:
         return False
 
 
+def _invalidating(method: Callable) -> Callable:
+    """Wrap a `list` mutator so that it marks a `RuneLiteObjects` index as stale.
+
+    Args:
+        method (Callable): The unbound `list` method (e.g. `list.sort`).
+
+    Returns:
+        Callable: The wrapped method.
+    """
+
+    def wrapper(self: "RuneLiteObjects", *args, **kwargs):
+        self._stale = True
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class RuneLiteObjects(list):
+    """An ordered collection of `RuneLiteObject` elements found in one `Rectangle`.
+
+    `RuneLiteObjects` behaves exactly like a regular list of `RuneLiteObject` elements
+    (i.e. it can be indexed, iterated over, sorted, or checked for emptiness), but it
+    additionally keeps NumPy arrays of every object's bounds and center. This allows
+    distance-based queries such as "the 3rd-closest object to our character" to be
+    answered with a single vectorized operation instead of recomputing `center` and
+    `math.dist` for each object in Python.
+
+    Note that the arrays are built lazily upon the first distance query and rebuilt
+    only after the collection is modified (e.g. appended to, sorted, or assigned to).
+    """
+
+    # Every `list` method that modifies the collection invalidates the arrays.
+    __setitem__ = _invalidating(list.__setitem__)
+    __delitem__ = _invalidating(list.__delitem__)
+    __iadd__ = _invalidating(list.__iadd__)
+    __imul__ = _invalidating(list.__imul__)
+    append = _invalidating(list.append)
+    extend = _invalidating(list.extend)
+    insert = _invalidating(list.insert)
+    pop = _invalidating(list.pop)
+    remove = _invalidating(list.remove)
+    clear = _invalidating(list.clear)
+    sort = _invalidating(list.sort)
+    reverse = _invalidating(list.reverse)
+
+    def __init__(
+        self, objs: Iterable[RuneLiteObject] = (), rect: Optional[Rectangle] = None
+    ) -> None:
+        """Initialize a `RuneLiteObjects` collection.
+
+        Args:
+            objs (Iterable[RuneLiteObject], optional): The objects to collect. Defaults
+                to an empty collection.
+            rect (Optional[Rectangle], optional): The `Rectangle` that all of the
+                collected objects belong in (e.g. `Bot.win.game_view`). Defaults to
+                None, in which case the reference `Rectangle` of the first object is
+                used.
+        """
+        super().__init__(objs)
+        self.rect = rect if rect is not None else (self[0].rect if self else None)
+        self._stale = True
+        self._bounds = np.empty((0, 4), dtype=int)
+        self._centers = np.empty((0, 2), dtype=int)
+
+    def _index(self) -> None:
+        """Build the bounds and centers arrays if they are missing or out of date.
+
+        Raises:
+            ReferenceError: Raised if the reference `Rectangle` cannot be found.
+        """
+        if not self._stale:
+            return
+        if self.rect is None:
+            msg = (
+                "`RuneLiteObjects` cannot be indexed. Reference to containing"
+                " `Rectangle` is missing."
+            )
+            raise ReferenceError(msg)
+        self._bounds = np.array(
+            [(obj.xmin, obj.xmax, obj.ymin, obj.ymax) for obj in self], dtype=int
+        ).reshape(-1, 4)
+        # Note that `np.rint` rounds half to even, just like Python's `round` does in
+        # `RuneLiteObject.center`.
+        midpoints = np.rint(
+            (self._bounds[:, [0, 2]] + self._bounds[:, [1, 3]]) / 2
+        ).astype(int)
+        self._centers = midpoints + (self.rect.left, self.rect.top)
+        self._stale = False
+
+    @property
+    def bounds(self) -> np.ndarray:
+        """Get the (xmin, xmax, ymin, ymax) bounds of each object as an (N, 4) array.
+
+        Returns:
+            np.ndarray: The bounds of each object relative to the reference
+                `Rectangle`, one row per object.
+        """
+        self._index()
+        return self._bounds
+
+    @property
+    def centers(self) -> np.ndarray:
+        """Get the center (x, y) of each object as an (N, 2) array.
+
+        Returns:
+            np.ndarray: The center of each object relative to the client window, one
+                row per object (i.e. equivalent to each `RuneLiteObject.center`).
+        """
+        self._index()
+        return self._centers
+
+    def distances(self, dist_measure: DistMeasure = "absolute") -> np.ndarray:
+        """Get the distance from each object's center to its parent's center.
+
+        Args:
+            dist_measure (DistMeasure, optional): How the distance should be measured.
+                Choose from "vertical", "horizontal" or "absolute". Defaults to
+                "absolute".
+
+        Raises:
+            ValueError: Raised if `dist_measure` is not a recognized measure.
+
+        Returns:
+            np.ndarray: A 1D array of distances, one per object. These match
+                `dist_from_rect_center`, `vert_dist_from_rect_center`, and
+                `horz_dist_from_rect_center`, respectively.
+        """
+        deltas = self.centers - self.rect.center
+        if dist_measure == "absolute":
+            return np.hypot(deltas[:, 0], deltas[:, 1])
+        if dist_measure == "vertical":
+            return np.abs(deltas[:, 1]).astype(float)
+        if dist_measure == "horizontal":
+            return np.abs(deltas[:, 0]).astype(float)
+        raise ValueError(f"Unknown distance measure: {dist_measure}")
+
+    def _nearest_indices(self, k: int, dist_measure: DistMeasure) -> np.ndarray:
+        """Get the indices of the `k` objects closest to the reference center.
+
+        Only the `k` closest objects are sorted. The rest are merely partitioned away
+        via `np.partition`, which is linear in the number of objects. Objects at equal
+        distances keep their order in the collection, just like with a stable sort.
+
+        Args:
+            k (int): The number of indices to get, at most `len(self)`.
+            dist_measure (DistMeasure): How the distance should be measured.
+
+        Returns:
+            np.ndarray: The `k` indices, ordered from closest to furthest.
+        """
+        dists = self.distances(dist_measure)
+        kth = np.partition(dists, k - 1)[k - 1]
+        # Every object up to the k-th distance, ties included, in collection order.
+        inds = np.flatnonzero(dists <= kth)
+        return inds[np.argsort(dists[inds], kind="stable")][:k]
+
+    def nearest(
+        self, k: int = 1, dist_measure: DistMeasure = "absolute"
+    ) -> List[RuneLiteObject]:
+        """Get the `k` objects closest to the reference `Rectangle` center.
+
+        Only the `k` closest objects are sorted (see `_nearest_indices`), rather than
+        the whole collection.
+
+        Args:
+            k (int, optional): The number of objects to return. Defaults to 1.
+            dist_measure (DistMeasure, optional): How the distance should be measured.
+                Choose from "vertical", "horizontal" or "absolute". Defaults to
+                "absolute".
+
+        Returns:
+            List[RuneLiteObject]: Up to `k` objects, ordered from closest to furthest.
+        """
+        if k <= 0 or not self:
+            return []
+        inds = self._nearest_indices(min(k, len(self)), dist_measure)
+        return [self[i] for i in inds]
+
+    def nth_nearest(
+        self, n: int = 0, dist_measure: DistMeasure = "absolute"
+    ) -> Optional[RuneLiteObject]:
+        """Get the object that is `n`-th closest to the reference `Rectangle` center.
+
+        Args:
+            n (int, optional): The zero-based order of the object to get, where 0 is the
+                closest object. Defaults to 0.
+            dist_measure (DistMeasure, optional): How the distance should be measured.
+                Choose from "vertical", "horizontal" or "absolute". Defaults to
+                "absolute".
+
+        Returns:
+            Optional[RuneLiteObject]: The `n`-th closest object, or None if there are
+                not enough objects in the collection.
+        """
+        if not 0 <= n < len(self):
+            return None
+        return self[int(self._nearest_indices(n + 1, dist_measure)[n])]
+
+    def sorted_by_distance(
+        self, dist_measure: DistMeasure = "absolute"
+    ) -> "RuneLiteObjects":
+        """Get a copy of this collection sorted from closest to furthest.
+
+        This is the vectorized equivalent of sorting with a key like
+        `RuneLiteObject.dist_from_rect_center`.
+
+        Args:
+            dist_measure (DistMeasure, optional): How the distance should be measured.
+                Choose from "vertical", "horizontal" or "absolute". Defaults to
+                "absolute".
+
+        Returns:
+            RuneLiteObjects: A new, sorted collection with the same reference
+                `Rectangle`.
+        """
+        if not self:
+            return RuneLiteObjects(rect=self.rect)
+        inds = np.argsort(self.distances(dist_measure), kind="stable")
+        return RuneLiteObjects((self[i] for i in inds), rect=self.rect)
+
+
 def cosine_similarity(v1: tuple, v2: tuple) -> float:
     """Calculate the cosine similarity of two vectors.
 
@@ -1,15 +1,39 @@
 from pathlib import Path
-from typing import Union
+from typing import List, Optional, Union
 
 import cv2
+import numpy as np
 
-from utilities.geometry import Point, Rectangle
+from utilities.executor import WorkerPool
+from utilities.geometry import Point, Rectangle, RectGrid
 
 PATH_SRC = Path(__file__).parents[1]
 PATH_IMG = PATH_SRC / "img"
 BOT_IMAGES = PATH_IMG / "bot"
 
 
+def _correlate(template: cv2.Mat, im: cv2.Mat) -> np.ndarray:
+    """Compute the masked squared-difference map of a template over an image.
+
+    Args:
+        template (cv2.Mat): The template to search for as a BGR or BGRA image matrix.
+        im (cv2.Mat): The image to search within as a BGR image matrix array.
+
+    Returns:
+        np.ndarray: The `TM_SQDIFF_NORMED` correlation map, where each element scores
+            the template placed with its top-left corner at that position (0 is a
+            perfect match).
+    """
+    # If the image doesn't have an alpha channel, convert it from BGR to BGRA because
+    # template matching can be affected by transparency.
+    if len(template.shape) < 3 or template.shape[2] != 4:
+        template = cv2.cvtColor(template, cv2.COLOR_BGR2BGRA)
+    base = template[:, :, 0:3]  # Extract base image and alpha channel separately.
+    alpha = template[:, :, 3]
+    alpha = cv2.merge([alpha, alpha, alpha])
+    return cv2.matchTemplate(im, base, cv2.TM_SQDIFF_NORMED, mask=alpha)
+
+
 def _search_img_in_img(template: cv2.Mat, im: cv2.Mat, confidence: float) -> Rectangle:
     """Locate a template image within a larger containing image.
 
@@ -28,15 +52,8 @@ def _search_img_in_img(template: cv2.Mat, im: cv2.Mat, confidence: float) -> Rec
     Returns:
         Rectangle: A Rectangle outlining the found template inside the image.
     """
-    # If the image doesn't have an alpha channel, convert it from BGR to BGRA because
-    # template matching can be affected by transparency.
-    if len(template.shape) < 3 or template.shape[2] != 4:
-        template = cv2.cvtColor(template, cv2.COLOR_BGR2BGRA)
     hh, ww = template.shape[:2]  # Get template dimensions.
-    base = template[:, :, 0:3]  # Extract base image and alpha channel separately.
-    alpha = template[:, :, 3]
-    alpha = cv2.merge([alpha, alpha, alpha])
-    correlation = cv2.matchTemplate(im, base, cv2.TM_SQDIFF_NORMED, mask=alpha)
+    correlation = _correlate(template, im)
     # Find the minimum value (best match) and its location in the correlation map.
     min_val, _, min_loc, _ = cv2.minMaxLoc(correlation)
     if min_val < confidence:
@@ -47,6 +64,26 @@ def _search_img_in_img(template: cv2.Mat, im: cv2.Mat, confidence: float) -> Rec
         )
 
 
+def _load_template(img: Union[cv2.Mat, str, Path]) -> cv2.Mat:
+    """Load a template image from disk, keeping its alpha channel.
+
+    Args:
+        img (Union[cv2.Mat, str, Path]): The template, or the path to its PNG.
+
+    Raises:
+        ValueError: If the template image could not be read in correctly.
+
+    Returns:
+        cv2.Mat: The template as an image matrix.
+    """
+    if not isinstance(img, (str, Path)):
+        return img
+    template = cv2.imread(str(img), cv2.IMREAD_UNCHANGED)
+    if template is None:
+        raise ValueError(f"Could not read in template: {img}")
+    return template
+
+
 def search_img_in_rect(
     img: Union[cv2.Mat, str, Path],
     rect: Union[Rectangle, cv2.Mat],
@@ -100,10 +137,7 @@ def search_img_in_rect(
             self.mouse.move_to(deposit_all_btn.random_point())
             self.mouse.click()
     """
-    img = str(img) if isinstance(img, Path) else img
-    template = cv2.imread(img, cv2.IMREAD_UNCHANGED)
-    if template is None:
-        raise ValueError(f"Could not read in template: {img}")
+    template = _load_template(img)
     im = rect.screenshot() if isinstance(rect, Rectangle) else rect
     for _ in range(num_retries):
         if found_rect := _search_img_in_img(template, im, confidence):
@@ -113,3 +147,133 @@ def search_img_in_rect(
                 found_rect.top += rect.top
             return found_rect
         confidence += 0.01
+
+
+def search_imgs_in_rect(
+    imgs: List[Union[cv2.Mat, str, Path]],
+    rect: Union[Rectangle, cv2.Mat],
+    confidence: float = 0.15,
+    pool: Optional[WorkerPool] = None,
+) -> List[Optional[Rectangle]]:
+    """Search for several templates within a single capture of a larger image.
+
+    This is equivalent to calling `search_img_in_rect` once per template, except that
+    `rect` is only screenshotted once (so every template is compared against the same
+    frame) and, if a `pool` is provided, the templates are matched in parallel.
+
+    Args:
+        imgs (List[Union[cv2.Mat, str, Path]]): The templates to search for, as image
+            matrices or paths to PNG images.
+        rect (Union[Rectangle, cv2.Mat]): The larger image to search within.
+        confidence (float, optional): The acceptable confidence level of reporting a
+            match (i.e. p-value), ranging from 0 to 1, where 0 is a perfect match.
+            Defaults to 0.15.
+        pool (Optional[WorkerPool], optional): A pool (e.g. `Bot.pool`) to spread the
+            template matching across. Defaults to None, matching sequentially.
+
+    Raises:
+        ValueError: If any template image could not be read in correctly.
+
+    Returns:
+        List[Optional[Rectangle]]: For each template, in order, a `Rectangle`
+            outlining where it was found (relative to the containing window if `rect`
+            is a `Rectangle`), or None if it was not found.
+    """
+    templates = [_load_template(img) for img in imgs]
+    im = rect.screenshot() if isinstance(rect, Rectangle) else rect
+    n = len(templates)
+    if pool is None:
+        found = [_search_img_in_img(t, im, confidence) for t in templates]
+    else:
+        found = pool.map(_search_img_in_img, templates, [im] * n, [confidence] * n)
+    if isinstance(rect, Rectangle):  # Shift found rectangles back into the live frame.
+        for found_rect in found:
+            if found_rect:
+                found_rect.left += rect.left
+                found_rect.top += rect.top
+    return found
+
+
+def grid_match_scores(
+    img: Union[cv2.Mat, str, Path],
+    grid: RectGrid,
+    capture: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Score how well a template matches within each cell of a `RectGrid`.
+
+    Rather than screenshotting and template matching each cell separately, the whole
+    grid is captured once and matched with a single `cv2.matchTemplate` call. The best
+    (minimum) score of each cell is then read out of the correlation map: the valid
+    template positions within each cell form a fixed-size window of the map, so for a
+    regular grid all windows are taken as one strided view and reduced at once.
+
+    Scores are identical to those `search_img_in_rect` would compute per cell, since
+    `TM_SQDIFF_NORMED` normalizes each template position independently.
+
+    Args:
+        img (Union[cv2.Mat, str, Path]): The template (i.e. sprite) to search for, or
+            the path to its PNG.
+        grid (RectGrid): The grid of cells to search within (e.g.
+            `Bot.win.inventory_grid`).
+        capture (Optional[np.ndarray], optional): A BGR capture of `grid.rect` to use
+            instead of taking a new screenshot. Defaults to None.
+
+    Returns:
+        np.ndarray: The best score of each cell, in grid order, ranging from 0 (a
+            perfect match) to 1. Cells too small to contain the template score inf.
+    """
+    template = _load_template(img)
+    im = grid.capture() if capture is None else capture
+    th, tw = template.shape[:2]
+    cell_w, cell_h = grid.bounds[:, 2].min(), grid.bounds[:, 3].min()
+    if th > cell_h or tw > cell_w or th > im.shape[0] or tw > im.shape[1]:
+        return np.full(len(grid), np.inf)
+    correlation = _correlate(template, im)
+    if grid.is_regular:
+        # Each cell's window of valid template positions, laid out like the grid.
+        rows, cols = grid.shape
+        windows = RectGrid.lattice(
+            0, 0, rows, cols, cell_w - tw + 1, cell_h - th + 1, *grid.step
+        )
+        stacked = windows.view(correlation)  # (rows, cols, window_h, window_w)
+        return stacked.min(axis=(2, 3)).ravel()[: len(grid)]
+    offsets = grid.bounds[:, :2] - grid.bounds[:, :2].min(axis=0)
+    return np.array(
+        [
+            correlation[y : y + h - th + 1, x : x + w - tw + 1].min()
+            for (x, y), (w, h) in zip(offsets, grid.bounds[:, 2:])
+        ]
+    )
+
+
+def search_img_in_grid(
+    img: Union[cv2.Mat, str, Path],
+    grid: RectGrid,
+    confidence: float = 0.15,
+    capture: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Determine which cells of a `RectGrid` contain a template, all at once.
+
+    This is the vectorized equivalent of calling `search_img_in_rect` on every cell of
+    `grid`. See `grid_match_scores`.
+
+    Args:
+        img (Union[cv2.Mat, str, Path]): The template (i.e. sprite) to search for, or
+            the path to its PNG.
+        grid (RectGrid): The grid of cells to search within (e.g.
+            `Bot.win.inventory_grid`).
+        confidence (float, optional): The acceptable confidence level of reporting a
+            match (i.e. p-value), ranging from 0 to 1, where 0 is a perfect match.
+            Defaults to 0.15.
+        capture (Optional[np.ndarray], optional): A BGR capture of `grid.rect` to use
+            instead of taking a new screenshot. Defaults to None.
+
+    Returns:
+        np.ndarray: A boolean array with one element per cell, in grid order, True
+            where the template was found.
+
+    Examples:
+        logs = BOT_IMAGES / "items" / "logs.png"
+        slots = np.flatnonzero(search_img_in_grid(logs, self.win.inventory_grid))
+    """
+    return grid_match_scores(img, grid, capture) < confidence
@@ -0,0 +1,103 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+LAYOUT_CACHE_PATH = Path(__file__).parents[1] / "data" / "layout_cache.json"
+
+# An anchor is a located UI region as (left, top, width, height), measured relative to
+# the top-left corner of the client area rather than the screen, so that moving the
+# client window doesn't invalidate it.
+Anchor = Tuple[int, int, int, int]
+Layout = Dict[str, Anchor]
+
+
+def template_digest(paths: Iterable[Path]) -> str:
+    """Hash the contents of the template images used to locate UI regions.
+
+    Any change to a template (e.g. recapturing it after a game update) changes the
+    digest, and therefore invalidates every layout located with the old templates.
+
+    Args:
+        paths (Iterable[Path]): The template image files.
+
+    Returns:
+        str: The hexadecimal MD5 digest of all of the files' contents, in order.
+    """
+    md5 = hashlib.md5()
+    for path in paths:
+        md5.update(Path(path).read_bytes())
+    return md5.hexdigest()
+
+
+def _layout_key(size: Tuple[int, int], mode: str, digest: str) -> str:
+    """Build the key a layout is stored under.
+
+    Args:
+        size (Tuple[int, int]): The (width, height) of the client area.
+        mode (str): The layout mode (e.g. "fixed_classic").
+        digest (str): The template digest from `template_digest`.
+
+    Returns:
+        str: The key, e.g. "765x503:fixed_classic:0123abcd...".
+    """
+    return f"{size[0]}x{size[1]}:{mode}:{digest}"
+
+
+def _load_cache_file() -> Dict[str, Layout]:
+    """Open `src/data/layout_cache.json` and load its data into a dictionary.
+
+    Returns:
+        Dict[str, Layout]: Every cached layout keyed by `_layout_key`, or an empty
+            dictionary if the file is missing or unreadable.
+    """
+    try:
+        with open(LAYOUT_CACHE_PATH, "r") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def get_layouts(
+    size: Tuple[int, int], modes: List[str], digest: str
+) -> Dict[str, Layout]:
+    """Get the cached layouts of a client size for each of several layout modes.
+
+    Args:
+        size (Tuple[int, int]): The (width, height) of the client area.
+        modes (List[str]): The layout modes to look up.
+        digest (str): The template digest from `template_digest`.
+
+    Returns:
+        Dict[str, Layout]: The cached layouts keyed by mode, omitting modes with no
+            cached layout.
+    """
+    data = _load_cache_file()
+    layouts = {}
+    for mode in modes:
+        if layout := data.get(_layout_key(size, mode, digest)):
+            layouts[mode] = {name: tuple(anchor) for name, anchor in layout.items()}
+    return layouts
+
+
+def set_layout(size: Tuple[int, int], mode: str, digest: str, layout: Layout) -> None:
+    """Persist a located layout to `src/data/layout_cache.json`.
+
+    Note that if the cache file doesn't exist, a new one is dynamically created.
+
+    Args:
+        size (Tuple[int, int]): The (width, height) of the client area.
+        mode (str): The layout mode (e.g. "fixed_classic").
+        digest (str): The template digest from `template_digest`.
+        layout (Layout): The anchors of the located regions, keyed by region name.
+    """
+    data = _load_cache_file()
+    data[_layout_key(size, mode, digest)] = layout
+    LAYOUT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(LAYOUT_CACHE_PATH, "w") as file:
+        json.dump(data, file, indent=2)
+
+
+def clear_layouts() -> None:
+    """Delete every cached layout, forcing full template searches on the next start."""
+    LAYOUT_CACHE_PATH.unlink(missing_ok=True)
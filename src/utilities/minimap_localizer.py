@@ -0,0 +1,373 @@
+import argparse
+import threading
+from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+if __name__ == "__main__":
+    import sys
+
+    # Go up one level to facilitate importing from `utilities` below.
+    sys.path[0] = str(Path(sys.path[0]).parent)
+
+from utilities.geometry import Point
+
+MINIMAP_ATLAS_PATH = Path(__file__).parents[1] / "data" / "minimap_atlas.npz"
+MINIMAP_PIXELS_PER_TILE = 4  # On a default-zoom minimap.
+
+
+class Localization(NamedTuple):
+    """A position estimated from the minimap.
+
+    Attributes:
+        tile (Point): The estimated tile of our character.
+        confidence (float): The normalized cross-correlation of the best match,
+            ranging from -1 to 1.
+    """
+
+    tile: Point
+    confidence: float
+
+
+def derotate_minimap(minimap: np.ndarray, camera_angle: float) -> np.ndarray:
+    """Rotate a minimap capture so that north points up.
+
+    Args:
+        minimap (np.ndarray): A BGR capture of the minimap, centered on our character.
+        camera_angle (float): The compass angle (degrees clockwise from north) when
+            the minimap was captured.
+
+    Returns:
+        np.ndarray: The capture rotated about its center, with pixels rotated in from
+            outside the capture left black.
+    """
+    if camera_angle % 360 == 0:
+        return minimap
+    h, w = minimap.shape[:2]
+    # A positive OpenCV angle rotates counter-clockwise, undoing a clockwise camera.
+    matrix = cv2.getRotationMatrix2D((w / 2, h / 2), camera_angle, 1.0)
+    return cv2.warpAffine(minimap, matrix, (w, h), flags=cv2.INTER_NEAREST)
+
+
+def minimap_mask(minimap: np.ndarray, center_radius: int = 4) -> np.ndarray:
+    """Get which pixels of a (derotated) minimap capture show the map itself.
+
+    Black pixels (i.e. those cropped away outside the minimap's round border, or
+    rotated in from outside of the capture) are left out, as is our character's own
+    marker at the center.
+
+    Args:
+        minimap (np.ndarray): A BGR capture of the minimap.
+        center_radius (int, optional): The radius, in pixels, of the center disc to
+            leave out. Defaults to 4.
+
+    Returns:
+        np.ndarray: A uint8 mask of the capture's size, 255 where the map shows.
+    """
+    mask = np.where(minimap.any(axis=2), 255, 0).astype(np.uint8)
+    mask = cv2.erode(mask, np.ones((3, 3), np.uint8))  # Drop the anti-aliased rim.
+    h, w = mask.shape
+    cv2.circle(mask, (w // 2, h // 2), center_radius, 0, thickness=-1)
+    return mask
+
+
+class MinimapAtlas:
+    """A north-up image of the world map, as it appears on the minimap.
+
+    The atlas is stored downsampled to `pixels_per_tile` pixels per game tile (the
+    minimap itself shows 4 at its default zoom), along with the tile at its top-left
+    corner. Since world y-coordinates increase northward but image rows increase
+    downward, pixel (0, 0) is the north-west corner of the atlas.
+
+    An atlas is prebuilt by pasting in derotated minimap captures taken at known
+    positions (e.g. read from the tile overlay while walking; see `paste`).
+    """
+
+    def __init__(
+        self, image: np.ndarray, origin: Point, pixels_per_tile: int = 2
+    ) -> None:
+        """Initialize a `MinimapAtlas`.
+
+        Args:
+            image (np.ndarray): The BGR atlas image, black where unexplored.
+            origin (Point): The tile at the top-left (north-west) corner of `image`.
+            pixels_per_tile (int, optional): How many pixels of `image` span one tile.
+                Defaults to 2.
+        """
+        self.image = np.ascontiguousarray(image[:, :, :3])
+        self.origin = origin
+        self.pixels_per_tile = pixels_per_tile
+
+    @classmethod
+    def blank(
+        cls, west: int, south: int, east: int, north: int, pixels_per_tile: int = 2
+    ) -> "MinimapAtlas":
+        """Create an empty atlas spanning a rectangle of tiles.
+
+        Args:
+            west (int): The smallest x-coordinate covered.
+            south (int): The smallest y-coordinate covered.
+            east (int): The largest x-coordinate covered.
+            north (int): The largest y-coordinate covered.
+            pixels_per_tile (int, optional): How many atlas pixels span one tile.
+                Defaults to 2.
+
+        Returns:
+            MinimapAtlas: A black atlas covering the tiles.
+        """
+        width = (east - west + 1) * pixels_per_tile
+        height = (north - south + 1) * pixels_per_tile
+        image = np.zeros((height, width, 3), dtype=np.uint8)
+        return cls(image, Point(west, north), pixels_per_tile)
+
+    @classmethod
+    def load(cls, path: Path = MINIMAP_ATLAS_PATH) -> "MinimapAtlas":
+        """Load an atlas saved with `save`.
+
+        Args:
+            path (Path, optional): The `.npz` file. Defaults to `MINIMAP_ATLAS_PATH`.
+
+        Returns:
+            MinimapAtlas: The loaded atlas.
+        """
+        with np.load(path) as data:
+            x, y = data["origin"].tolist()
+            return cls(data["image"], Point(x, y), int(data["pixels_per_tile"]))
+
+    def save(self, path: Path = MINIMAP_ATLAS_PATH) -> None:
+        """Save the atlas as a compressed `.npz` archive.
+
+        Args:
+            path (Path, optional): The `.npz` file. Defaults to `MINIMAP_ATLAS_PATH`.
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            image=self.image,
+            origin=np.array(self.origin),
+            pixels_per_tile=self.pixels_per_tile,
+        )
+
+    def tile_to_pixel(self, tile: Point) -> Tuple[float, float]:
+        """Get the atlas pixel at the center of a tile.
+
+        Args:
+            tile (Point): The tile.
+
+        Returns:
+            Tuple[float, float]: The (column, row) of the tile's center.
+        """
+        ppt = self.pixels_per_tile
+        return (
+            (tile.x - self.origin.x + 0.5) * ppt,
+            (self.origin.y - tile.y + 0.5) * ppt,
+        )
+
+    def pixel_to_tile(self, col: float, row: float) -> Point:
+        """Get the tile an atlas pixel lies on.
+
+        Args:
+            col (float): The pixel's column.
+            row (float): The pixel's row.
+
+        Returns:
+            Point: The tile.
+        """
+        ppt = self.pixels_per_tile
+        return Point(self.origin.x + int(col // ppt), self.origin.y - int(row // ppt))
+
+    def _scale(self, minimap: np.ndarray) -> np.ndarray:
+        """Resize a minimap capture from the minimap's scale to the atlas's.
+
+        Args:
+            minimap (np.ndarray): A capture at `MINIMAP_PIXELS_PER_TILE`.
+
+        Returns:
+            np.ndarray: The capture at `pixels_per_tile`.
+        """
+        factor = self.pixels_per_tile / MINIMAP_PIXELS_PER_TILE
+        if factor == 1:
+            return minimap
+        h, w = minimap.shape[:2]
+        size = (max(round(w * factor), 1), max(round(h * factor), 1))
+        return cv2.resize(minimap, size, interpolation=cv2.INTER_AREA)
+
+    def paste(self, tile: Point, minimap: np.ndarray, camera_angle: float) -> None:
+        """Paint a minimap capture taken at a known tile into the atlas.
+
+        Only the pixels showing the map (see `minimap_mask`) are painted, and anything
+        falling outside of the atlas is cropped.
+
+        Args:
+            tile (Point): Where our character stood when `minimap` was captured.
+            minimap (np.ndarray): A BGR capture of the minimap.
+            camera_angle (float): The compass angle when `minimap` was captured.
+        """
+        north_up = derotate_minimap(minimap, camera_angle)
+        mask = self._scale(minimap_mask(north_up)) > 127
+        patch = self._scale(north_up)
+        h, w = patch.shape[:2]
+        col, row = self.tile_to_pixel(tile)
+        left, top = round(col - w / 2), round(row - h / 2)
+        img_h, img_w = self.image.shape[:2]
+        x0, y0 = max(left, 0), max(top, 0)
+        x1, y1 = min(left + w, img_w), min(top + h, img_h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        sub_mask = mask[y0 - top : y1 - top, x0 - left : x1 - left]
+        sub_patch = patch[y0 - top : y1 - top, x0 - left : x1 - left]
+        self.image[y0:y1, x0:x1][sub_mask] = sub_patch[sub_mask]
+
+
+class MinimapLocalizer:
+    """Estimate our position by finding the minimap within a world-map atlas.
+
+    Reading our position otherwise requires OCR-ing the tile overlay, which must be
+    enabled and visible. The minimap is always on screen, though, and centered on our
+    character. `MinimapLocalizer` derotates a minimap capture to north-up, shrinks it
+    to the atlas's scale, and slides it over a small window of the atlas around the
+    last known position, scoring each offset by masked normalized cross-correlation
+    (`cv2.TM_CCOEFF_NORMED`). The best-scoring offset gives our tile, and its score
+    the confidence. Searching only a small window keeps this to a few milliseconds.
+
+    Matches scoring below `min_confidence` (e.g. because that part of the world isn't
+    in the atlas yet, or the minimap is crowded with markers) are rejected, so callers
+    can fall back to the tile overlay.
+
+    Example:
+        localizer = MinimapLocalizer(get_minimap_atlas())
+        fix = localizer.locate(win.minimap.screenshot(), angle, near=last_tile)
+        if fix:
+            print(fix.tile, fix.confidence)
+    """
+
+    def __init__(
+        self,
+        atlas: MinimapAtlas,
+        search_radius: int = 16,
+        min_confidence: float = 0.6,
+    ) -> None:
+        """Initialize a `MinimapLocalizer`.
+
+        Args:
+            atlas (MinimapAtlas): The atlas to search.
+            search_radius (int, optional): How many tiles from the last known position
+                to search, along either axis. Defaults to 16.
+            min_confidence (float, optional): The lowest match score accepted.
+                Defaults to 0.6.
+        """
+        self.atlas = atlas
+        self.search_radius = search_radius
+        self.min_confidence = min_confidence
+
+    def locate(
+        self, minimap: np.ndarray, camera_angle: float, near: Point
+    ) -> Optional[Localization]:
+        """Find our tile from a minimap capture, searching near a known position.
+
+        Args:
+            minimap (np.ndarray): A BGR capture of the minimap (i.e. of
+                `RuneLiteWindow.minimap`) at its default zoom.
+            camera_angle (float): The compass angle when `minimap` was captured.
+            near (Point): The tile to search around (e.g. our last known position).
+
+        Returns:
+            Optional[Localization]: The best match, or None if it scored below
+                `min_confidence` or the search window falls outside of the atlas.
+        """
+        atlas = self.atlas
+        north_up = derotate_minimap(minimap, camera_angle)
+        mask = np.where(atlas._scale(minimap_mask(north_up)) > 127, 255, 0)
+        mask = mask.astype(np.uint8)
+        template = atlas._scale(north_up)
+        h, w = template.shape[:2]
+        # The window spans every placement of the template whose center lies within
+        # `search_radius` tiles of `near`.
+        col, row = atlas.tile_to_pixel(near)
+        pad = self.search_radius * atlas.pixels_per_tile
+        left, top = round(col - w / 2) - pad, round(row - h / 2) - pad
+        img_h, img_w = atlas.image.shape[:2]
+        x0, y0 = max(left, 0), max(top, 0)
+        x1, y1 = min(left + w + 2 * pad, img_w), min(top + h + 2 * pad, img_h)
+        if x1 - x0 < w or y1 - y0 < h:
+            return None
+        window = atlas.image[y0:y1, x0:x1]
+        scores = cv2.matchTemplate(window, template, cv2.TM_CCOEFF_NORMED, mask=mask)
+        # Flat or masked-out placements score NaN or infinity rather than a number.
+        scores = np.nan_to_num(scores, nan=-1.0, posinf=-1.0, neginf=-1.0)
+        _, confidence, _, (dx, dy) = cv2.minMaxLoc(scores)
+        if confidence < self.min_confidence:
+            return None
+        tile = atlas.pixel_to_tile(x0 + dx + w / 2, y0 + dy + h / 2)
+        return Localization(tile, float(confidence))
+
+
+_atlas: Optional[MinimapAtlas] = None
+_atlas_lock = threading.Lock()
+
+
+def get_minimap_atlas() -> Optional[MinimapAtlas]:
+    """Get the process-wide `MinimapAtlas`, loading it from disk on first use.
+
+    Returns:
+        Optional[MinimapAtlas]: The atlas at `MINIMAP_ATLAS_PATH`, or None if there is
+            no atlas on disk.
+    """
+    global _atlas
+    with _atlas_lock:
+        if _atlas is None and MINIMAP_ATLAS_PATH.exists():
+            _atlas = MinimapAtlas.load()
+        return _atlas
+
+
+if __name__ == "__main__":
+    """Run this file directly to build an atlas from, or check the localizer against,
+    stored minimap crops.
+
+    Each crop must be a PNG of `RuneLiteWindow.minimap` named after where it was
+    taken, as "<x>_<y>_<camera angle>.png" (e.g. "3165_3487_90.png"). With `--build`,
+    every crop is pasted into a new atlas spanning the given tiles. Otherwise, each
+    crop is located starting from a guess a few tiles off, and the error is reported,
+    e.g.:
+        python src/utilities/minimap_localizer.py recordings/minimap --build \
+            3136 3392 3263 3519
+        python src/utilities/minimap_localizer.py recordings/minimap --offset 5
+    """
+    parser = argparse.ArgumentParser(description="Build or evaluate a minimap atlas.")
+    parser.add_argument("crops", type=Path)
+    parser.add_argument("--atlas", type=Path, default=MINIMAP_ATLAS_PATH)
+    parser.add_argument(
+        "--build", type=int, nargs=4, metavar=("WEST", "SOUTH", "EAST", "NORTH")
+    )
+    parser.add_argument("--offset", type=int, default=4)
+    parser.add_argument("--radius", type=int, default=16)
+    args = parser.parse_args()
+
+    crops = []
+    for crop in sorted(args.crops.glob("*.png")):
+        x, y, angle = map(int, crop.stem.split("_"))
+        crops.append((crop.name, Point(x, y), angle, cv2.imread(str(crop))))
+
+    if args.build:
+        atlas = MinimapAtlas.blank(*args.build)
+        for _, tile, angle, minimap in crops:
+            atlas.paste(tile, minimap, angle)
+        atlas.save(args.atlas)
+        print(f"Saved an atlas of {len(crops)} crops to {args.atlas}.")
+        sys.exit()
+
+    localizer = MinimapLocalizer(MinimapAtlas.load(args.atlas), args.radius)
+    found, exact = 0, 0
+    for name, tile, angle, minimap in crops:
+        guess = Point(tile.x + args.offset, tile.y - args.offset)
+        fix = localizer.locate(minimap, angle, near=guess)
+        if fix is None:
+            print(f"{name}: no confident match")
+            continue
+        found += 1
+        error = max(abs(fix.tile.x - tile.x), abs(fix.tile.y - tile.y))
+        exact += error == 0
+        print(f"{name}: {fix.tile} (error {error}, score {fix.confidence:.2f})")
+    print(f"Located {found}/{len(crops)} crops, {exact} exactly.")
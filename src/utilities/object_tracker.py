@@ -0,0 +1,301 @@
+import itertools
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from utilities.color_util import Color, isolate_contours
+from utilities.extract_contours import extract_contours
+from utilities.frame_diff import FrameDiffer
+from utilities.geometry import Rectangle, RuneLiteObject, RuneLiteObjects
+
+# A bounding box measured as (xmin, ymin, xmax, ymax) relative to a `Rectangle`.
+BBox = Tuple[int, int, int, int]
+
+
+def _bbox(obj: RuneLiteObject) -> BBox:
+    """Get the bounding box of a `RuneLiteObject` as an (xmin, ymin, xmax, ymax) tuple.
+
+    Args:
+        obj (RuneLiteObject): The object to get the bounding box of.
+
+    Returns:
+        BBox: The bounding box of `obj`, relative to its reference `Rectangle`.
+    """
+    return obj.xmin, obj.ymin, obj.xmax, obj.ymax
+
+
+def _iou(a: BBox, b: BBox) -> float:
+    """Calculate the intersection over union (IoU) of two bounding boxes.
+
+    Args:
+        a (BBox): The first bounding box.
+        b (BBox): The second bounding box.
+
+    Returns:
+        float: The IoU, ranging from 0 (disjoint) to 1 (identical).
+    """
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    if w <= 0 or h <= 0:
+        return 0.0
+    inter = w * h
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _overlaps(a: BBox, b: BBox) -> bool:
+    """Determine whether two bounding boxes touch or overlap.
+
+    Args:
+        a (BBox): The first bounding box.
+        b (BBox): The second bounding box.
+
+    Returns:
+        bool: True if the bounding boxes share at least an edge, False otherwise.
+    """
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class ObjectTracker:
+    """Track color-marked objects across consecutive frames with stable IDs.
+
+    Gathering bots often poll `RuneLiteBot.find_colors` while waiting on a tree or a
+    rock, with each call detecting every object from scratch. `ObjectTracker` instead
+    remembers the objects it found on the previous frame and only re-detects objects
+    within the region of the frame that actually changed. Objects found in the changed
+    region are associated with previously-tracked objects by intersection over union
+    (IoU) first and centroid distance second, so that each physical object keeps the
+    same integer ID for as long as it remains visible.
+
+    Example:
+        tracker = ObjectTracker(self.win.game_view, self.cp.hsv.CYAN_MARK)
+        tracker.update()
+        tree_id = tracker.nearest_id()
+        ...
+        if tracker.has_disappeared(tree_id):
+            self.log_msg("The tree was chopped down.")
+    """
+
+    def __init__(
+        self,
+        rect: Rectangle,
+        colors: Union[Color, List[Color]],
+        iou_threshold: float = 0.3,
+        max_centroid_dist: float = 30,
+        max_misses: int = 0,
+        diff_threshold: float = 2.0,
+        margin: int = 10,
+    ) -> None:
+        """Initialize an `ObjectTracker`.
+
+        Args:
+            rect (Rectangle): The `Rectangle` to track objects within (e.g.
+                `Bot.win.game_view`).
+            colors (Union[Color, List[Color]]): The OpenCV-style HSV color of the
+                objects to track.
+            iou_threshold (float, optional): The minimum IoU for a detection to be
+                considered the same object as a tracked one. Defaults to 0.3.
+            max_centroid_dist (float, optional): If no tracked object overlaps a
+                detection enough, the maximum centroid distance in pixels for the two
+                to still be considered the same object. Defaults to 30.
+            max_misses (int, optional): The number of consecutive updates an object
+                may go undetected before it is considered to have disappeared.
+                Defaults to 0, meaning it disappears as soon as it goes undetected.
+            diff_threshold (float, optional): The mean absolute intensity difference
+                (0 to 255) above which a 16x16 tile is considered changed between
+                frames. Defaults to 2.0.
+            margin (int, optional): Padding in pixels added around the changed region
+                before re-detecting, so that objects straddling its edge are not cut
+                in half. Defaults to 10.
+        """
+        self.rect = rect
+        self.colors = colors
+        self.iou_threshold = iou_threshold
+        self.max_centroid_dist = max_centroid_dist
+        self.max_misses = max_misses
+        self.margin = margin
+        self.tracks: Dict[int, RuneLiteObject] = {}
+        self.disappeared: Set[int] = set()
+        self._misses: Dict[int, int] = {}
+        self._differ = FrameDiffer(threshold=diff_threshold)
+        self._ids = itertools.count()
+
+    def reset(self) -> None:
+        """Forget every tracked object and the previous frame."""
+        self.tracks.clear()
+        self.disappeared.clear()
+        self._misses.clear()
+        self._differ.reset()
+
+    def update(self, frame: Optional[np.ndarray] = None) -> Dict[int, RuneLiteObject]:
+        """Capture a new frame and update the tracked objects.
+
+        Args:
+            frame (Optional[np.ndarray], optional): A BGR capture of `self.rect` to use
+                instead of taking a new screenshot. Defaults to None.
+
+        Returns:
+            Dict[int, RuneLiteObject]: The currently-tracked objects, keyed by ID.
+        """
+        frame = self.rect.screenshot() if frame is None else frame
+        dirty = self._dirty_bbox(frame)
+        if dirty is None:  # Nothing changed, so every track is still valid.
+            return self.tracks
+        detections = self._detect(frame, dirty)
+        stale = {
+            tid: obj for tid, obj in self.tracks.items() if _overlaps(_bbox(obj), dirty)
+        }
+        self._associate(stale, detections)
+        return self.tracks
+
+    def _dirty_bbox(self, frame: np.ndarray) -> Optional[BBox]:
+        """Get the bounding box of the region that changed since the previous frame.
+
+        Args:
+            frame (np.ndarray): The current BGR frame.
+
+        Returns:
+            Optional[BBox]: The changed region (padded by `self.margin` and grown to
+                fully contain any tracked object it touches), the entire frame if there
+                is no usable previous frame, or None if nothing changed.
+        """
+        h, w = frame.shape[:2]
+        prev = self._differ.prev
+        first_frame = prev is None or prev.shape != frame.shape
+        self._differ.update(frame)
+        if first_frame:
+            return 0, 0, w, h
+        if (changed := self._differ.dirty_bbox()) is None:
+            return None
+        dirty = (
+            max(changed[0] - self.margin, 0),
+            max(changed[1] - self.margin, 0),
+            min(changed[2] + self.margin, w),
+            min(changed[3] + self.margin, h),
+        )
+        # Grow the region to fully contain the tracked objects it touches, so that
+        # those objects are re-detected in their entirety.
+        for obj in self.tracks.values():
+            box = _bbox(obj)
+            if _overlaps(box, dirty):
+                dirty = (
+                    max(min(dirty[0], box[0]), 0),
+                    max(min(dirty[1], box[1]), 0),
+                    min(max(dirty[2], box[2]), w),
+                    min(max(dirty[3], box[3]), h),
+                )
+        return dirty
+
+    def _detect(self, frame: np.ndarray, region: BBox) -> List[RuneLiteObject]:
+        """Detect objects within a region of a frame.
+
+        Args:
+            frame (np.ndarray): The current BGR frame.
+            region (BBox): The region of `frame` to search within.
+
+        Returns:
+            List[RuneLiteObject]: The detected objects, with coordinates shifted back
+                into the frame of `self.rect`.
+        """
+        x0, y0, x1, y1 = region
+        crop = np.ascontiguousarray(frame[y0:y1, x0:x1])
+        objs = extract_contours(isolate_contours(crop, self.colors))
+        shifted_domains = {}  # Large objects split into chunks share one domain.
+        for obj in objs:
+            key = id(obj.domain)
+            if key not in shifted_domains:
+                shifted_domains[key] = obj.domain + (y0, x0)  # Domain is (y, x)!
+            obj.domain = shifted_domains[key]
+            obj.xmin, obj.xmax = obj.xmin + x0, obj.xmax + x0
+            obj.ymin, obj.ymax = obj.ymin + y0, obj.ymax + y0
+            obj.set_rectangle_reference(self.rect)
+        return objs
+
+    def _associate(
+        self, stale: Dict[int, RuneLiteObject], detections: List[RuneLiteObject]
+    ) -> None:
+        """Match fresh detections to stale tracks, then update the tracks in place.
+
+        Matching is greedy: pairs are considered from highest to lowest IoU, and
+        remaining unmatched pairs from nearest to furthest centroid distance.
+
+        Args:
+            stale (Dict[int, RuneLiteObject]): Tracked objects within the changed
+                region that need to be re-confirmed.
+            detections (List[RuneLiteObject]): Objects detected in the changed region.
+        """
+        pairs = []
+        for tid, obj in stale.items():
+            box = _bbox(obj)
+            cx, cy = (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+            for j, det in enumerate(detections):
+                dbox = _bbox(det)
+                iou = _iou(box, dbox)
+                dist = np.hypot(
+                    (dbox[0] + dbox[2]) / 2 - cx, (dbox[1] + dbox[3]) / 2 - cy
+                )
+                if iou >= self.iou_threshold or dist <= self.max_centroid_dist:
+                    pairs.append((-iou, dist, tid, j))
+        matched_tracks, matched_dets = set(), set()
+        for _, _, tid, j in sorted(pairs):
+            if tid in matched_tracks or j in matched_dets:
+                continue
+            self.tracks[tid] = detections[j]
+            self._misses[tid] = 0
+            matched_tracks.add(tid)
+            matched_dets.add(j)
+        for tid in stale.keys() - matched_tracks:
+            self._misses[tid] = self._misses.get(tid, 0) + 1
+            if self._misses[tid] > self.max_misses:
+                del self.tracks[tid]
+                del self._misses[tid]
+                self.disappeared.add(tid)
+        for j, det in enumerate(detections):
+            if j not in matched_dets:
+                tid = next(self._ids)
+                self.tracks[tid] = det
+                self._misses[tid] = 0
+
+    @property
+    def objects(self) -> RuneLiteObjects:
+        """Get the currently-tracked objects as a `RuneLiteObjects` collection.
+
+        Returns:
+            RuneLiteObjects: The tracked objects, in order of increasing ID.
+        """
+        return RuneLiteObjects(
+            (self.tracks[tid] for tid in sorted(self.tracks)), rect=self.rect
+        )
+
+    def nearest_id(self, order: int = 0) -> Optional[int]:
+        """Get the ID of the tracked object `order`-th closest to the `rect` center.
+
+        Args:
+            order (int, optional): The zero-based order of the object, where 0 is the
+                closest object. Defaults to 0.
+
+        Returns:
+            Optional[int]: The ID of the object, or None if there are not enough
+                tracked objects.
+        """
+        ids = sorted(self.tracks)
+        objs = RuneLiteObjects((self.tracks[tid] for tid in ids), rect=self.rect)
+        if not 0 <= order < len(objs):
+            return None
+        return ids[int(np.argsort(objs.distances(), kind="stable")[order])]
+
+    def has_disappeared(self, tid: int, refresh: bool = True) -> bool:
+        """Determine whether a tracked object is no longer visible.
+
+        Args:
+            tid (int): The ID of the tracked object.
+            refresh (bool, optional): Whether to capture a new frame first. Defaults to
+                True.
+
+        Returns:
+            bool: True if the object is no longer tracked (e.g. a tree was chopped
+                down), False if it is still tracked.
+        """
+        if refresh:
+            self.update()
+        return tid not in self.tracks
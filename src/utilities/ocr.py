@@ -1,6 +1,6 @@
 from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -13,6 +13,7 @@ if __name__ == "__main__":
 
 import utilities.debug as debug
 from utilities.color_util import Color, ColorPalette, isolate_colors
+from utilities.executor import WorkerPool
 from utilities.geometry import Rectangle
 from utilities.mappings.problematic_chars import PROBLEMATIC_CHARS
 
@@ -73,12 +74,60 @@ QUILL = load_font("quill")  # Dimensions are (4-to-24) pixels x 31 pixels.
 QUILL_8 = load_font("quill_8")  # Dimensions are (3-to-16) pixels x 20 pixels.
 
 
+def _match_char(
+    image: cv2.Mat, template: cv2.Mat, threshold: float = 0.98
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find every top-left coordinate where a character template matches an image.
+
+    This is a module-level function (rather than a closure) so that it can be
+    submitted to a `WorkerPool` in either thread or process mode.
+
+    Args:
+        image (cv2.Mat): The thresholded image to search within.
+        template (cv2.Mat): The character template to search for.
+        threshold (float, optional): The minimum correlation coefficient for a match.
+            Defaults to 0.98.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The y-coordinates and x-coordinates of every
+            match, respectively.
+    """
+    correlation = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+    return np.where(correlation >= threshold)
+
+
+def _match_chars(
+    image: cv2.Mat, templates: Dict[str, cv2.Mat], pool: Optional[WorkerPool] = None
+) -> List[List]:
+    """Template match several characters in an image, optionally in parallel.
+
+    Args:
+        image (cv2.Mat): The thresholded image to search within.
+        templates (Dict[str, cv2.Mat]): A dictionary of {"char": template} pairs.
+        pool (Optional[WorkerPool], optional): A pool to spread the per-character
+            `matchTemplate` calls across. Defaults to None, matching sequentially.
+
+    Returns:
+        List[List]: A [char, x, y] list for every matched instance of every character.
+    """
+    if pool is None:
+        matches = [_match_char(image, template) for template in templates.values()]
+    else:
+        n = len(templates)
+        matches = pool.map(_match_char, [image] * n, templates.values())
+    char_list = []
+    for char, (y_mins, x_mins) in zip(templates, matches):
+        char_list.extend([char, x, y] for x, y in zip(x_mins, y_mins))
+    return char_list
+
+
 def scrape_text(
     rect: Rectangle,
     font: FontDict,
     colors: Union[Color, List[Color]],
     exclude_chars: Union[str, List[str]] = PROBLEMATIC_CHARS,
     include_only_chars: Union[str, List[str]] = None,
+    pool: Optional[WorkerPool] = None,
 ) -> str:
     """Extract text from a `Rectangle`.
 
@@ -93,6 +142,9 @@ def scrape_text(
             searching for text matches. Defaults to `PROBLEMATIC_CHARS`.
         include_only_chars (Union[str, List[str]], optional): Characters to include
             exclusively when searching for text matches. Defaults to None.
+        pool (Optional[WorkerPool], optional): A pool (e.g. `Bot.pool`) to spread the
+            per-character template matching across. Defaults to None, matching each
+            character sequentially.
 
     Returns:
         str: A single string containing all found text, in order, with no newlines nor
@@ -102,39 +154,35 @@ def scrape_text(
     img_bgr = rect.screenshot()
     image = isolate_colors(img_bgr, colors)
     result = ""
-    char_list = []
+    # Note that we trim off the first 1 or 2 rows of pixels from each template
+    # (depending on the font) to aid in `matchTemplate` finding a match.
+    row_skip = 2 if font is PLAIN_12 else 1
+    templates = {}
     for char in font:
         if include_only_chars is not None:
             if char not in include_only_chars:
                 continue
         elif char == " " or char in exclude_chars:
             continue
-        # Template match the character in the image. Note that we trim off the first 1
-        # or 2 rows of pixels from the template (depending on the font) to aid in
-        # `matchTemplate` finding a match.
-        row_skip = 2 if font is PLAIN_12 else 1
-        correlation = cv2.matchTemplate(
-            image, font[char][row_skip:], cv2.TM_CCOEFF_NORMED
-        )
-        # Note that `correlation` is a grayscale image with values between 0 and 1,
-        # indicating the match strength of the image to the template at each pixel
-        # location. Each element of `correlation` represents the correlation
-        # coefficient computed for the position of the template, as measured by the
-        # top-left corner of the template within the main image. The dimensions of this
-        # output image are (W - w + 1) x (H - h + 1).
-        y_mins, x_mins = np.where(correlation >= 0.98)
-        # For example, imagine a 3x4 pixel grid with a 2x2 template. The resulting
-        # `correlation` array would have (4 - 2 + 1, 3 - 2 + 1) = (3, 2) dimensions. If
-        # we think about sliding the 2x2 template around the 3x4 pixel grid, it only
-        # has 6 valid positions, each corresponding to a distinct coordinate for the
-        # template's upper-left corner. Recall that `Rectangle` objects have coordinate
-        # systems with an origin in the upper left hand corner, hence the top-left
-        # corner will have the rectangle's minimum x-value, and also it's minimum
-        # y-value.
-
-        # Add each matched instance of the current character to a list along with its
-        # top-left coordinate (e.g. char_list = [['A', 10, 5], ['A', 30, 25]]).
-        char_list.extend([char, x, y] for x, y in zip(x_mins, y_mins))
+        templates[char] = font[char][row_skip:]
+    # Template match each character in the image. Note that each correlation map is a
+    # grayscale image with values between 0 and 1, indicating the match strength of
+    # the image to the template at each pixel location. Each element of a correlation
+    # map is the correlation coefficient computed for the position of the template, as
+    # measured by the top-left corner of the template within the main image. The
+    # dimensions of this output image are (W - w + 1) x (H - h + 1).
+    #
+    # For example, imagine a 3x4 pixel grid with a 2x2 template. The resulting
+    # correlation array would have (4 - 2 + 1, 3 - 2 + 1) = (3, 2) dimensions. If we
+    # think about sliding the 2x2 template around the 3x4 pixel grid, it only has 6
+    # valid positions, each corresponding to a distinct coordinate for the template's
+    # upper-left corner. Recall that `Rectangle` objects have coordinate systems with
+    # an origin in the upper left hand corner, hence the top-left corner will have the
+    # rectangle's minimum x-value, and also it's minimum y-value.
+    #
+    # Each matched instance of each character is added to a list along with its
+    # top-left coordinate (e.g. char_list = [['A', 10, 5], ['A', 30, 25]]).
+    char_list = _match_chars(image, templates, pool)
     # Sort the char list based on which ones appear closest to the image top-left.
     char_list = sorted(char_list, key=itemgetter(2, 1))  # Sort by y first, then by x.
     # Lastly, join the characters into one continuous string.
@@ -146,6 +194,7 @@ def find_textbox(
     rect: Rectangle,
     font: FontDict,
     colors: Union[Color, List[Color]],
+    pool: Optional[WorkerPool] = None,
 ) -> List[Rectangle]:
     """Return exact text matches in a `Rectangle` as bounded `Rectangle` objects.
 
@@ -161,6 +210,9 @@ def find_textbox(
         colors (Union[Color, List[Color]]): The BGR colors of the text to search
             for. If multiple colors are provided, then a search for text with any of
             the specified colors is performed.
+        pool (Optional[WorkerPool], optional): A pool (e.g. `Bot.pool`) to spread the
+            per-character template matching across. Defaults to None, matching each
+            character sequentially.
     Returns:
         List[Rectangle]: A list of `Rectangle` objects, each corresponding to a
             bounding box of found text within the given `rect`.
@@ -168,21 +220,18 @@ def find_textbox(
     img_bgr = rect.screenshot()  # Screenshot and isolate colors.
     image = isolate_colors(img_bgr, colors)  # White characters on a black background.
     chars = "".join(set("".join(text))).replace(" ", "")  # Distinct input characters.
-    char_list = []
     row_skip = 2 if font is PLAIN_12 else 1
     # This small row skip is is crucial for accurately scraping 'PLAIN_12' text. It
     # aligns characters and removes excess padding, improving matching consistency with
     # the target image.
+    templates = {}
     for char in chars:
         try:
-            template = font[char][row_skip:]
+            templates[char] = font[char][row_skip:]
         except KeyError:
             text = text.replace(char, "")
             print(f"Font does not contain character: {char}. Omitting from search.")
-            continue
-        correlation = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
-        y_mins, x_mins = np.where(correlation >= 0.98)
-        char_list.extend([char, x, y] for x, y in zip(x_mins, y_mins))
+    char_list = _match_chars(image, templates, pool)
 
     # Sort the chars based on which ones appear closest to the top-left of the image.
     char_list = sorted(char_list, key=itemgetter(2, 1))  # Sort by y first, then by x.
@@ -0,0 +1,174 @@
+import time
+from typing import Callable, List, Optional, Sequence
+
+from utilities.geometry import Point
+
+GAME_TICK = 0.6  # Seconds per game tick, the rate at which characters move.
+
+
+def _chebyshev(a: Point, b: Point) -> int:
+    """Get the number of tiles between two tiles, moving diagonally as needed.
+
+    Args:
+        a (Point): The first tile.
+        b (Point): The second tile.
+
+    Returns:
+        int: The Chebyshev distance between `a` and `b`.
+    """
+    return max(abs(a.x - b.x), abs(a.y - b.y))
+
+
+class PositionEstimator:
+    """Predict our character's tile between reads of the tile overlay.
+
+    Reading our position means OCR-ing the tile overlay, and the `Walker` needs a
+    position several times per step (to check arrival, choose a target, and convert it
+    into a minimap click). Characters move at a fixed speed, though: one tile per game
+    tick while walking and two while running. So once a position has been read, and
+    we know which tiles we clicked our character toward, where it stands a moment
+    later can be predicted by dead reckoning.
+
+    `PositionEstimator` holds the last confirmed tile (a "fix") along with when it was
+    read, plus the course our character was last sent along. `estimate` advances the
+    fix along that course by the distance our character could have covered since, and
+    returns None once the fix is older than `max_age` seconds, which is the caller's
+    cue to read the position again and `confirm` it.
+
+    Example:
+        estimator = PositionEstimator()
+        if (posn := estimator.estimate()) is None:
+            posn = estimator.confirm(Point(*bot.get_world_point()[:2]))
+        ...  # Click toward `target`.
+        estimator.set_course(walk_path, target, running=bot.is_run_on())
+    """
+
+    WALK_SPEED: float = 1 / GAME_TICK  # Tiles per second.
+    RUN_SPEED: float = 2 / GAME_TICK
+
+    def __init__(
+        self,
+        max_age: float = 4 * GAME_TICK,
+        max_offset: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a `PositionEstimator`.
+
+        Args:
+            max_age (float, optional): How many seconds a fix may be extrapolated from
+                before the position must be read again. Defaults to four game ticks.
+            max_offset (int, optional): How many tiles a fix may lie from the current
+                course for our character to be considered still on it. Defaults to 2.
+            clock (Callable[[], float], optional): The time source, in seconds.
+                Defaults to `time.monotonic`.
+        """
+        self.max_age = max_age
+        self.max_offset = max_offset
+        self._clock = clock
+        self.fix: Optional[Point] = None
+        self.fixed_at = 0.0
+        self.reads = 0
+        self.estimates = 0
+        self._course: List[Point] = []
+        self._course_start = 0.0
+        self._speed = self.WALK_SPEED
+
+    def confirm(self, posn: Point) -> Point:
+        """Record a position that was just read, re-anchoring the course onto it.
+
+        If the position lies on the current course, the course is kept from its closest
+        tile onward (our character is still heading to the clicked tile). Otherwise,
+        the course is dropped and our character is assumed to stand still.
+
+        Args:
+            posn (Point): The tile our character was read to be on.
+
+        Returns:
+            Point: The same tile, for convenience.
+        """
+        now = self._clock()
+        self.fix, self.fixed_at = posn, now
+        self.reads += 1
+        if self._course:
+            dists = [_chebyshev(posn, tile) for tile in self._course]
+            # Among equally-close tiles, keep the one furthest along the course.
+            i = len(dists) - 1 - dists[::-1].index(min(dists))
+            if dists[i] <= self.max_offset and i < len(self._course) - 1:
+                self._course = [posn] + self._course[i + 1 :]
+                self._course_start = now
+            else:
+                self._course = []
+        return posn
+
+    def set_course(
+        self, path: Sequence[Point], target: Point, running: bool = False
+    ) -> None:
+        """Record that our character was just sent toward a tile along a path.
+
+        The course runs from the current estimate to the path's tile closest to it,
+        then along the path up to `target`. If `target` isn't on the path ahead, our
+        character is assumed to head straight for it.
+
+        Args:
+            path (Sequence[Point]): The path being walked.
+            target (Point): The tile our character was sent toward.
+            running (bool, optional): Whether our character runs rather than walks.
+                Defaults to False.
+        """
+        start = self._predict(self._clock()) if self.fix else None
+        self._speed = self.RUN_SPEED if running else self.WALK_SPEED
+        self._course_start = self._clock()
+        if start is None:
+            self._course = []
+            return
+        course = [start, target]
+        if path:
+            dists = [_chebyshev(start, tile) for tile in path]
+            i = dists.index(min(dists))
+            for j in range(i, len(path)):
+                if path[j] == target:
+                    course = [start] + list(path[i : j + 1])
+                    break
+        self._course = course
+        # The course now starts from the prediction, so advance the fix to match.
+        self.fix = start
+
+    def _predict(self, now: float) -> Point:
+        """Advance the fix along the course by the distance covered since it started.
+
+        Args:
+            now (float): The current time, per the estimator's clock.
+
+        Returns:
+            Point: The predicted tile, never beyond the end of the course.
+        """
+        if len(self._course) < 2:
+            return self.fix
+        remaining = self._speed * (now - self._course_start)
+        for a, b in zip(self._course, self._course[1:]):
+            leg = _chebyshev(a, b)
+            if remaining < leg:
+                # Interpolate within this leg, rounding to the nearest tile.
+                t = remaining / leg
+                return Point(round(a.x + (b.x - a.x) * t), round(a.y + (b.y - a.y) * t))
+            remaining -= leg
+        return self._course[-1]
+
+    def estimate(self) -> Optional[Point]:
+        """Predict our character's current tile, if the fix is still recent enough.
+
+        Returns:
+            Optional[Point]: The predicted tile, or None if there is no fix or it is
+                older than `max_age`, in which case the position should be read and
+                passed to `confirm`.
+        """
+        now = self._clock()
+        if self.fix is None or now - self.fixed_at > self.max_age:
+            return None
+        self.estimates += 1
+        return self._predict(now)
+
+    def reset(self) -> None:
+        """Forget the fix and course, forcing the next position to be read."""
+        self.fix = None
+        self._course = []
@@ -1,5 +1,6 @@
+import random
 import secrets
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 import numpy as np
 
@@ -7,6 +8,27 @@ import numpy as np
 # here avoids a circular import error when running `utilities.ocr` directly for testing.
 Point = NamedTuple("Point", x=int, y=int)
 
+# The generator behind the samplers below. See `seed`.
+_rng: random.Random = secrets.SystemRandom()
+
+
+def seed(value: Optional[int]) -> None:
+    """Seed the generator behind this module's samplers (e.g. to replay a session).
+
+    By default, samples are drawn from the operating system's entropy source (i.e.
+    `secrets.SystemRandom`), which can't be seeded. Seeding switches to a
+    `random.Random` seeded with `value`, so the same sequence of calls draws the same
+    samples, while seeding with None switches back to the entropy source.
+
+    Note that the samplers that draw from `numpy.random` are seeded with it instead.
+
+    Args:
+        value (Optional[int]): The seed, or None to stop drawing from a seeded
+            generator.
+    """
+    global _rng
+    _rng = secrets.SystemRandom() if value is None else random.Random(value)
+
 
 def random_point_around(point: Point, xpad: int, ypad: int) -> Point:
     """Return a pixel coordinate drawn from a Gaussian bell around a point.
@@ -36,10 +58,9 @@ def random_point_in(xmin: int, ymin: int, width: int, height: int) -> Point:
     Returns:
         Point: A random pixel coordinate within the bounding box.
     """
-    rng = secrets.SystemRandom()
     # Calculate the dimensions and position of an inner bounding box within the full
     # bounding box. This padding improves reliability.
-    padding_factor = rng.uniform(0.10, 0.15)
+    padding_factor = _rng.uniform(0.10, 0.15)
     inner_xmin = round(xmin + width * padding_factor)
     inner_ymin = round(ymin + height * padding_factor)
     inner_width = round(width * (1.000 - (padding_factor * 2)))
@@ -104,10 +125,9 @@ def trunc_norm_samp(lo: float, hi: float, mean=None, std=None) -> float:
     """
     mean = (lo + hi) / 2 if mean is None else mean
     std = (hi - lo) / 6 if std is None else std
-    rng = secrets.SystemRandom()
-    sample = rng.gauss(mean, std)
+    sample = _rng.gauss(mean, std)
     while sample < lo or sample > hi:
-        sample = rng.gauss(mean, std)
+        sample = _rng.gauss(mean, std)
     return sample
 
 
@@ -199,7 +219,7 @@ def random_chance(prob: float) -> bool:
         raise TypeError("Probability must be a float")
     if prob < 0.000 or prob > 1.000:
         raise ValueError("Probability must be between 0 and 1")
-    return secrets.SystemRandom().random() <= prob
+    return _rng.random() <= prob
 
 
 if __name__ == "__main__":
@@ -0,0 +1,457 @@
+import hashlib
+import json
+import random
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+import pyautogui as pag
+
+import utilities.random_util as rd
+from utilities.geometry import (
+    CaptureSource,
+    Point,
+    Rectangle,
+    grab_screen,
+    set_capture_source,
+)
+
+# The `pyautogui` functions that drive (or query) the mouse and keyboard.
+INPUT_FUNCTIONS = (
+    "click",
+    "hotkey",
+    "keyDown",
+    "keyUp",
+    "mouseDown",
+    "mouseUp",
+    "moveTo",
+    "position",
+    "press",
+    "scroll",
+    "size",
+    "write",
+)
+
+
+def _rect_key(rect: Rectangle) -> Tuple[int, int, int, int]:
+    """Get the hashable (left, top, width, height) of a `Rectangle`.
+
+    Args:
+        rect (Rectangle): The captured area.
+
+    Returns:
+        Tuple[int, int, int, int]: The area as a tuple of plain integers.
+    """
+    return (int(rect.left), int(rect.top), int(rect.width), int(rect.height))
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert an input argument or return value into something JSON can store.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: `value` itself if JSON-native, a list for tuples and arrays, or its
+            `repr` otherwise.
+    """
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (tuple, list, np.ndarray)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return repr(value)
+
+
+class SessionRecorder:
+    """Record every capture and every mouse/keyboard call of a live session.
+
+    While recording, a capture source (see `utilities.geometry.set_capture_source`) sits
+    in front of the live screen, logging each `Rectangle.screenshot`, and the
+    `pyautogui` input functions are wrapped to log each call. The random number
+    generators (`random`, `numpy.random`, and the one behind `utilities.random_util`)
+    are also seeded, with the seed stored alongside the session, so that a replay makes
+    the same random choices for as long as it sees the same frames. Once recording
+    stops, `utilities.random_util` goes back to drawing from the entropy source.
+
+    New frames are PNG-encoded on a background thread rather than on the thread that
+    captured them, so recording adds little more than a copy and a hash to a capture.
+
+    A session file is a ZIP archive holding:
+        - `session.json`: Metadata (screen size, random seed, duration, counts).
+        - `events.jsonl`: One JSON event per line, in the order they happened. Capture
+            events name the `Rectangle` captured and the frame served; input events
+            name the `pyautogui` function called, its arguments, and its result.
+        - `frames/<digest>.png`: Each distinct captured image, stored once.
+
+    Since frames are deduplicated by content digest, each repeated view (e.g. an
+    unchanged inventory) of an hour of play is stored only once, PNG-compressed.
+
+    Example:
+        with SessionRecorder("sessions/yew_banker.zip"):
+            bot.main_loop()
+
+        with SessionReplayer("sessions/yew_banker.zip") as replayer:
+            bot.main_loop()
+        print(replayer.stats())
+    """
+
+    def __init__(self, path: Union[str, Path], seed: Optional[int] = None) -> None:
+        """Initialize a `SessionRecorder`.
+
+        Args:
+            path (Union[str, Path]): Where to write the session file.
+            seed (Optional[int], optional): The seed for the random number
+                generators. Defaults to None, meaning a random seed.
+        """
+        self.path = Path(path)
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.events: List[Dict[str, Any]] = []
+        self.num_frames = 0  # Distinct frames stored.
+        self.num_bytes = 0  # Compressed bytes of the distinct frames stored.
+        self._digests = set()
+        self._lock = threading.Lock()
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._encoder: Optional[ThreadPoolExecutor] = None
+        self._previous_source: Optional[CaptureSource] = None
+        self._originals: Dict[str, Callable] = {}
+        self._start = 0.0
+        self._screen_size = (0, 0)
+
+    def _now(self) -> float:
+        """Get the number of seconds since recording started."""
+        return round(time.perf_counter() - self._start, 6)
+
+    def _capture(self, rect: Rectangle) -> np.ndarray:
+        """Capture a `Rectangle` and log the frame.
+
+        Args:
+            rect (Rectangle): The area to capture.
+
+        Returns:
+            np.ndarray: The captured BGR image, untouched.
+        """
+        img = (self._previous_source or grab_screen)(rect)
+        img = np.ascontiguousarray(img)
+        digest = hashlib.blake2b(img.tobytes(), digest_size=12)
+        digest.update(repr(img.shape).encode())
+        digest = digest.hexdigest()
+        with self._lock:
+            is_new = digest not in self._digests
+            self._digests.add(digest)
+            self.events.append(
+                {
+                    "t": self._now(),
+                    "type": "capture",
+                    "rect": _rect_key(rect),
+                    "frame": digest,
+                }
+            )
+        if is_new:
+            # The caller is free to draw on the capture, so the encoder gets a copy.
+            self._encoder.submit(self._store, digest, img.copy())
+        return img
+
+    def _store(self, digest: str, img: np.ndarray) -> None:
+        """Encode a new frame and write it to the session file (on the encoder thread).
+
+        Args:
+            digest (str): The frame's content digest.
+            img (np.ndarray): The captured BGR image.
+        """
+        # PNG is already compressed, so the archive stores frames as-is.
+        _, png = cv2.imencode(".png", img, [cv2.IMWRITE_PNG_COMPRESSION, 3])
+        with self._lock:
+            self._zip.writestr(f"frames/{digest}.png", png.tobytes())
+            self.num_frames += 1
+            self.num_bytes += png.nbytes
+
+    def _wrap(self, name: str, fn: Callable) -> Callable:
+        """Wrap a `pyautogui` function so each call is logged.
+
+        Args:
+            name (str): The name of the function.
+            fn (Callable): The original function.
+
+        Returns:
+            Callable: The logging wrapper.
+        """
+
+        def wrapper(*args, **kwargs):
+            t = self._now()
+            result = fn(*args, **kwargs)
+            event = {
+                "t": t,
+                "type": "input",
+                "fn": name,
+                "args": _jsonable(args),
+                "kwargs": {k: _jsonable(v) for k, v in kwargs.items()},
+                "result": _jsonable(result),
+            }
+            with self._lock:
+                self.events.append(event)
+            return result
+
+        return wrapper
+
+    def start(self) -> "SessionRecorder":
+        """Start recording.
+
+        Returns:
+            SessionRecorder: This recorder.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._zip = zipfile.ZipFile(self.path, "w", zipfile.ZIP_STORED)
+        self._encoder = ThreadPoolExecutor(1, thread_name_prefix="session")
+        random.seed(self.seed)
+        np.random.seed(self.seed)
+        rd.seed(self.seed)
+        self._screen_size = tuple(pag.size())
+        self._start = time.perf_counter()
+        self._previous_source = set_capture_source(self._capture)
+        for name in INPUT_FUNCTIONS:
+            self._originals[name] = fn = getattr(pag, name)
+            setattr(pag, name, self._wrap(name, fn))
+        return self
+
+    def stop(self) -> Path:
+        """Stop recording and finish writing the session file.
+
+        Returns:
+            Path: The path to the session file.
+        """
+        set_capture_source(self._previous_source)
+        for name, fn in self._originals.items():
+            setattr(pag, name, fn)
+        self._originals.clear()
+        rd.seed(None)
+        self._encoder.shutdown(wait=True)  # Finish writing every frame.
+        with self._lock:
+            metadata = {
+                "seed": self.seed,
+                "screen_size": list(self._screen_size),
+                "duration": self._now(),
+                "num_events": len(self.events),
+                "num_frames": self.num_frames,
+            }
+            lines = "\n".join(json.dumps(event) for event in self.events)
+            self._zip.writestr("events.jsonl", lines, zipfile.ZIP_DEFLATED)
+            self._zip.writestr("session.json", json.dumps(metadata, indent=2))
+            self._zip.close()
+        return self.path
+
+    def __enter__(self) -> "SessionRecorder":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class SessionReplayer:
+    """Replay a recorded session offline, as fast as possible.
+
+    While replaying, `Rectangle.screenshot` is served the recorded frames in the order
+    they were captured, the `pyautogui` input functions are replaced by stubs that
+    do nothing (returning the recorded values for queries like `position`), and,
+    optionally, `time.sleep` returns immediately (process-wide, for every module that
+    calls it as `time.sleep`). Running the same bot code against a
+    replayer therefore measures end-to-end vision throughput without a live client.
+
+    If the replayed code asks for a capture the recording doesn't have next (i.e. it
+    diverged from the recorded run), the next recorded capture of the same
+    `Rectangle` within `lookahead` events is served instead. Failing that, the most
+    recent frame of that `Rectangle` (or a black frame) is served, and the divergence
+    is counted.
+
+    Decoded frames are kept in a least-recently-used cache of `cache_size` frames, so
+    memory use stays bounded however long the session is.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        skip_sleep: bool = True,
+        lookahead: int = 256,
+        cache_size: int = 64,
+    ) -> None:
+        """Initialize a `SessionReplayer`.
+
+        Args:
+            path (Union[str, Path]): The session file to replay.
+            skip_sleep (bool, optional): Whether `time.sleep` should return
+                immediately during the replay. Defaults to True.
+            lookahead (int, optional): How many recorded events to skip ahead to find
+                a requested capture. Defaults to 256.
+            cache_size (int, optional): How many decoded frames to keep in memory.
+                Defaults to 64.
+        """
+        self.path = Path(path)
+        self.skip_sleep = skip_sleep
+        self.lookahead = lookahead
+        self.cache_size = cache_size
+        self._zip = zipfile.ZipFile(self.path, "r")
+        self.metadata: Dict[str, Any] = json.loads(self._zip.read("session.json"))
+        lines = self._zip.read("events.jsonl").decode().splitlines()
+        events = [json.loads(line) for line in lines if line]
+        self.captures = [
+            (tuple(e["rect"]), e["frame"]) for e in events if e["type"] == "capture"
+        ]
+        self.inputs = [e for e in events if e["type"] == "input"]
+        self._cursor = 0
+        self._input_cursors: Dict[str, int] = {}
+        self._last_frames: Dict[Tuple[int, int, int, int], str] = {}
+        self._decoded: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._previous_source: Optional[CaptureSource] = None
+        self._originals: Dict[str, Callable] = {}
+        self._sleep: Callable = time.sleep
+        self._mouse = Point(0, 0)
+        self.served = 0
+        self.divergences = 0
+        self._start = 0.0
+        self._elapsed = 0.0
+
+    def _frame(self, digest: str) -> np.ndarray:
+        """Decode a recorded frame, caching the result.
+
+        The least recently used frame is evicted once more than `cache_size` frames
+        are cached.
+
+        Args:
+            digest (str): The frame's content digest.
+
+        Returns:
+            np.ndarray: The decoded BGR frame (shared, so callers must copy it).
+        """
+        if digest in self._decoded:
+            self._decoded.move_to_end(digest)
+            return self._decoded[digest]
+        png = np.frombuffer(self._zip.read(f"frames/{digest}.png"), np.uint8)
+        frame = self._decoded[digest] = cv2.imdecode(png, cv2.IMREAD_COLOR)
+        if len(self._decoded) > self.cache_size:
+            self._decoded.popitem(last=False)
+        return frame
+
+    def _capture(self, rect: Rectangle) -> np.ndarray:
+        """Serve the recorded capture of a `Rectangle`.
+
+        Args:
+            rect (Rectangle): The area requested.
+
+        Returns:
+            np.ndarray: A copy of the recorded BGR frame.
+        """
+        key = _rect_key(rect)
+        with self._lock:
+            self.served += 1
+            stop = min(self._cursor + self.lookahead, len(self.captures))
+            for i in range(self._cursor, stop):
+                if self.captures[i][0] == key:
+                    if i != self._cursor:
+                        self.divergences += 1
+                    self._cursor = i + 1
+                    digest = self._last_frames[key] = self.captures[i][1]
+                    break
+            else:
+                self.divergences += 1
+                digest = self._last_frames.get(key)
+            if digest is None:
+                return np.zeros((rect.height, rect.width, 3), dtype=np.uint8)
+            return self._frame(digest).copy()
+
+    def _stub(self, name: str) -> Callable:
+        """Build a stand-in for a `pyautogui` function that doesn't touch any device.
+
+        Queries (`position` and `size`) return their next recorded result, falling
+        back to the last position moved to and the recorded screen size.
+
+        Args:
+            name (str): The name of the function.
+
+        Returns:
+            Callable: The stub.
+        """
+        recorded = [e["result"] for e in self.inputs if e["fn"] == name]
+
+        def stub(*args, **kwargs):
+            if name == "moveTo" and args:
+                x, y = args[0] if len(args) == 1 else args[:2]
+                self._mouse = Point(x, y)
+            if name not in ("position", "size"):
+                return None
+            with self._lock:
+                i = self._input_cursors.get(name, 0)
+                self._input_cursors[name] = i + 1
+            if i < len(recorded) and recorded[i] is not None:
+                return Point(*recorded[i][:2])
+            if name == "size":
+                return Point(*self.metadata["screen_size"])
+            return self._mouse
+
+        return stub
+
+    def start(self) -> "SessionReplayer":
+        """Start replaying.
+
+        Returns:
+            SessionReplayer: This replayer.
+        """
+        random.seed(self.metadata["seed"])
+        np.random.seed(self.metadata["seed"])
+        rd.seed(self.metadata["seed"])
+        self._previous_source = set_capture_source(self._capture)
+        for name in INPUT_FUNCTIONS:
+            self._originals[name] = getattr(pag, name)
+            setattr(pag, name, self._stub(name))
+        if self.skip_sleep:
+            time.sleep = lambda seconds: None
+        self._start = time.perf_counter()
+        return self
+
+    def stop(self) -> None:
+        """Stop replaying and restore the live capture source and input devices."""
+        self._elapsed = time.perf_counter() - self._start
+        time.sleep = self._sleep
+        rd.seed(None)
+        set_capture_source(self._previous_source)
+        for name, fn in self._originals.items():
+            setattr(pag, name, fn)
+        self._originals.clear()
+        self._zip.close()
+
+    @property
+    def finished(self) -> bool:
+        """Whether every recorded capture has been served."""
+        return self._cursor >= len(self.captures)
+
+    def stats(self) -> Dict[str, Any]:
+        """Summarize the replay.
+
+        Returns:
+            Dict[str, Any]: The number of captures served, divergences, and recorded
+                captures consumed, plus the replay's wall time, captures per second,
+                and speedup over the recorded session's duration.
+        """
+        elapsed = self._elapsed or time.perf_counter() - self._start
+        return {
+            "served": self.served,
+            "divergences": self.divergences,
+            "consumed": self._cursor,
+            "recorded": len(self.captures),
+            "elapsed": elapsed,
+            "captures_per_second": self.served / elapsed if elapsed else 0.0,
+            "speedup": self.metadata["duration"] / elapsed if elapsed else 0.0,
+        }
+
+    def __enter__(self) -> "SessionReplayer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -1,8 +1,9 @@
 import pickle
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import pynput.keyboard as keyboard
+if TYPE_CHECKING:
+    import pynput.keyboard as keyboard
 
 SETTINGS_PATH = Path(__file__).parents[1].joinpath("settings.pickle")
 
@@ -75,7 +76,7 @@ def delete(key: str) -> None:
         pickle.dump(data, file)
 
 
-def keybind_to_text(current_keys: List[keyboard.Key]) -> str:
+def keybind_to_text(current_keys: List["keyboard.Key"]) -> str:
     """Convert a list of keys into their corresponding symbolic representations.
 
     Args:
@@ -85,6 +86,8 @@ def keybind_to_text(current_keys: List[keyboard.Key]) -> str:
     Returns:
         str: The matching keys together in a string, each key separated by a plus sign.
     """
+    import pynput.keyboard as keyboard  # Needs a display, so import it only when used.
+
     hotkeys = []
     if current_keys:
         for key in current_keys:
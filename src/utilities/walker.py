@@ -1,21 +1,210 @@
 import math
 import time
-from typing import TYPE_CHECKING, List, Literal, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 
 if TYPE_CHECKING:
     from model import RuneLiteBot
 
 from utilities import random_util as rd
-from utilities.api.pathfinder import Pathfinder
-from utilities.geometry import Point
+from utilities.api.obstacles import ObstacleOverlay, get_obstacle_overlay
+from utilities.api.path_cache import PathCache, get_path_cache
+from utilities.api.pathfinder import Pathfinder, get_collision_map
+from utilities.api.route_table import get_route_table
+from utilities.api.transitions import Leg, Transition, get_transitions, split_legs
+from utilities.frame_diff import FrameDiffer
+from utilities.geometry import Point, WorldPoint
 from utilities.mappings import locations as loc
+from utilities.minimap_localizer import MinimapLocalizer, get_minimap_atlas
+from utilities.position_estimator import GAME_TICK, PositionEstimator
 
 WalkPath = Union[List[Point], List[Tuple[int]]]
-NamedDest = Union[str, Tuple[int, int]]
+NamedDest = Union[str, Tuple[int, int], Tuple[int, int, int]]
+PathHost = Literal["local", "remote", "dax", "osrspf"]
+PositionSource = Literal["ocr", "minimap"]
+
+
+class Hop(NamedTuple):
+    """One step of a walk, planned from a single reading of position and compass.
+
+    Attributes:
+        position (Point): Our position when the hop was planned, measured in tiles.
+        camera_angle (int): The compass angle (degrees clockwise from north) when the
+            hop was planned.
+        arrived (bool): Whether we were already within the destination area.
+        target (Optional[Point]): The tile to walk to next, or None if we have arrived
+            or no tile of the path is within reach.
+        offset (Optional[Point]): Where `target` lies relative to the minimap center,
+            in pixels, or None if there is no `target`.
+    """
+
+    position: Point
+    camera_angle: int
+    arrived: bool
+    target: Optional[Point]
+    offset: Optional[Point]
+
+
+def _first_move(a: Point, b: Point) -> Tuple[Point, Point]:
+    """Get the first move from one tile toward another, which may not be adjacent.
+
+    Args:
+        a (Point): The tile to move from.
+        b (Point): The tile to move toward.
+
+    Returns:
+        Tuple[Point, Point]: `a` and its neighbor in the direction of `b`.
+    """
+    return a, Point(a.x + (b.x > a.x) - (b.x < a.x), a.y + (b.y > a.y) - (b.y < a.y))
+
+
+class PathCursor:
+    """A `WalkPath` stored as an (N, 2) array of tiles, with a cursor marking progress.
+
+    Each step of a walk needs the furthest tile of the path within reach. Scanning the
+    whole path for it on every step repeats O(N) work thousands of times on long
+    cross-map paths. A `PathCursor` instead remembers the path tile we were last
+    nearest to, and searches only a window of tiles ahead of it, widening the window
+    only while the path is still within reach at its end. Each step is thus O(horizon)
+    rather than O(N).
+
+    Only the unbroken stretch of path within reach ahead of the cursor (the corridor)
+    is considered, so a path that doubles back around an obstacle (e.g. a wall) is
+    followed around it rather than cut across.
+
+    The cursor only moves forward, unless no tile ahead of it is within reach (e.g. we
+    were pushed off the path), in which case the whole path is searched once to find
+    our place on it again.
+    """
+
+    def __init__(self, walk_path: WalkPath, window: int = 64) -> None:
+        """Initialize a `PathCursor` at the start of a path.
+
+        Args:
+            walk_path (WalkPath): The path, as `Point` objects or (x, y[, plane])
+                tuples.
+            window (int, optional): How many tiles ahead of the cursor to search at
+                first. Defaults to 64.
+        """
+        steps = np.asarray(walk_path, dtype=np.int32).reshape(len(walk_path), -1)
+        self.steps = np.ascontiguousarray(steps[:, :2])
+        self.window = window
+        self.index = 0
+        self.target_index: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __getitem__(self, i: int) -> Point:
+        x, y = self.steps[i].tolist()
+        return Point(x, y)
+
+    def _distances(self, start: int, stop: int, posn: Point) -> np.ndarray:
+        """Get the Chebyshev distances from a tile to a slice of the path.
+
+        Args:
+            start (int): The index of the first path tile.
+            stop (int): The index after the last path tile.
+            posn (Point): The tile to measure from.
+
+        Returns:
+            np.ndarray: The distance to each tile in `steps[start:stop]`.
+        """
+        return np.abs(self.steps[start:stop] - (posn.x, posn.y)).max(axis=1)
+
+    def advance(self, posn: Point, horizon: int) -> Optional[int]:
+        """Move the cursor to our position and find the furthest tile within reach.
+
+        Args:
+            posn (Point): Our position, measured in tiles.
+            horizon (int): How many tiles away (along either axis) a tile may be to be
+                within reach.
+
+        Returns:
+            Optional[int]: The index of the last path tile of the corridor within
+                `horizon` tiles of `posn`, or None if no path tile is within reach.
+        """
+        start, window = self.index, self.window
+        while True:
+            stop = min(start + window, len(self.steps))
+            within = self._distances(start, stop, posn) <= horizon
+            if not within.any():
+                break
+            first = int(within.argmax())
+            gaps = np.flatnonzero(~within[first:])
+            if len(gaps) or stop == len(self.steps):
+                break
+            window *= 2  # The corridor may continue beyond the window.
+        if not within.any():
+            nearest = self.nearest(posn)
+            if self._distances(nearest, nearest + 1, posn)[0] > horizon:
+                self.target_index = None
+                return None
+            self.index = nearest
+            return self.advance(posn, horizon)
+        last = first + (int(gaps[0]) if len(gaps) else len(within) - first) - 1
+        # Among equally-near tiles of the corridor, keep the one furthest along.
+        dists = self._distances(start + first, start + last + 1, posn)
+        self.index = start + first + len(dists) - 1 - int(dists[::-1].argmin())
+        self.target_index = start + last
+        return self.target_index
+
+    def nearest(self, posn: Point, start: int = 0, stop: Optional[int] = None) -> int:
+        """Find the path tile nearest to a tile, searching the whole path by default.
+
+        Args:
+            posn (Point): The tile to measure from.
+            start (int, optional): The index of the first path tile to search.
+                Defaults to 0.
+            stop (Optional[int], optional): The index after the last path tile to
+                search. Defaults to None, meaning the end of the path.
+
+        Returns:
+            int: The index of the nearest path tile (the furthest along, if tied).
+        """
+        start = max(start, 0)
+        stop = len(self.steps) if stop is None else min(stop, len(self.steps))
+        dists = self._distances(start, stop, posn)
+        return start + len(dists) - 1 - int(dists[::-1].argmin())
+
+    def upcoming(self) -> List[Point]:
+        """Get the path from the cursor up to the last target found by `advance`.
+
+        Returns:
+            List[Point]: The tiles from `index` through `target_index`, or an empty
+                list if there is no target.
+        """
+        if self.target_index is None:
+            return []
+        steps = self.steps[self.index : self.target_index + 1].tolist()
+        return [Point(x, y) for x, y in steps]
 
 
 class Walker:
     PIXELS_PER_TILE: int = 4  # There are 4 pixels per tile on a default-scale minimap.
+    # Each pathfinder by name. "remote" races DAX and OSRSpathfinder concurrently.
+    PATH_HOSTS = {
+        "local": Pathfinder.get_path_local,
+        "remote": Pathfinder.get_path_remote,
+        "dax": Pathfinder.get_path_dax,
+        "osrspf": Pathfinder.get_path_osrspf,
+    }
+    PATH_HOST_NAMES = {
+        "local": "Local pathfinder",
+        "remote": "Remote pathfinding APIs",
+        "dax": "DAX API",
+        "osrspf": "OSRSPathfinder API",
+    }
 
     def __init__(
         self,
@@ -24,6 +213,14 @@ class Walker:
         max_waypoint_dist: int = 10,
         max_horizon: int = 12,
         reset_zoom_each_embark: bool = True,
+        path_cache: Optional[PathCache] = None,
+        position_estimator: Optional[PositionEstimator] = None,
+        position_source: PositionSource = "ocr",
+        localizer: Optional[MinimapLocalizer] = None,
+        stall_ticks: Optional[int] = 8,
+        max_replans: int = 3,
+        obstacles: Optional[ObstacleOverlay] = None,
+        on_transition: Optional[Callable[[Transition], bool]] = None,
     ) -> None:
         """Initialize a `RuneLiteBot` so we may equip it to walk.
 
@@ -37,6 +234,34 @@ class Walker:
                 when walking between waypoints. Defaults to 12 tiles.
             reset_zoom_each_embark: (bool, optional). Whether to reset the minimap zoom
                 each time before setting out to travel a given path. Defaults to True.
+            path_cache (Optional[PathCache], optional): Where to remember the paths
+                found, so that repeat trips need no pathfinding at all. Defaults to
+                None, meaning the process-wide cache (see `get_path_cache`).
+            position_estimator (Optional[PositionEstimator], optional): Predicts our
+                position between reads of the tile overlay while walking. Defaults to
+                None, meaning a `PositionEstimator` with the default settings.
+            position_source ("ocr" or "minimap", optional): Where to read our position
+                from: the tile overlay via OCR, or by finding the minimap within a
+                world-map atlas (see `MinimapLocalizer`). Minimap reads fall back to
+                OCR whenever they aren't confident. Defaults to "ocr".
+            localizer (Optional[MinimapLocalizer], optional): The localizer to use if
+                `position_source` is "minimap". Defaults to None, meaning one over the
+                process-wide atlas (see `get_minimap_atlas`), if there is one.
+            stall_ticks (Optional[int], optional): How many game ticks our position
+                may stay put mid-walk before the path ahead is deemed blocked, the
+                obstacle recorded, and the rest of the walk replanned around it (see
+                `replan`). Defaults to 8. None disables replanning.
+            max_replans (int, optional): How many times a single walk may be
+                replanned. Once it can't be replanned (any more), a stalled walk keeps
+                clicking along its path, in case the obstacle is temporary (e.g. a
+                gate being opened). Defaults to 3.
+            obstacles (Optional[ObstacleOverlay], optional): Where to record blocked
+                moves, so that future routes avoid them too. Defaults to None, meaning
+                the process-wide overlay (see `get_obstacle_overlay`).
+            on_transition (Optional[Callable[[Transition], bool]], optional): Uses a
+                transition (e.g. clicks the ladder it names with its action) once our
+                character stands on its source tile, returning whether that worked.
+                Defaults to None, meaning routes can't go beyond a single plane.
         """
         self.DEST_SQUARE_SIDE_LENGTH = dest_square_side_length
         self.MAX_WAYPOINT_DIST = max_waypoint_dist
@@ -44,37 +269,162 @@ class Walker:
         self.bot = rune_lite_bot
         self.reset_zoom_each_embark = reset_zoom_each_embark
         self.camera_angle = None
+        # The compass orb only changes when the camera rotates, so a cheap diff of it
+        # tells us when the (far costlier) angle estimate needs redoing.
+        self._compass_differ = FrameDiffer(tile_size=8)
         self.position = None
+        self.position_is_estimate = False
+        self.path_cache = get_path_cache() if path_cache is None else path_cache
+        self.estimator = position_estimator or PositionEstimator()
+        self.position_source = position_source
+        self.localizer = localizer
+        use_atlas = localizer is None and position_source == "minimap"
+        if use_atlas and (atlas := get_minimap_atlas()):
+            self.localizer = MinimapLocalizer(atlas)
+        self.running = False
+        self.stall_ticks = stall_ticks
+        self.max_replans = max_replans
+        self.obstacles = get_obstacle_overlay() if obstacles is None else obstacles
+        self._progress = -1  # The furthest path index a read position has reached.
+        self._progressed_at = 0.0
+        self.on_transition = on_transition
+        self.plane = 0
 
-    def _format_walk_path(self, walk_path_raw: List[Tuple[int]]) -> WalkPath:
-        """Convert a list of world point tuples into a list of `Point` objects.
+    def _format_walk_path(self, walk_path_raw: List[Tuple[int]]) -> List[WorldPoint]:
+        """Convert a list of world point tuples into a list of `WorldPoint` objects.
 
         Args:
             walk_path_raw (List[Tuple[int]]): A list of tuples representing an (x, y,
-                plane) world point.
+                plane) world point. The plane defaults to 0 where it's left out.
 
         Returns:
-            WalkPath: The same list of waypoints, but with `Point` objects rather than
-                tuples.
+            List[WorldPoint]: The same list of waypoints, but with `WorldPoint` objects
+                rather than tuples. Paths crossing planes can be split into legs with
+                `split_legs`.
         """
-        return [Point(world_point[0], world_point[1]) for world_point in walk_path_raw]
+        return [WorldPoint(*world_point[:3]) for world_point in walk_path_raw]
+
+    def locate_on_minimap(self) -> Optional[Tuple[int, int, int]]:
+        """Find our character's world point by matching the minimap against an atlas.
+
+        The search is centered on our last-known position, so at least one position
+        must have been read before (e.g. via the tile overlay). Note that the minimap
+        must be at its default zoom (see `reset_zoom_each_embark`).
 
-    def update_position(self) -> None:
+        Returns:
+            Optional[Tuple[int, int, int]]: The x-position, y-position, and plane of
+                our character, or None if there is no localizer or last-known position,
+                or no confident match.
+        """
+        if self.localizer is None or self.position is None:
+            return None
+        self.update_camera_angle()
+        minimap = self.bot.win.minimap.screenshot()
+        if fix := self.localizer.locate(minimap, self.camera_angle, near=self.loc):
+            return fix.tile.x, fix.tile.y, self.position[2]
+        return None
+
+    def read_position(self, attempts: int = 10) -> Tuple[int, int, int]:
+        """Read our character's world point from the minimap or tile overlay.
+
+        If `position_source` is "minimap", the minimap is tried first (see
+        `locate_on_minimap`), falling back to the tile overlay.
+
+        Args:
+            attempts (int, optional): How many times to try reading the overlay before
+                giving up. Defaults to 10.
+
+        Returns:
+            Tuple[int, int, int]: The x-position, y-position, and plane of our
+                character, measured in game tiles.
+
+        Raises:
+            RuntimeError: If the position couldn't be read after `attempts` tries
+                (e.g. the tile overlay is hidden).
+        """
+        if self.position_source == "minimap" and (posn := self.locate_on_minimap()):
+            return posn
+        for _ in range(attempts):
+            try:
+                posn = self.bot.get_world_point()
+            except ValueError:  # The OCR'd text wasn't a valid coordinate.
+                posn = None
+            if posn and posn[0] >= 0:
+                return posn
+            time.sleep(0.3)
+        raise RuntimeError(f"Could not read our position after {attempts} attempts.")
+
+    def update_position(self, confirm: bool = False) -> None:
         """Update the `position`, `x`, and `y` attributes.
 
+        The position is predicted by `self.estimator` while its last reading is recent
+        enough, and only read from the tile overlay (see `read_position`) otherwise,
+        or if `confirm` is True. `position_is_estimate` records which of the two
+        happened.
+
         Note that the returned position is measured in game tiles (rather than pixels).
+
+        Args:
+            confirm (bool, optional): Whether to read the position even if it could be
+                predicted. Defaults to False.
         """
-        while True:
-            if posn := self.bot.get_world_point():
-                break
-            time.sleep(0.3)
-        self.position = posn
-        self.x, self.y, _ = self.position  # Ignore the z-coordiunate (i.e. plane).
+        estimate = None if confirm else self.estimator.estimate()
+        if estimate is None:
+            x, y, plane = self.read_position()
+            self.estimator.confirm(Point(x, y))
+            self.position = (x, y, plane)
+        else:
+            plane = self.position[2] if self.position else 0
+            self.position = (estimate.x, estimate.y, plane)
+        self.position_is_estimate = estimate is not None
+        self.x, self.y, self.plane = self.position
         self.loc = Point(self.x, self.y)
 
-    def update_camera_angle(self) -> None:
-        """Update the `camera_angle` (measured as degrees clockwise from north)."""
-        self.camera_angle = self.bot.get_compass_angle()
+    def _track_progress(self, path: PathCursor) -> None:
+        """Note when a read position gets further along a path than ever before.
+
+        Args:
+            path (PathCursor): The path being walked.
+        """
+        if self.position_is_estimate:
+            return  # Predictions progress on their own, so only reads count.
+        # Only the cursor's window is searched, keeping each step O(horizon). It
+        # reaches back as well, since the cursor may have run ahead on predictions.
+        i = path.nearest(self.loc, path.index - path.window, path.index + path.window)
+        if i > self._progress:
+            self._progress = i
+            self._progressed_at = time.monotonic()
+
+    def _reset_progress(self) -> None:
+        """Forget our progress, so that stalling is only timed from the next read."""
+        self._progress = -1
+
+    def is_stalled(self) -> bool:
+        """Determine whether we've made no progress along the path for a while.
+
+        Returns:
+            bool: True if no read position got further along the path for
+                `stall_ticks` game ticks, False otherwise (or if `stall_ticks` is None).
+        """
+        if self.stall_ticks is None or self._progress < 0:
+            return False
+        return time.monotonic() - self._progressed_at > self.stall_ticks * GAME_TICK
+
+    def update_camera_angle(self, force: bool = False) -> None:
+        """Update the `camera_angle` (measured as degrees clockwise from north).
+
+        The compass orb is captured and compared to the previous capture. The angle is
+        only estimated again if the orb changed (i.e. the camera rotated), since the
+        camera rarely turns mid-walk.
+
+        Args:
+            force (bool, optional): Whether to estimate the angle even if the compass
+                appears unchanged. Defaults to False.
+        """
+        compass = self.bot.win.compass_orb.screenshot()
+        changed = self._compass_differ.changed(compass)
+        if force or changed or self.camera_angle is None:
+            self.camera_angle = self.bot.get_compass_angle(compass)
 
     def get_pixel_distance(self, dest: Point) -> Point:
         """Find the distance from minimap center to a destination point in pixels.
@@ -92,6 +442,18 @@ class Walker:
         """
         self.update_position()
         self.update_camera_angle()
+        return self._minimap_offset(dest)
+
+    def _minimap_offset(self, dest: Point) -> Point:
+        """Project a tile onto the minimap from our last-known position and angle.
+
+        Args:
+            dest (Point): Destination xy-coordinate, measured in tiles.
+
+        Returns:
+            Point: A `Point` representing a pixel coordinate relative to the center of
+                the minimap, accounting for any rotation.
+        """
         theta = math.radians(self.camera_angle)  # Convert degrees clockwise to radians.
 
         # Convert the tile-space difference between our current location and desired
@@ -106,53 +468,80 @@ class Walker:
 
         return Point(x_mini, y_mini)
 
-    def change_position(self, dest: Point) -> None:
+    def change_position(
+        self, dest: Point, walk_path: Optional[WalkPath] = None
+    ) -> None:
         """Click a point on the minimap and thus command our character to walk there.
 
         Args:
-            dest (Point): The destination xy-coordinate in potentially-rotated minimap
-                pixel space.
+            dest (Point): The destination xy-coordinate, measured in tiles.
+            walk_path (Optional[WalkPath], optional): The path `dest` lies on, which
+                lets `self.estimator` predict our position as we follow it. Defaults to
+                None, meaning we are predicted to head straight for `dest`.
         """
-        self.update_position()
-        if dist_mini := self.get_pixel_distance(dest):
-            minimap_center = self.bot.win.minimap.center
-            x_new = round(minimap_center.x + dist_mini.x)
-            y_new = round(minimap_center.y + dist_mini.y)
-            self.bot.mouse.move_to(Point(x_new, y_new))
-            self.bot.mouse.click()
-            self.bot.sleep()
-
-    def get_target_posn(self, walk_path: WalkPath) -> Point:
+        self._click_minimap(self.get_pixel_distance(dest), dest, walk_path)
+
+    def _click_minimap(
+        self, offset: Point, dest: Point, walk_path: Optional[WalkPath] = None
+    ) -> None:
+        """Click the minimap at an offset from its center to walk toward a tile.
+
+        Args:
+            offset (Point): Where `dest` lies relative to the minimap center, in
+                pixels.
+            dest (Point): The destination xy-coordinate, measured in tiles.
+            walk_path (Optional[WalkPath], optional): The path `dest` lies on. See
+                `change_position`. Defaults to None.
+        """
+        minimap_center = self.bot.win.minimap.center
+        x_new = round(minimap_center.x + offset.x)
+        y_new = round(minimap_center.y + offset.y)
+        self.bot.mouse.move_to(Point(x_new, y_new))
+        self.bot.mouse.click()
+        self.estimator.set_course(walk_path or [], dest, running=self.running)
+        self.bot.sleep()
+
+    def get_target_posn(self, walk_path: Union[WalkPath, PathCursor]) -> Point:
         """Get the furthest-away coordinate to the destination within a boundary.
 
-        Get the furthest-away `Point` within `self.MAX_HORIZON` tiles by searching from
-        the destination `Point` backward to our current position.
+        Get the furthest-away `Point` within `self.MAX_HORIZON` tiles of our current
+        position, searching ahead from our progress along the path so far (see
+        `PathCursor`).
 
         Args:
-            walk_path (WalkPath): A list of `Point` tuples describing our character's
-                travel path.
+            walk_path (Union[WalkPath, PathCursor]): A list of `Point` tuples
+                describing our character's travel path, or a `PathCursor` over it to
+                resume from.
 
         Returns:
             Point: The next target point to walk to, measured in tile space.
         """
+        if not isinstance(walk_path, PathCursor):
+            walk_path = PathCursor(walk_path)
         self.update_position()
-        # Using a generator for back-to-front search improves performance.
-        try:
-            ind = next(
-                i
-                for i in range(len(walk_path) - 1, -1, -1)
-                if (
-                    abs(walk_path[i].x - self.x) <= self.MAX_HORIZON
-                    and abs(walk_path[i].y - self.y) <= self.MAX_HORIZON
-                )
-            )
-            self.bot.log_msg(
-                f"Walking progress: {ind}/{len(walk_path)}", overwrite=True
-            )
-            return walk_path[ind]
-        except StopIteration:
+        return self._next_target(walk_path)
+
+    def _next_target(self, path: PathCursor) -> Optional[Point]:
+        """Get the next target point to walk to from our last-known position.
+
+        Args:
+            path (PathCursor): Our travel path and progress along it.
+
+        Returns:
+            Optional[Point]: The next target point to walk to, measured in tile space,
+                or None if no point of the path is within `self.MAX_HORIZON`.
+        """
+        ind = path.advance(self.loc, self.MAX_HORIZON)
+        if ind is None and self.position_is_estimate:
+            # The prediction may have drifted off the path, so read it to be sure.
+            self.update_position(confirm=True)
+            ind = path.advance(self.loc, self.MAX_HORIZON)
+        if ind is None:
             msg = "Travel halted. An obstacle (e.g. a gate) may be blocking the path."
             self.bot.log_msg(msg)
+            return None
+        self.bot.log_msg(f"Walking progress: {ind}/{len(path)}", overwrite=True)
+        return path[ind]
 
     def has_arrived(self, dest: Point, pad: int = None) -> bool:
         """Return True if our position in tile-space is within a bounding area.
@@ -171,18 +560,139 @@ class Walker:
                    p1-----.-----`
                 Note that `pad=0` corresponds to the exact destination tile.
 
+        Returns:
+            bool: True if we have arrived within the destination area, False otherwise.
+        """
+        self.update_position()
+        return self._arrived(dest, pad)
+
+    def _arrived(self, dest: Point, pad: int = None) -> bool:
+        """Return True if our last-known position is within a destination area.
+
+        A predicted position within the area is confirmed by reading it first.
+
+        Args:
+            dest (Point): The destination `Point`. See `has_arrived`.
+            pad (int, optional): The padding around `dest`. See `has_arrived`.
+
         Returns:
             bool: True if we have arrived within the destination area, False otherwise.
         """
         pad = pad or self.DEST_SQUARE_SIDE_LENGTH // 2
+        if self._is_within(dest, pad) and self.position_is_estimate:
+            # Only a read position is trusted to end the walk.
+            self.update_position(confirm=True)
+        return self._is_within(dest, pad)
+
+    def _is_within(self, dest: Point, pad: int) -> bool:
+        """Return True if our last-known position is within a square around a tile.
+
+        Args:
+            dest (Point): The midpoint of the square, measured in tiles.
+            pad (int): How many tiles the square extends to each side of `dest`.
+
+        Returns:
+            bool: True if `self.x` and `self.y` lie within the square, False otherwise.
+        """
+        return abs(self.x - dest.x) <= pad and abs(self.y - dest.y) <= pad
+
+    def plan_hop(self, path: PathCursor, dest: Point) -> Hop:
+        """Plan the next step of a walk from one reading of position and compass.
+
+        Our position and the camera angle are each updated exactly once (both are
+        usually served without any OCR or angle estimation; see `update_position` and
+        `update_camera_angle`), and everything the step needs is derived from that
+        snapshot, so arrival, target, and click offset always agree with one another.
+
+        Args:
+            path (PathCursor): The path being walked along, and our progress on it.
+            dest (Point): The destination `Point` to define an arrival area around.
+
+        Returns:
+            Hop: The planned step.
+        """
         self.update_position()
-        if pad == 0:
-            return self.x == dest.x and self.y == dest.y
-        p1 = Point(dest.x - pad, dest.y - pad)
-        p2 = Point(dest.x + pad, dest.y + pad)
-        within_x_range = p1.x <= self.x <= p2.x
-        within_y_range = p1.y <= self.y <= p2.y
-        return within_x_range and within_y_range
+        self.update_camera_angle()
+        if self._arrived(dest):
+            return Hop(self.loc, self.camera_angle, True, None, None)
+        target = self._next_target(path)
+        offset = None if target is None else self._minimap_offset(target)
+        return Hop(self.loc, self.camera_angle, False, target, offset)
+
+    def replan(
+        self, path: PathCursor, dest: Point, stalled: bool = True
+    ) -> Optional[PathCursor]:
+        """Record the obstacle ahead of us on a path, then find a path around it.
+
+        If we stalled while on the path, the obstacle lies somewhere along the stretch
+        of `path` between our position and the furthest tile within reach, so every
+        move along that stretch is blocked in `self.obstacles` (and any cached path
+        through it is forgotten). The new path, and every later route, then detours
+        around it where possible. If we're off the path instead (e.g. we were pushed
+        off it), nothing is known to block it, so the walk is only replanned from where
+        we are.
+
+        Note that obstacles are only recorded on plane 0, and only if there is a
+        collision map to route around them with (see `Pathfinder._find_leg`), though
+        the walk is replanned on any plane, falling back to the remote pathfinders.
+
+        Args:
+            path (PathCursor): The path we got stuck on.
+            dest (Point): The destination of the walk.
+            stalled (bool, optional): Whether we replan because progress stalled,
+                rather than because no tile of the path is within reach. Defaults to
+                True.
+
+        Returns:
+            Optional[PathCursor]: The new path, or None if there is none.
+        """
+        self.update_position(confirm=True)
+        on_path = path.advance(self.loc, self.MAX_HORIZON) is not None
+        if stalled and on_path:
+            self.bot.log_msg("Progress stalled. Replanning around the obstacle...")
+            if self.plane == 0 and get_collision_map(0) is not None:
+                self._record_obstacle(path)
+        else:
+            self.bot.log_msg("Off the path. Replanning from here...")
+        self._reset_progress()
+        self.estimator.reset()
+        p1 = WorldPoint(self.x, self.y, self.plane)
+        p2 = WorldPoint(dest.x, dest.y, self.plane)
+        if walk_path := self.get_api_walk_path(p1, p2, host="local", fallback=True):
+            return PathCursor(walk_path)
+        self.bot.log_msg("No path around the obstacle was found.")
+        return None
+
+    def _record_obstacle(self, path: PathCursor) -> None:
+        """Block the moves between our position and the furthest tile within reach.
+
+        Args:
+            path (PathCursor): The path we got stuck on, with a tile within reach
+                (i.e. `target_index` isn't None).
+        """
+        # The cursor may have run ahead of us on predicted positions, so our place on
+        # the path is found afresh. The nearest tile may be one we're stuck next to
+        # rather than on, so the move into it is blocked too.
+        start, end = max(path.nearest(self.loc) - 1, 0), path.target_index
+        if end <= start:
+            end = min(start + 3, len(path) - 1)
+        moves = [_first_move(path[i], path[i + 1]) for i in range(start, end)]
+        self.obstacles.block(moves)
+        self.path_cache.evict_through(step for _, step in moves)
+
+    def _crosses_obstacle(self, walk_path: List[Point]) -> bool:
+        """Check whether a path makes any move recorded as blocked in `self.obstacles`.
+
+        Args:
+            walk_path (List[Point]): The path to check.
+
+        Returns:
+            bool: True if any move along the path is penalized, False otherwise.
+        """
+        if not (penalties := self.obstacles.penalties()):
+            return False
+        moves = map(_first_move, walk_path, walk_path[1:])
+        return any(move in penalties for move in moves)
 
     def walk(self, walk_path: WalkPath, dest: Point = None) -> bool:
         """Walk along a `WalkPath` to a destination area.
@@ -200,28 +710,37 @@ class Walker:
         Returns:
             bool: True if the specified destination was reached, False otherwise.
         """
-        walk_path = (
-            walk_path
-            if isinstance(walk_path[-1], Point)
-            else self._format_walk_path(walk_path)
-        )
-        dest = dest or walk_path[-1]
+        path = PathCursor(walk_path)
+        dest = dest or path[-1]
 
         try:
-            embarking = True
+            self.running = self.bot.is_run_on()
+            self.update_position(confirm=True)
+            self.update_camera_angle(force=True)
             self.bot.log_msg("Embarking...")
-            while not self.has_arrived(dest):
-                new_pos = self.get_target_posn(walk_path)
-                if self.reset_zoom_each_embark and embarking:
-                    minimap_center = self.bot.win.minimap.center
-                    self.bot.mouse.move_to(
-                        rd.random_point_around(minimap_center, xpad=10, ypad=10)
-                    )
-                    self.bot.mouse.right_click()
-                    embarking = False
-                if self.has_arrived(dest):  # Double-checking helps us stop gracefully.
-                    break
-                self.change_position(new_pos)
+            if self.reset_zoom_each_embark:
+                minimap_center = self.bot.win.minimap.center
+                self.bot.mouse.move_to(
+                    rd.random_point_around(minimap_center, xpad=10, ypad=10)
+                )
+                self.bot.mouse.right_click()
+            self._reset_progress()
+            replans = 0
+            while not (hop := self.plan_hop(path, dest)).arrived:
+                self._track_progress(path)
+                if hop.target is None or self.is_stalled():
+                    stalled = hop.target is not None
+                    new_path = None
+                    if self.stall_ticks is not None and replans < self.max_replans:
+                        replans += 1
+                        new_path = self.replan(path, dest, stalled)
+                    if new_path is not None:
+                        path = new_path
+                        continue
+                    if not stalled:
+                        return False
+                    self._reset_progress()  # Keep clicking, since it may clear up.
+                self._click_minimap(hop.offset, hop.target, path.upcoming())
             return True
         except Exception as exc:
             msg = (
@@ -231,43 +750,218 @@ class Walker:
             self.bot.log_msg(msg)
             return False
 
+    def take_transition(self, transition: Transition, timeout: float = None) -> bool:
+        """Use a transition (e.g. a ladder) and wait to arrive on its far side.
+
+        Our character must already stand on the transition's source tile. Using it is
+        up to `on_transition`, since only the bot knows how to find the object on
+        screen (e.g. by its tagged color).
+
+        Args:
+            transition (Transition): The transition to use.
+            timeout (float, optional): How many seconds to wait to arrive. Defaults to
+                None, meaning ten game ticks plus the transition's cost.
+
+        Returns:
+            bool: True if we arrived within a couple of tiles of the transition's
+                destination, False otherwise.
+        """
+        name = transition.name or "transition"
+        if self.on_transition is None:
+            self.bot.log_msg(f"No way to use the {name} at {transition.source}.")
+            return False
+        self.bot.log_msg(f"Using the {name}...")
+        if not self.on_transition(transition):
+            return False
+        # Positions on the far side have nothing to do with the course walked so far.
+        self.estimator.reset()
+        if timeout is None:
+            timeout = (10 + transition.cost) * GAME_TICK
+        dest = transition.dest
+        deadline = time.monotonic() + timeout
+        while True:
+            self.update_position(confirm=True)
+            if self.plane == dest.plane and self._is_within(Point(dest.x, dest.y), 2):
+                return True
+            if time.monotonic() > deadline:
+                self.bot.log_msg(f"Did not make it past the {name}.")
+                return False
+            time.sleep(GAME_TICK)
+
+    def walk_route(self, route: List[Leg], dest: Point = None) -> bool:
+        """Walk a route leg by leg, using the transition at the end of each leg.
+
+        Args:
+            route (List[Leg]): The legs to walk (see `get_route`).
+            dest (Point, optional): The destination `Point` to define an arrival area
+                around at the end of the last leg. Defaults to None, meaning its last
+                `Point`.
+
+        Returns:
+            bool: True if the specified destination was reached, False otherwise.
+        """
+        if not route:
+            self.bot.log_msg("No route to walk.")
+            return False
+        for leg in route:
+            if leg.transition is None:
+                return self.walk(leg.path, dest)
+            if not (self.walk(leg.path) and self.take_transition(leg.transition)):
+                return False
+        return True
+
     def walk_to(
-        self, dest: Union[NamedDest, Point], host: Literal["dax", "osrspf"] = "dax"
+        self,
+        dest: Union[NamedDest, Point],
+        host: PathHost = "local",
+        fallback: bool = True,
     ) -> bool:
-        """Use an API-generated `WalkPath` to travel to a destination.
+        """Use a generated route to travel to a destination.
 
-        Note that DAX is more reliable than OSRSpathfinder. OSRSpathfinder periodically
-        fails in certain locations. Why this occurs isn't immediately obvious.
+        The shortest path between our character's current position in the center of
+        the game view and a desired location on the map (measured in tiles) is
+        calculated via the A* (pronounced "A-star") pathfinding algorithm, either
+        in-process over a local collision map (see `Pathfinder.get_path_local`) or by
+        a remote API hosted by explv-map (i.e. DAX) or OSRSpathfinder. Destinations on
+        another plane, or in a dungeon, are reached by a route of several legs joined
+        by stairs, ladders, and the like (see `get_route`).
 
-        The pathfinding API hosted by either OSRSpathfinder or explv-map (i.e. DAX)
-        calculates the shortest path between our character's current position in the
-        center of the game view and a desired location on the map (measured in tiles)
-        via the A* (pronounced "A-star") pathfinding algorithm.
+        Note that the local pathfinder is by far the fastest, since it makes no
+        network requests. Of the remote APIs, DAX is more reliable than
+        OSRSpathfinder, which periodically fails in certain locations. Why this occurs
+        isn't immediately obvious. Falling back to "remote" queries both at once and
+        takes whichever valid path arrives first (see `Pathfinder.get_path_remote`).
 
         Args:
-            dest Union[NamedDest, Point]: Any `Point`, or perhaps instead a string name
-                (i.e."VARROCK_SQUARE") associated with a destination listed in
-                `utilities.locations`.
-            host ("dax" or "osrspf"): Whether to use the DAX or OSRSpathfinder
-                pathfinding API. Defaults to the more reliable "dax".
+            dest Union[NamedDest, Point]: Any `Point` or (x, y, plane) world point, or
+                perhaps instead a string name (i.e."VARROCK_SQUARE") associated with a
+                destination listed in `utilities.locations`. Destinations without a
+                plane are taken to be on plane 0.
+            host ("local", "remote", "dax", or "osrspf"): Which pathfinder to try
+                first. Defaults to "local".
+            fallback (bool, optional): Whether to fall back to the local pathfinder,
+                then to racing the remote APIs, if `host` finds no path. Defaults to
+                True.
 
         Returns:
             bool: True if the specified destination was reached, False otherwise.
         """
-        self.update_position()
+        self.update_position(confirm=True)
+        name = dest if isinstance(dest, str) else None
         dest = (  # `dest` is a `Point` measured in tile space.
             getattr(loc, dest)  # If named, look it up in `utlities.mappings.locations`.
             if isinstance(dest, str)
             else dest
         )
-        dest = Point(dest[0], dest[1])
-        path = self.get_api_walk_path(p1=self.loc, p2=dest, host=host)
-        return self.walk(path, dest)
+        dest = WorldPoint(*dest[:3])
+        route = self.get_route(dest, name, host, fallback)
+        return self.walk_route(route, Point(dest.x, dest.y))
+
+    def get_route(
+        self,
+        dest: WorldPoint,
+        name: Optional[str] = None,
+        host: PathHost = "local",
+        fallback: bool = False,
+    ) -> List[Leg]:
+        """Plan a route from our position to a destination, possibly across planes.
+
+        On our own plane, a precomputed (see `get_table_walk_path`) or cached path is
+        used if there is one. Otherwise, each pathfinder is tried in turn: the local
+        one searches the known transitions together with each plane's collision map
+        (see `Pathfinder.get_route_local`), while paths from the remote APIs are split
+        into legs wherever they change plane (see `split_legs`).
+
+        Args:
+            dest (WorldPoint): The destination of the route.
+            name (Optional[str], optional): The name of the destination in
+                `utilities.mappings.locations`, if it has one. Defaults to None.
+            host ("local", "remote", "dax", or "osrspf"): Which pathfinder to try
+                first. Defaults to "local".
+            fallback (bool, optional): Whether to fall back to the local pathfinder,
+                then to racing the remote APIs, if `host` finds no route. Defaults to
+                False.
+
+        Returns:
+            List[Leg]: The legs of the route, each with waypoints added, or an empty
+                list if no route was found.
+        """
+        start = WorldPoint(self.x, self.y, self.plane)
+        hosts = self._path_hosts(host, fallback)
+        if dest.plane == start.plane:
+            path = []
+            if name is not None:
+                path = self.get_table_walk_path(self.loc, name, host, fallback)
+            for other in hosts:
+                if path:
+                    break
+                if path_raw := self.path_cache.get(start, dest, other):
+                    self.path_cache.flush()  # Save when it was used, for LRU eviction.
+                    path = self.add_waypoints(path_raw)
+            if path:
+                return [Leg(start.plane, path, None)]
+        for other in hosts:
+            if other == "local":
+                route = Pathfinder.get_route_local(start, dest)
+            else:
+                path_raw = self.PATH_HOSTS[other](start, dest)
+                route = split_legs(path_raw, get_transitions())
+            if route:
+                if len(route) == 1:
+                    self.path_cache.put(start, dest, other, route[0].path)
+                return [
+                    leg._replace(path=self.add_waypoints(leg.path)) for leg in route
+                ]
+            host_name = self.PATH_HOST_NAMES[other]
+            msg = f"{host_name} request for shortest route failed ({start} -> {dest})."
+            self.bot.log_msg(msg)
+        return []
+
+    def get_table_walk_path(
+        self, p1: Point, name: str, host: PathHost, fallback: bool = False
+    ) -> WalkPath:
+        """Build a `WalkPath` to a named location from the precomputed route table.
+
+        The precomputed route to `name` passing closest to `p1` is followed from that
+        closest tile onward. If that tile is beyond `MAX_HORIZON`, a short leg onto it
+        is pathfound live (see `get_api_walk_path`) and prepended.
+
+        The route table doesn't know about obstacles recorded since it was built (see
+        `replan`), so a route making any blocked move is skipped, leaving the live
+        pathfinders to route around the obstacle.
+
+        Args:
+            p1 (Point): The start of the path (e.g. our position).
+            name (str): The name of a destination in `utilities.mappings.locations`.
+            host ("local", "remote", "dax", or "osrspf"): The pathfinder for the leg
+                onto the route.
+            fallback (bool, optional): Whether the leg may fall back to the other
+                pathfinders. Defaults to False.
+
+        Returns:
+            WalkPath: The path to `name`, or an empty list if there is no route table,
+                no route to `name` clear of known obstacles, or no leg onto it.
+        """
+        if (table := get_route_table()) is None:
+            return []
+        if not (route := table.route_to(name, p1)):
+            return []
+        if self._crosses_obstacle(route):
+            self.bot.log_msg(
+                f"The precomputed route to {name} is blocked. Rerouting..."
+            )
+            return []
+        gap = max(abs(route[0].x - p1.x), abs(route[0].y - p1.y))
+        if gap <= self.MAX_HORIZON:
+            return self.add_waypoints([p1] + route)
+        if not (leg := self.get_api_walk_path(p1, route[0], host, fallback)):
+            return []
+        return leg + self.add_waypoints(route)[1:]
 
     def get_api_walk_path(
-        self, p1: Point, p2: Point, host: Literal["dax", "osrspf"]
+        self, p1: Point, p2: Point, host: PathHost, fallback: bool = False
     ) -> WalkPath:
-        """Retreive a `WalkPath` from either the DAX or OSRSpathfinder API endpoints.
+        """Retreive a `WalkPath` from the local pathfinder or a remote API endpoint.
 
         This method returns the results of the A* (pronounced "A-star") pathfinding
         algorithm. A* is a popular and efficient algorithm used to find the shortest
@@ -277,21 +971,48 @@ class Walker:
         Args:
             p1 (Point): The start of the path to be calculated.
             p2 (Point): The destination point of the path to be calculated.
-            host ("dax" or "osrspf"): Whether to use the DAX or OSRSpathfinder
-                pathfinding API to obtain the desired path. Note that the DAX API is
-                significantly more reliable than OSRSpathfinder equivalent.
+            host ("local", "remote", "dax", or "osrspf"): Whether to compute the path
+                locally, race the remote APIs, or obtain it from the DAX or
+                OSRSpathfinder API alone. Note that the DAX API is significantly more
+                reliable than OSRSpathfinder equivalent.
+            fallback (bool, optional): Whether to fall back to the local pathfinder,
+                then to racing the remote APIs, if `host` finds no path. Defaults to
+                False.
 
         Returns:
             WalkPath: The shortest valid path between the two provided points.
         """
-        api = Pathfinder.get_path_dax if host == "dax" else Pathfinder.get_path_osrspf
-        if path_raw := api(p1, p2):
-            return self.add_waypoints(path_raw)
-        host_name = "DAX" if host == "dax" else "OSRSPathfinder"
-        msg = f"{host_name} API request for shortest path failed ({p1} -> {p2})."
-        self.bot.log_msg(msg)
+        hosts = self._path_hosts(host, fallback)
+        # A path cached from an earlier trip (by any acceptable host) needs no calls.
+        for name in hosts:
+            if path_raw := self.path_cache.get(p1, p2, name):
+                self.path_cache.flush()  # Save when it was used, for LRU eviction.
+                return self.add_waypoints(path_raw)
+        for name in hosts:
+            if path_raw := self.PATH_HOSTS[name](p1, p2):
+                self.path_cache.put(p1, p2, name, path_raw)
+                return self.add_waypoints(path_raw)
+            host_name = self.PATH_HOST_NAMES[name]
+            msg = f"{host_name} request for shortest path failed ({p1} -> {p2})."
+            self.bot.log_msg(msg)
         return []
 
+    def _path_hosts(self, host: PathHost, fallback: bool) -> List[PathHost]:
+        """List the pathfinders to try, in order.
+
+        Args:
+            host ("local", "remote", "dax", or "osrspf"): The pathfinder to try first.
+            fallback (bool): Whether to fall back to the local pathfinder, then to
+                racing the remote APIs.
+
+        Returns:
+            List[PathHost]: The names of the pathfinders to try.
+        """
+        hosts = [host]
+        if fallback:
+            hosts += [other for other in ("local", "remote") if other != host]
+        return hosts
+
     def distance(self, p1: Point, p2: Point) -> float:
         """Return the Euclidean distance between two points.
 
@@ -317,24 +1038,22 @@ class Walker:
                 intermediary `Point` objects interspersed throughout. Note that the
                 relative ordering of the points provided in `walk_path` is maintained.
         """
-        walk_path_w_waypoints = [walk_path[0]]  # Start with the first coordinate.
-        for step in range(len(walk_path) - 1):  # Note that we stop before the last one.
-            p1 = walk_path[step]
-            p2 = walk_path[step + 1]
-            dist = self.distance(p1, p2)
-            # If the next point is far, add intermediary waypoints in between.
-            if dist > self.MAX_WAYPOINT_DIST:  # Measured in tile space.
-                num_waypoints = math.ceil(dist / 10)
-                dx = (p2.x - p1.x) / num_waypoints
-                dy = (p2.y - p1.y) / num_waypoints
-                for i in range(1, num_waypoints):
-                    walk_path_w_waypoints.append(
-                        Point(round(p1.x + i * dx), round(p1.y + i * dy))
-                    )
-            # Cap off the intermediary waypoints with the original point that was
-            # further than 10 tiles away.
-            walk_path_w_waypoints.append(p2)
-        return walk_path_w_waypoints
+        steps = np.asarray(walk_path, dtype=np.float64).reshape(len(walk_path), -1)
+        steps = steps[:, :2]
+        deltas = np.diff(steps, axis=0)
+        dists = np.hypot(deltas[:, 0], deltas[:, 1])  # Measured in tile space.
+        # Split each far step into enough equal parts that none exceed the maximum.
+        parts = np.where(
+            dists > self.MAX_WAYPOINT_DIST, np.ceil(dists / self.MAX_WAYPOINT_DIST), 1
+        ).astype(np.int64)
+        # Point `i` of step `k` sits at `p1 + i * (p2 - p1) / parts[k]`, `i < parts[k]`.
+        step_of = np.repeat(np.arange(len(deltas)), parts)
+        i = np.arange(len(step_of)) - np.repeat(np.cumsum(parts) - parts, parts)
+        step_size = deltas / parts[:, np.newaxis]
+        waypoints = steps[step_of] + i[:, np.newaxis] * step_size[step_of]
+        # Cap off the waypoints with the original last point.
+        waypoints = np.vstack([np.round(waypoints), steps[-1:]]).astype(np.int64)
+        return [Point(x, y) for x, y in waypoints.tolist()]
 
     def travel_to_dest_along_path(
         self, tile_coord: Tuple[int], walk_path: WalkPath, dest_name: str
@@ -342,8 +1061,8 @@ class Walker:
         """Travel to a destination point along a path.
 
         This method uses three ways to attempt to walk to a destination:
-            1. Call the DAX API to get a dynamically-generated A* path.
-            2. Call the OSRSPathfinder API to get a dynamically-generated A* path.
+            1. Compute an A* path locally over the collision map.
+            2. Race the DAX and OSRSPathfinder APIs for a dynamically-generated A* path.
             3. Use a hard-coded path.
 
         Args:
@@ -357,17 +1076,14 @@ class Walker:
             bool: True if the destination was reached, False otherwise.
         """
         try:
-            if self.walk_to(tile_coord, host="dax"):
+            # Falls back to racing DAX and OSRSpathfinder if no local path is found.
+            if self.walk_to(tile_coord, host="local", fallback=True):
                 return True
         except Exception:
             try:
-                if self.walk_to(tile_coord, host="osrspf"):
+                print("Walking along manually-set path...")
+                if self.walk(walk_path):
                     return True
-            except Exception:
-                try:
-                    print("Walking along manually-set path...")
-                    if self.walk(walk_path):
-                        return True
-                except Exception as exc:
-                    print(f"Failed to travel to {dest_name}: {exc}")
-                    return False
+            except Exception as exc:
+                print(f"Failed to travel to {dest_name}: {exc}")
+                return False
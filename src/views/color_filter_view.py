@@ -7,6 +7,7 @@ import cv2
 import numpy as np
 from PIL import Image, ImageOps, ImageTk
 
+from utilities.frame import Frame
 from utilities.img_search import BOT_IMAGES
 from views.fonts import fonts as fnt
 
@@ -408,9 +409,11 @@ class ColorFilterView(ctk.CTkFrame):
     def __update_image(self) -> None:
         """Update a given screenshot after an HSV color filter is applied."""
         # Use the image data already in memory if the image has been loaded previously.
-        if isinstance(self.image_to_load, np.ndarray):
-            img = self.image_to_load
-        if not isinstance(self.image_to_load, np.ndarray) and not self.image_to_load:
+        # Keeping it as a `Frame` means the HSV conversion below happens only once per
+        # loaded image rather than on every slider movement.
+        if isinstance(self.image_to_load, Frame):
+            frame = self.image_to_load
+        if not isinstance(self.image_to_load, Frame) and not self.image_to_load:
             # If the image is empty, load the image from the hard drive.
             conditions = {
                 self.minimap: "screenshotter-minimap.png",
@@ -420,15 +423,15 @@ class ColorFilterView(ctk.CTkFrame):
             screenshot_filename = conditions.get(True, SPLASH_FILENAME)
             img_path = PATH_SCREENSHOTTER / screenshot_filename
             img = cv2.imread(str(img_path))  # Returns `np.ndarray`, not `Image.Image`.
-            self.image_to_load = img
+            frame = self.image_to_load = Frame(img)
+        img = frame.bgr
 
         # Set minimum and maximum HSV display values.
         lo = np.array([self.H_minval, self.S_minval, self.V_minval])
         hi = np.array([self.H_maxval, self.S_maxval, self.V_maxval])
 
         # Convert to HSV format and color threshold.
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
-        mask = cv2.inRange(hsv, lo, hi)
+        mask = cv2.inRange(frame.hsv, lo, hi)
         result = cv2.bitwise_and(img, img, mask=mask)
 
         # Convert the OpenCV image to a PIL image.
@@ -0,0 +1,14 @@
+import cv2
+import numpy as np
+import pytest
+
+from utilities.benchmark import CLIENT_VIEW
+
+
+@pytest.fixture(scope="session")
+def client_image() -> np.ndarray:
+    """Load the bundled capture of a full client window in the fixed classic layout."""
+    img = cv2.imread(str(CLIENT_VIEW), cv2.IMREAD_COLOR)
+    assert img is not None, f"Missing fixture: {CLIENT_VIEW}"
+    img.setflags(write=False)
+    return img
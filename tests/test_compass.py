@@ -0,0 +1,43 @@
+import cv2
+import numpy as np
+import pytest
+
+from utilities.compass import COMPASS_DEGREES, CompassEngine
+
+
+@pytest.fixture(scope="module")
+def references() -> np.ndarray:
+    """Load the fixed-classic compass images, without packing them into an atlas."""
+    imgs = [
+        cv2.imread(str(COMPASS_DEGREES / "fixed_classic" / f"{deg}.png"))
+        for deg in range(360)
+    ]
+    return np.stack(imgs)
+
+
+@pytest.mark.parametrize("deg", [0, 45, 90, 137, 200, 270, 359])
+def test_reference_images_score_best_at_their_degree(references, deg):
+    engine = CompassEngine(references)
+    scores = engine.scores(references[deg])
+    assert scores[deg] == pytest.approx(scores.max(), abs=1e-5)
+    assert engine.angle(references[deg][..., ::-1]) in np.flatnonzero(
+        scores >= scores.max() - 1e-5
+    )
+
+
+def test_angle_is_robust_to_noise_and_scale(references):
+    engine = CompassEngine(references)
+    rng = np.random.default_rng(0)
+    img = references[123].astype(np.int16) + rng.integers(-8, 9, references[0].shape)
+    img = np.clip(img, 0, 255).astype(np.uint8)
+    height, width = img.shape[:2]
+    img = cv2.resize(img, (width * 2, height * 2))
+    assert abs(engine.angle(img) - 123) <= 1
+
+
+def test_ties_prefer_cardinal_directions():
+    base = np.random.default_rng(1).integers(0, 255, (360, 8, 8, 3), dtype=np.uint8)
+    base[89:92] = base[90]  # 89, 90, and 91 degrees look identical.
+    engine = CompassEngine(base)
+    assert engine.angle(base[90]) == 90
+    assert engine.angle(base[17]) == 17
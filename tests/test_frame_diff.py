@@ -0,0 +1,50 @@
+import numpy as np
+
+from utilities.frame_diff import FrameDiffer
+
+
+def test_first_frame_is_fully_dirty():
+    differ = FrameDiffer(tile_size=16)
+    tiles = differ.update(np.zeros((40, 50, 3), dtype=np.uint8))
+    assert tiles.shape == (3, 4)
+    assert tiles.all()
+    assert differ.dirty_bbox() == (0, 0, 50, 40)
+
+
+def test_only_changed_tiles_are_dirty():
+    differ = FrameDiffer(tile_size=16)
+    frame = np.zeros((64, 64, 3), dtype=np.uint8)
+    differ.update(frame)
+    assert not differ.changed(frame.copy())
+    assert differ.dirty_bbox() is None
+
+    changed = frame.copy()
+    changed[20:24, 36:40] = 255  # 16 pixels within tile (row 1, col 2).
+    tiles = differ.update(changed)
+    assert np.argwhere(tiles).tolist() == [[1, 2]]
+    assert differ.dirty_bbox() == (32, 16, 48, 32)
+
+
+def test_threshold_ignores_noise():
+    differ = FrameDiffer(tile_size=16, threshold=2.0)
+    frame = np.full((32, 32), 100, dtype=np.uint8)
+    differ.update(frame)
+    assert not differ.changed(frame + 1)
+
+
+def test_edge_tiles_are_averaged_over_their_own_pixels():
+    differ = FrameDiffer(tile_size=16, threshold=10.0)
+    frame = np.zeros((20, 20), dtype=np.uint8)
+    differ.update(frame)
+    changed = frame.copy()
+    changed[16:20, 16:20] = 255  # Fills the 4x4 corner tile entirely.
+    assert differ.update(changed)[1, 1]
+    assert differ.dirty_bbox() == (16, 16, 20, 20)
+
+
+def test_reset_forgets_previous_frame():
+    differ = FrameDiffer()
+    frame = np.zeros((16, 16), dtype=np.uint8)
+    differ.update(frame)
+    differ.reset()
+    assert differ.changed(frame)
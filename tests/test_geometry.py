@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from utilities.geometry import Rectangle, RectGrid, RuneLiteObject, RuneLiteObjects
+
+RECT = Rectangle(10, 20, 100, 100)
+
+
+def _obj(xmin: int, ymin: int, size: int = 4) -> RuneLiteObject:
+    """Make a square object with its top-left corner at (xmin, ymin)."""
+    xmax, ymax = xmin + size - 1, ymin + size - 1
+    obj = RuneLiteObject(xmin, xmax, ymin, ymax, size, size, np.empty((0, 2)))
+    obj.set_rectangle_reference(RECT)
+    return obj
+
+
+OBJS = [_obj(90, 90), _obj(48, 50), _obj(0, 0), _obj(60, 40), _obj(20, 70)]
+
+
+def test_centers_match_objects():
+    objs = RuneLiteObjects(OBJS)
+    assert objs.rect is RECT
+    assert [tuple(c) for c in objs.centers] == [tuple(o.center) for o in OBJS]
+
+
+@pytest.mark.parametrize(
+    "dist_measure, key",
+    [
+        ("absolute", RuneLiteObject.dist_from_rect_center),
+        ("vertical", RuneLiteObject.vert_dist_from_rect_center),
+        ("horizontal", RuneLiteObject.horz_dist_from_rect_center),
+    ],
+)
+def test_nearest_queries_match_sorting(dist_measure, key):
+    objs = RuneLiteObjects(OBJS)
+    expected = sorted(OBJS, key=key)
+    assert objs.nearest(3, dist_measure) == expected[:3]
+    assert [objs.nth_nearest(n, dist_measure) for n in range(5)] == expected
+    assert list(objs.sorted_by_distance(dist_measure)) == expected
+    assert objs.nth_nearest(5, dist_measure) is None
+
+
+def test_modifying_reindexes():
+    objs = RuneLiteObjects(OBJS[2:])
+    assert objs.nth_nearest(0) is OBJS[3]
+    objs.append(OBJS[1])
+    assert objs.nth_nearest(0) is OBJS[1]
+    objs.remove(OBJS[1])
+    assert objs.nth_nearest(0) is OBJS[3]
+
+
+def test_empty_collection():
+    objs = RuneLiteObjects(rect=RECT)
+    assert not objs
+    assert objs.nearest() == []
+    assert objs.nth_nearest() is None
+    with pytest.raises(ReferenceError):
+        RuneLiteObjects().centers
+
+
+def test_rect_grid_view_matches_cells():
+    grid = RectGrid.lattice(5, 7, rows=3, cols=4, width=6, height=5, step_x=8)
+    img = np.arange(grid.rect.height * grid.rect.width * 3, dtype=np.int32).reshape(
+        grid.rect.height, grid.rect.width, 3
+    )
+    view = grid.view(img)
+    assert view.shape == (3, 4, 5, 6, 3)
+    assert not view.flags.writeable
+    assert np.shares_memory(view, img)
+    left, top = grid.rect.left, grid.rect.top
+    for k, cell in enumerate(grid):
+        x, y = cell.left - left, cell.top - top
+        expected = img[y : y + cell.height, x : x + cell.width]
+        assert np.array_equal(view[k // 4, k % 4], expected)
+        assert np.array_equal(grid.cells(img)[k], expected)
+
+
+def test_rect_grid_view_pads_trailing_cells():
+    grid = RectGrid.lattice(0, 0, rows=2, cols=3, width=4, height=4, count=2)
+    assert len(grid) == 2
+    img = np.ones((grid.rect.height, grid.rect.width), dtype=np.uint8)
+    assert img.shape == (4, 8)
+    view = grid.view(img)
+    assert view.shape == (2, 3, 4, 4)
+    assert view[0, :2].all()
+    assert view[0, 2].sum() == view[1].sum() == 0  # Unused cells are padded.
+    assert grid.cells(img).shape == (2, 4, 4)
+
+
+def test_irregular_rect_grid_cells_are_padded():
+    grid = RectGrid([(0, 0, 3, 2), (3, 0, 5, 4)])
+    assert not grid.is_regular
+    with pytest.raises(ValueError):
+        grid.view(np.zeros((4, 8)))
+    cells = grid.cells(np.ones((4, 8), dtype=np.uint8))
+    assert cells.shape == (2, 4, 5)
+    assert cells[0].sum() == 6 and cells[1].sum() == 20
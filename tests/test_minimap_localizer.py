@@ -0,0 +1,67 @@
+import cv2
+import numpy as np
+import pytest
+
+from utilities.geometry import Point
+from utilities.minimap_localizer import (
+    MINIMAP_PIXELS_PER_TILE,
+    MinimapAtlas,
+    MinimapLocalizer,
+)
+
+NORTH_WEST = Point(3150, 3249)  # The world below spans 100 x 100 tiles.
+
+
+@pytest.fixture(scope="module")
+def world():
+    """A north-up world map at the minimap's scale, one random color per tile."""
+    tiles = np.random.default_rng(0).integers(0, 256, (100, 100, 3), dtype=np.uint8)
+    return np.kron(tiles, np.ones((MINIMAP_PIXELS_PER_TILE,) * 2 + (1,), np.uint8))
+
+
+def _minimap(world: np.ndarray, tile: Point, camera_angle: float) -> np.ndarray:
+    """Crop the round minimap centered on a tile, rotated to face the camera."""
+    ppt = MINIMAP_PIXELS_PER_TILE
+    col = (tile.x - NORTH_WEST.x) * ppt + ppt // 2
+    row = (NORTH_WEST.y - tile.y) * ppt + ppt // 2
+    crop = world[row - 76 : row + 76, col - 76 : col + 76]
+    matrix = cv2.getRotationMatrix2D((76, 76), -camera_angle, 1.0)
+    crop = cv2.warpAffine(crop, matrix, (152, 152), flags=cv2.INTER_NEAREST)
+    outside = np.hypot(*np.ogrid[-76:76, -76:76]) > 72
+    crop[outside] = 0
+    return crop
+
+
+@pytest.fixture
+def atlas(world):
+    small = cv2.resize(world, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+    return MinimapAtlas(small, NORTH_WEST)
+
+
+@pytest.mark.parametrize("camera_angle", [0, 90, 33])
+def test_locate_finds_the_tile(world, atlas, camera_angle):
+    tile = Point(3200, 3200)
+    minimap = _minimap(world, tile, camera_angle)
+    fix = MinimapLocalizer(atlas).locate(minimap, camera_angle, near=Point(3190, 3208))
+    assert fix.tile == tile
+    assert fix.confidence > 0.9
+
+
+def test_locate_rejects_poor_matches(world, atlas):
+    localizer = MinimapLocalizer(atlas, search_radius=4)
+    minimap = _minimap(world, Point(3200, 3200), 0)
+    # Out of the search window, or across the edge of the atlas.
+    assert localizer.locate(minimap, 0, near=Point(3220, 3200)) is None
+    assert localizer.locate(minimap, 0, near=Point(3150, 3200)) is None
+    atlas.image[:] = 0  # Unexplored.
+    assert localizer.locate(minimap, 0, near=Point(3200, 3200)) is None
+
+
+def test_pasted_captures_are_found_again(world):
+    atlas = MinimapAtlas.blank(3150, 3150, 3249, 3249)
+    for x in range(3180, 3230, 10):
+        for y in range(3180, 3230, 10):
+            atlas.paste(Point(x, y), _minimap(world, Point(x, y), 0), 0)
+    tile = Point(3203, 3196)
+    fix = MinimapLocalizer(atlas).locate(_minimap(world, tile, 45), 45, near=tile)
+    assert fix.tile == tile
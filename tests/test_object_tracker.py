@@ -0,0 +1,53 @@
+import numpy as np
+
+from utilities.color_util import ColorPalette
+from utilities.geometry import Rectangle
+from utilities.object_tracker import ObjectTracker
+
+CP = ColorPalette()
+RECT = Rectangle(0, 0, 200, 120)
+
+
+def _frame(*boxes) -> np.ndarray:
+    """Draw a black frame of `RECT` with a cyan square at each (x, y, size)."""
+    frame = np.zeros((RECT.height, RECT.width, 3), dtype=np.uint8)
+    for x, y, size in boxes:
+        frame[y : y + size, x : x + size] = CP.bgr.CYAN.lo
+    return frame
+
+
+def test_ids_survive_small_moves():
+    tracker = ObjectTracker(RECT, CP.hsv.CYAN)
+    tracks = tracker.update(_frame((20, 20, 12), (140, 70, 12)))
+    assert len(tracks) == 2
+    ids = {tid: obj.center for tid, obj in tracks.items()}
+
+    tracks = tracker.update(_frame((24, 22, 12), (140, 70, 12)))
+    assert set(tracks) == set(ids)
+    for tid, obj in tracks.items():
+        assert abs(obj.center.x - ids[tid].x) <= 4
+
+
+def test_unchanged_frame_keeps_tracks():
+    tracker = ObjectTracker(RECT, CP.hsv.CYAN)
+    frame = _frame((20, 20, 12))
+    first = dict(tracker.update(frame))
+    assert tracker.update(frame.copy()) == first
+
+
+def test_disappearance_and_new_objects():
+    tracker = ObjectTracker(RECT, CP.hsv.CYAN)
+    tracker.update(_frame((20, 20, 12), (140, 70, 12)))
+    far_id = max(tracker.tracks, key=lambda tid: tracker.tracks[tid].xmin)
+    tracker.update(_frame((20, 20, 12), (90, 10, 12)))
+    assert far_id in tracker.disappeared
+    assert far_id not in tracker.tracks
+    assert len(tracker.tracks) == 2
+
+
+def test_nearest_id_orders_by_distance_from_center():
+    tracker = ObjectTracker(RECT, CP.hsv.CYAN)
+    tracker.update(_frame((0, 0, 12), (94, 54, 12), (170, 100, 12)))
+    nearest = tracker.tracks[tracker.nearest_id()]
+    assert nearest.xmin == 94
+    assert tracker.nearest_id(3) is None
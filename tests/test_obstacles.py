@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from utilities.api import obstacles
+from utilities.api.obstacles import ObstacleOverlay
+from utilities.api.pathfinder import CollisionMap
+from utilities.geometry import Point
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control the time the overlay sees, in seconds since the epoch."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(obstacles.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def overlay(tmp_path, clock):
+    return ObstacleOverlay(tmp_path / "obstacles.json", penalty=10, ttl=100)
+
+
+def test_blocking_a_move_blocks_every_way_into_its_tile(overlay):
+    overlay.block([(Point(0, 0), Point(0, 1))])
+    sources = {(-1, 0), (0, 0), (1, 0), (-1, 1), (1, 1)}
+    assert overlay.penalties() == {(src, (0, 1)): 10 for src in sources}
+    overlay.block([(Point(0, 0), Point(0, 1))])
+    assert overlay.penalties()[((0, 0), (0, 1))] == 20
+
+
+def test_entries_persist_until_they_expire(overlay, tmp_path, clock):
+    overlay.block([(Point(0, 0), Point(1, 1))])
+    clock[0] += 60
+    overlay.block([(Point(5, 5), Point(5, 6))])
+    reloaded = ObstacleOverlay(tmp_path / "obstacles.json", ttl=100)
+    assert reloaded.penalties() == overlay.penalties()
+    clock[0] += 60
+    assert {dst for _, dst in overlay.penalties()} == {(5, 6)}
+    overlay.block([(Point(9, 9), Point(9, 8))])
+    assert len(overlay) == 10  # The first block expired and was dropped.
+    overlay.clear()
+    assert not overlay.penalties()
+    assert not (tmp_path / "obstacles.json").exists()
+
+
+def test_paths_avoid_blocked_moves(overlay):
+    rows = [".....", "#.#.#", "....."]  # North (top) to south.
+    flags = [[CollisionMap.BLOCKED if c == "#" else 0 for c in row] for row in rows]
+    collision_map = CollisionMap(np.array(flags[::-1]), (0, 0))
+    path = collision_map.find_path(Point(1, 0), Point(1, 2))
+    assert Point(1, 1) in path
+    overlay.block([(Point(1, 0), Point(1, 1))])  # e.g. a closed gate.
+    path = collision_map.find_path(
+        Point(1, 0), Point(1, 2), penalties=overlay.penalties()
+    )
+    assert Point(3, 1) in path
@@ -0,0 +1,73 @@
+import pytest
+
+from utilities.api import path_cache
+from utilities.api.path_cache import PathCache
+from utilities.geometry import Point, WorldPoint
+
+PATH = [Point(3200 + i, 3200 + i // 2) for i in range(20)]
+DEST = PATH[-1]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control the time the cache sees, in seconds since the epoch."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(path_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_nearby_starts_snap_onto_cached_paths(tmp_path):
+    cache = PathCache(tmp_path / "paths.json", snap_radius=3)
+    cache.put(PATH[0], DEST, "local", PATH)
+    assert cache.get(PATH[0], DEST, "local") == PATH
+    # Two tiles off of both (3208, 3204) and (3209, 3204): cut at the later one.
+    assert cache.get(Point(3207, 3206), DEST, "local") == PATH[9:]
+    assert cache.get(Point(3207, 3220), DEST, "local") == []
+    assert cache.get(PATH[0], DEST, "dax") == []
+    assert cache.get(PATH[0], WorldPoint(DEST.x, DEST.y, 1), "local") == []
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_entries_persist(tmp_path, clock):
+    cache = PathCache(tmp_path / "paths.json")
+    cache.put(PATH[0], DEST, "local", PATH)
+    clock[0] += 60
+    cache.get(PATH[0], DEST, "local")
+    cache.flush()
+    reloaded = PathCache(tmp_path / "paths.json")
+    assert reloaded.get(PATH[0], DEST, "local") == PATH
+    (entry,) = reloaded._entries.values()
+    assert entry["last_used"] == clock[0]
+    reloaded.clear()
+    assert not (tmp_path / "paths.json").exists()
+
+
+def test_entries_expire(tmp_path, clock):
+    cache = PathCache(tmp_path / "paths.json", ttl=100)
+    cache.put(PATH[0], DEST, "local", PATH)
+    clock[0] += 101
+    assert cache.get(PATH[0], DEST, "local") == []
+    cache.put(Point(0, 0), Point(1, 1), "local", [Point(0, 0), Point(1, 1)])
+    assert len(cache) == 1  # Expired entries are dropped on the next store.
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = PathCache(tmp_path / "paths.json", max_entries=2)
+    dests = [Point(3300 + i, 3300) for i in range(3)]
+    for dest in dests[:2]:
+        cache.put(PATH[0], dest, "local", [PATH[0], dest])
+        clock[0] += 1
+    cache.get(PATH[0], dests[0], "local")
+    clock[0] += 1
+    cache.put(PATH[0], dests[2], "local", [PATH[0], dests[2]])
+    assert len(cache) == 2
+    assert cache.get(PATH[0], dests[1], "local") == []
+    assert cache.get(PATH[0], dests[0], "local")
+
+
+def test_evict_through(tmp_path):
+    cache = PathCache(tmp_path / "paths.json")
+    cache.put(PATH[0], DEST, "local", PATH)
+    cache.put(PATH[0], Point(3100, 3100), "local", [PATH[0], Point(3100, 3100)])
+    assert cache.evict_through([PATH[5]]) == 1
+    assert len(cache) == 1
@@ -0,0 +1,158 @@
+import zipfile
+
+import numpy as np
+import pytest
+
+from utilities.api.pathfinder import CollisionMap
+from utilities.api.shortest_path_data import (
+    build_collision_map,
+    read_regions,
+    read_transports,
+)
+from utilities.geometry import Point
+
+ORIGIN = (3200, 3200)
+
+
+def _map(*rows: str) -> CollisionMap:
+    """Build a map from rows drawn north (top) to south, where "#" is blocked."""
+    flags = [[CollisionMap.BLOCKED if c == "#" else 0 for c in row] for row in rows]
+    return CollisionMap(np.array(flags[::-1]), ORIGIN)
+
+
+def _tile(x: int, y: int) -> Point:
+    return Point(ORIGIN[0] + x, ORIGIN[1] + y)
+
+
+def _assert_steps(collision_map: CollisionMap, path):
+    """Check that every step of a path is one allowed move."""
+    for a, b in zip(path, path[1:]):
+        assert collision_map.is_walkable(b)
+        assert max(abs(a.x - b.x), abs(a.y - b.y)) == 1
+
+
+def test_open_ground_takes_the_chebyshev_distance():
+    collision_map = _map(*["." * 10] * 10)
+    path = collision_map.find_path(_tile(0, 0), _tile(9, 4))
+    assert (path[0], path[-1]) == (_tile(0, 0), _tile(9, 4))
+    assert len(path) == 10
+    _assert_steps(collision_map, path)
+
+
+def test_paths_go_through_gaps_in_walls():
+    collision_map = _map(
+        ".....",
+        "##.##",
+        ".....",
+    )
+    path = collision_map.find_path(_tile(0, 0), _tile(4, 2))
+    assert _tile(2, 1) in path
+    _assert_steps(collision_map, path)
+
+
+def test_walls_block_edges_and_corners():
+    flags = np.zeros((3, 3), dtype=np.uint8)
+    flags[1, 0] |= CollisionMap.WALL_E  # A fence east of (0, 1).
+    collision_map = CollisionMap(flags, ORIGIN)
+    path = collision_map.find_path(_tile(0, 1), _tile(1, 1))
+    assert len(path) == 4  # Around the fence rather than across (or past) it.
+    # Diagonals can't cut past the fence either.
+    assert not collision_map.moves[1, 0] >> 4 & 1  # North-east.
+    assert not collision_map.moves[1, 0] >> 5 & 1  # South-east.
+
+
+def test_penalties_steer_around_obstacles():
+    collision_map = _map(
+        ".....",
+        ".###.",
+        ".....",
+    )
+    straight = collision_map.find_path(_tile(0, 0), _tile(4, 0))
+    assert [p.y for p in straight] == [ORIGIN[1]] * 5
+    edge = (tuple(_tile(1, 0)), tuple(_tile(2, 0)))
+    detour = collision_map.find_path(_tile(0, 0), _tile(4, 0), penalties={edge: 50})
+    assert len(detour) == 9  # Corners around the wall can't be cut.
+    assert _tile(2, 2) in detour
+    _assert_steps(collision_map, detour)
+
+
+def test_no_path():
+    collision_map = _map(
+        "..#..",
+        "..#..",
+    )
+    assert collision_map.find_path(_tile(0, 0), _tile(4, 0)) == []
+    assert collision_map.find_path(_tile(0, 0), _tile(2, 0)) == []
+    assert collision_map.find_path(_tile(0, 0), _tile(9, 9)) == []
+    assert collision_map.find_path(_tile(0, 0), _tile(1, 1), max_expansions=0) == []
+
+
+def test_save_and_load(tmp_path):
+    collision_map = _map("..#", "...")
+    collision_map.save(tmp_path / "map.npz")
+    loaded = CollisionMap.load(tmp_path / "map.npz")
+    assert loaded.origin == collision_map.origin
+    assert np.array_equal(loaded.flags, collision_map.flags)
+
+
+def _region(north: np.ndarray, east: np.ndarray) -> bytes:
+    """Pack one plane of a region as the shortest-path plugin stores it."""
+    bits = np.zeros((1, 64, 64, 2), dtype=bool)
+    bits[0, ..., 0], bits[0, ..., 1] = north, east
+    return np.packbits(bits.ravel(), bitorder="little").tobytes().rstrip(b"\0")
+
+
+def test_imported_regions_become_walls(tmp_path):
+    north = np.ones((64, 64), dtype=bool)
+    east = np.ones((64, 64), dtype=bool)
+    north[63], east[:, 63] = False, False  # The edges of the region.
+    east[:60, 10] = False  # A wall east of x=10, open from y=60 up.
+    north[30:32, 40:42] = east[30:32, 40:42] = False  # (41, 31) can't be left.
+    path = tmp_path / "collision-map.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("50_50", _region(north, east))
+
+    regions = read_regions(path)
+    collision_map = build_collision_map(regions, 0)
+    assert collision_map.origin == Point(3200, 3200)
+    assert not collision_map.is_walkable(Point(3241, 3231))
+    walk = collision_map.find_path(Point(3205, 3210), Point(3215, 3210))
+    assert max(p.y for p in walk) >= 3260  # Around the end of the wall.
+    with pytest.raises(ValueError):
+        build_collision_map(regions, 1)
+
+
+@pytest.mark.parametrize(
+    "header, rows",
+    [
+        (
+            "Origin\tDestination\tmenuOption\tmenuTarget\tobjectID\tSkills\tDuration",
+            [
+                "3200 3200 0\t3200 9600 0\tClimb-down\tLadder\t123\t\t3",
+                "3200 3200 0\t3201 3201 1\tClimb-up\tLadder\t123\t10 Agility\t3",
+                "\t3000 3000 0\tCast\tTeleport\t\t\t",
+            ],
+        ),
+        (
+            "Origin\tDestination\tmenuOption menuTarget objectID\tSkills\tDuration",
+            [
+                "3200 3200 0\t3200 9600 0\tClimb-down Ladder 123\t\t3",
+                "3200 3200 0\t3201 3201 1\tClimb-up Ladder 123\t10 Agility\t3",
+                "\t3000 3000 0\tCast Teleport 0\t\t",
+            ],
+        ),
+    ],
+)
+def test_transports_are_read_by_header(tmp_path, header, rows):
+    path = tmp_path / "transports.tsv"
+    path.write_text("\n".join(["# " + header] + rows))
+    # Only the first row has an origin and no requirements.
+    assert read_transports([path]) == [
+        {
+            "source": [3200, 3200, 0],
+            "dest": [3200, 9600, 0],
+            "name": "Ladder",
+            "action": "Climb-down",
+            "cost": 3,
+        }
+    ]
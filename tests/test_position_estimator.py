@@ -0,0 +1,61 @@
+import pytest
+
+from utilities.geometry import Point
+from utilities.position_estimator import GAME_TICK, PositionEstimator
+
+PATH = [Point(3200 + i, 3200) for i in range(10)]
+
+
+@pytest.fixture
+def clock():
+    """A clock that only moves when told to, in seconds."""
+    return [100.0]
+
+
+@pytest.fixture
+def estimator(clock):
+    return PositionEstimator(clock=lambda: clock[0])
+
+
+def test_walking_advances_a_tile_per_tick(estimator, clock):
+    assert estimator.estimate() is None
+    estimator.confirm(PATH[0])
+    estimator.set_course(PATH, PATH[6])
+    assert estimator.estimate() == PATH[0]
+    clock[0] += GAME_TICK
+    assert estimator.estimate() == PATH[1]
+    clock[0] += 2 * GAME_TICK
+    assert estimator.estimate() == PATH[3]
+    clock[0] += GAME_TICK + 0.1  # The fix is now too old to extrapolate from.
+    assert estimator.estimate() is None
+    assert (estimator.reads, estimator.estimates) == (1, 3)
+
+
+def test_running_stops_at_the_target(estimator, clock):
+    estimator.confirm(PATH[0])
+    estimator.set_course(PATH, PATH[4], running=True)
+    clock[0] += GAME_TICK
+    assert estimator.estimate() == PATH[2]
+    clock[0] += 2 * GAME_TICK
+    assert estimator.estimate() == PATH[4]
+
+
+def test_targets_off_the_path_are_walked_to_directly(estimator, clock):
+    estimator.confirm(PATH[0])
+    estimator.set_course(PATH, Point(3203, 3203))
+    clock[0] += 2 * GAME_TICK
+    assert estimator.estimate() == Point(3202, 3202)
+
+
+def test_confirm_keeps_or_drops_the_course(estimator, clock):
+    estimator.confirm(PATH[0])
+    estimator.set_course(PATH, PATH[8])
+    clock[0] += GAME_TICK
+    estimator.confirm(PATH[2])  # A tick ahead of the estimate, yet on course.
+    clock[0] += GAME_TICK
+    assert estimator.estimate() == PATH[3]
+    estimator.confirm(Point(3205, 3210))  # e.g. we were teleported.
+    clock[0] += GAME_TICK
+    assert estimator.estimate() == Point(3205, 3210)
+    estimator.reset()
+    assert estimator.estimate() is None
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+import utilities.geometry as geometry
+from model.recorded_window import RecordedWindow
+from utilities.geometry import Point, Rectangle
+
+
+def test_initialize_locates_fixed_classic_layout(client_image):
+    with RecordedWindow(client_image) as win:
+        assert win.initialize()
+    assert win.mode == "fixed_classic"
+    assert win._anchors["minimap"].left == 517
+    assert win._anchors["chat"].top == 340
+    assert win._anchors["control_panel"].left == 522
+    assert len(win.inventory_grid) == len(win.inventory_slots) == 28
+
+
+def test_screenshots_are_served_from_the_recording(client_image):
+    win = RecordedWindow(client_image, origin=Point(100, 50))
+    assert win.rectangle().to_dict() == Rectangle(100, 50, 765, 503).to_dict()
+    previous = geometry._capture_source
+    with win:
+        img = Rectangle(90, 60, 30, 20).screenshot()
+    assert geometry._capture_source is previous
+    assert img.shape == (20, 30, 3)
+    assert not img[:, :10].any()  # Left of the recording.
+    assert np.array_equal(img[:, 10:], client_image[10:30, :20])
+
+
+def test_load_swaps_the_recording(client_image):
+    with RecordedWindow(client_image) as win:
+        win.load(np.full_like(client_image, 7))
+        assert (Rectangle(0, 0, 4, 4).screenshot() == 7).all()
+
+
+def test_recorded_window_imports_headless():
+    src = Path(__file__).parents[1] / "src"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(src)] + sys.path))
+    env.pop("DISPLAY", None)
+    code = (
+        "import sys, model.recorded_window;"
+        "gui = {'pyautogui', 'pynput', 'customtkinter'} & set(sys.modules);"
+        "assert not gui, gui"
+    )
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
@@ -0,0 +1,101 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from utilities.api.pathfinder import Pathfinder
+from utilities.geometry import Point, WorldPoint
+
+START, DEST = Point(3200, 3200), Point(3202, 3201)
+
+
+class _Host:
+    """How one stubbed endpoint answers: a queue of statuses, then a path."""
+
+    def __init__(self, path, statuses=(), delay=0.0):
+        self.path = path
+        self.statuses = list(statuses)
+        self.delay = delay
+        self.requests = []
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        host = self.server.hosts[self.path]
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        host.requests.append(json.loads(body))
+        time.sleep(host.delay)
+        status = host.statuses.pop(0) if host.statuses else 200
+        if self.path == "/dax":
+            reply = {"path": [{"x": p.x, "y": p.y, "z": 0} for p in host.path]}
+        else:
+            steps = [{"x": p.x, "y": p.y, "plane": 0} for p in host.path]
+            reply = {"result": {"steps": [{"path": steps}]}}
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(reply).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def hosts(monkeypatch):
+    """Serve both pathfinding services from a local stub server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.hosts = {"/dax": _Host([]), "/osrspf": _Host([])}
+    url = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(Pathfinder, "DAX_URL", f"{url}/dax")
+    monkeypatch.setattr(Pathfinder, "OSRSPF_URL", f"{url}/osrspf")
+    monkeypatch.setattr(Pathfinder, "BACKOFF", 0.01)
+    serve = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    serve.start()
+    yield server.hosts
+    server.shutdown()
+    server.server_close()
+
+
+def test_transient_errors_are_retried(hosts):
+    hosts["/osrspf"] = _Host([START, DEST], statuses=[503, 429])
+    assert Pathfinder.get_path_osrspf(START, DEST) == [
+        WorldPoint(*START, 0),
+        WorldPoint(*DEST, 0),
+    ]
+    assert len(hosts["/osrspf"].requests) == 3
+    assert hosts["/osrspf"].requests[0]["start"] == {"plane": 0, "x": 3200, "y": 3200}
+
+
+def test_other_errors_and_exhausted_retries_are_raised(hosts, monkeypatch):
+    monkeypatch.setattr(Pathfinder, "MAX_ATTEMPTS", 2)
+    hosts["/dax"] = _Host([START], statuses=[400])
+    with pytest.raises(requests.HTTPError):
+        Pathfinder.make_api_call(Pathfinder.DAX_URL, {}, {})
+    assert len(hosts["/dax"].requests) == 1
+    hosts["/dax"] = _Host([START], statuses=[500] * 3)
+    assert Pathfinder.get_path_dax(START, DEST) == []
+    assert len(hosts["/dax"].requests) == 2
+
+
+def test_the_fastest_host_wins_and_the_loser_stops_retrying(hosts):
+    hosts["/dax"] = _Host([START, DEST], statuses=[503] * 3, delay=0.3)
+    hosts["/osrspf"] = _Host([START, Point(3201, 3201), DEST])
+    began = time.monotonic()
+    assert len(Pathfinder.get_path_remote(START, DEST)) == 3
+    assert time.monotonic() - began < 0.3
+    time.sleep(0.5)  # Long enough for DAX to fail and back off.
+    assert len(hosts["/dax"].requests) == 1
+
+
+def test_empty_paths_lose_the_race(hosts):
+    hosts["/dax"] = _Host([START, DEST], delay=0.1)
+    hosts["/osrspf"] = _Host([])
+    assert Pathfinder.get_path_remote(START, DEST) == [
+        WorldPoint(*START, 0),
+        WorldPoint(*DEST, 0),
+    ]
+    assert Pathfinder.get_path_remote(START, DEST, timeout=0.05) == []
@@ -0,0 +1,48 @@
+from typing import List
+
+from utilities.api.route_table import RouteTable, build_route_table, named_locations
+from utilities.geometry import Point
+
+NAMES = ["GRAND_EXCHANGE", "VARROCK_SQUARE", "EDGEVILLE_BANK", "ARDOUGNE_MARKET"]
+
+
+def _straight(a: Point, b: Point) -> List[Point]:
+    """Walk diagonally, then straight, from `a` to `b`; Ardougne is unreachable."""
+    if named_locations()["ARDOUGNE_MARKET"] in (a, b):
+        return []
+    path, (x, y) = [a], a
+    while (x, y) != (b.x, b.y):
+        x += (b.x > x) - (b.x < x)
+        y += (b.y > y) - (b.y < y)
+        path.append(Point(x, y))
+    return path
+
+
+def test_routes_are_stored_once_per_pair():
+    table = build_route_table(NAMES, pathfinder=_straight)
+    assert len(table) == 3
+    assert "ARDOUGNE_MARKET" not in table
+    ge, varrock = (named_locations()[name] for name in NAMES[:2])
+    forward = table.route("GRAND_EXCHANGE", "VARROCK_SQUARE")
+    assert forward == _straight(ge, varrock)
+    assert table.route("VARROCK_SQUARE", "GRAND_EXCHANGE") == forward[::-1]
+    assert table.route("GRAND_EXCHANGE", "ARDOUGNE_MARKET") == []
+
+
+def test_hubs_only_connect_to_the_hub():
+    table = build_route_table(NAMES[:3], hubs=["GRAND_EXCHANGE"], pathfinder=_straight)
+    assert len(table) == 2
+    assert table.route("VARROCK_SQUARE", "EDGEVILLE_BANK") == []
+
+
+def test_route_to_joins_the_closest_route(tmp_path):
+    build_route_table(NAMES, pathfinder=_straight).save(tmp_path / "routes.npz")
+    table = RouteTable.load(tmp_path / "routes.npz")
+    locations = named_locations()
+    route = table.route("EDGEVILLE_BANK", "GRAND_EXCHANGE")
+    near = Point(route[20].x, route[20].y + 2)  # Two tiles from route[18:23].
+    assert table.route_to("GRAND_EXCHANGE", near) == route[22:]
+    assert table.route_to("GRAND_EXCHANGE", locations["VARROCK_SQUARE"]) == (
+        table.route("VARROCK_SQUARE", "GRAND_EXCHANGE")
+    )
+    assert table.route_to("ARDOUGNE_MARKET", near) == []
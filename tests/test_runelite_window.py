@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from model.recorded_window import RecordedWindow
+from utilities import layout_cache
+from utilities.geometry import Point, Rectangle
+
+
+@pytest.fixture
+def searches(monkeypatch, tmp_path):
+    """Count full initializations, with the layout cache kept in a temporary file."""
+    monkeypatch.setattr(layout_cache, "LAYOUT_CACHE_PATH", tmp_path / "layouts.json")
+    calls = []
+    initialize = RecordedWindow.initialize
+
+    def counting(self, *args, **kwargs):
+        calls.append(self)
+        return initialize(self, *args, **kwargs)
+
+    monkeypatch.setattr(RecordedWindow, "initialize", counting)
+    return calls
+
+
+def test_moves_shift_the_regions(client_image, searches):
+    with RecordedWindow(client_image) as win:
+        win.initialize()
+        minimap = win.minimap
+        assert win.check_layout() == "unchanged"
+        win._origin = Point(10, 5)
+        assert win.check_layout() == "moved"
+    assert (win.minimap.left, win.minimap.top) == (minimap.left + 10, minimap.top + 5)
+    assert len(searches) == 1
+
+
+def test_hidden_ui_keeps_regions_without_searching(client_image, searches):
+    with RecordedWindow(client_image) as win:
+        win.initialize()
+        minimap = win.minimap
+        win.load(np.zeros_like(client_image))  # e.g. the login screen.
+        assert win.check_layout() == "hidden"
+        assert win.check_layout() == "hidden"
+        assert win.minimap is minimap
+        win.load(client_image)
+        assert win.check_layout() == "unchanged"
+    assert len(searches) == 1
+
+
+def test_stale_regions_recover_from_the_cache(client_image, searches):
+    with RecordedWindow(client_image) as win:
+        win.initialize(use_layout_cache=True)
+        anchor = win._anchors["minimap"]
+        win._anchors["minimap"] = Rectangle(0, 0, anchor.width, anchor.height)
+        assert win.check_layout() == "reinitialized"
+        assert win._anchors["minimap"].left == anchor.left
+    assert len(searches) == 1
+
+
+def test_resizes_search_and_failures_are_throttled(client_image, searches):
+    padded = np.pad(client_image, ((0, 20), (0, 30), (0, 0)))
+    with RecordedWindow(client_image) as win:
+        win.initialize()
+        win.load(padded)
+        assert win.check_layout() == "reinitialized"
+        assert len(searches) == 2
+
+        win.load(np.zeros((600, 800, 3), dtype=np.uint8))
+        minimap = win.minimap
+        assert win.check_layout() == "failed"
+        assert win.check_layout() == "failed"
+        assert len(searches) == 3
+        assert win.minimap is minimap
+        win._retry_at = 0.0  # As if the retry interval had passed.
+        assert win.check_layout() == "failed"
+        assert len(searches) == 4
+
+        win.load(client_image)
+        assert win.check_layout() == "reinitialized"
+    assert len(searches) == 5
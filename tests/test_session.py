@@ -0,0 +1,61 @@
+import random
+
+import numpy as np
+import pytest
+
+import utilities.random_util as rd
+from model.recorded_window import RecordedWindow
+from utilities.geometry import Rectangle
+
+try:
+    import pyautogui as pag
+except Exception:  # On Linux, importing it fails without a display.
+    pytest.skip("pyautogui needs a display.", allow_module_level=True)
+
+from utilities.session import SessionRecorder, SessionReplayer
+
+RECTS = [Rectangle(0, 0, 40, 30), Rectangle(500, 10, 64, 64), Rectangle(0, 0, 40, 30)]
+
+
+def _play():
+    """Capture each of `RECTS`, move the mouse, and draw random numbers."""
+    frames = [rect.screenshot() for rect in RECTS]
+    pag.moveTo(10, 20)
+    position = tuple(pag.position())
+    draws = (random.random(), float(np.random.rand()), rd.trunc_norm_samp(0, 1))
+    return frames, position, draws
+
+
+@pytest.fixture
+def session(client_image, tmp_path):
+    """Record `_play` against the bundled client capture."""
+    path = tmp_path / "session.zip"
+    with RecordedWindow(client_image), SessionRecorder(path, seed=7) as recorder:
+        recorded = _play()
+    assert recorder.num_frames == 2  # The repeated capture is stored once.
+    return path, recorded
+
+
+def test_replay_serves_the_recorded_session(session):
+    path, (frames, position, draws) = session
+    with SessionReplayer(path, cache_size=1) as replayer:
+        replayed = _play()
+        assert len(replayer._decoded) <= 1
+    assert all(np.array_equal(a, b) for a, b in zip(replayed[0], frames))
+    assert replayed[1] == position
+    assert replayed[2] == draws
+    stats = replayer.stats()
+    assert (stats["served"], stats["divergences"]) == (3, 0)
+    assert replayer.finished
+
+
+def test_replay_tolerates_divergence(session):
+    path, (frames, _, _) = session
+    with SessionReplayer(path) as replayer:
+        unrecorded = Rectangle(1, 1, 5, 5).screenshot()
+        skipped_ahead = RECTS[1].screenshot()
+        again = RECTS[1].screenshot()
+    assert not unrecorded.any()
+    assert np.array_equal(skipped_ahead, frames[1])
+    assert np.array_equal(again, frames[1])  # Its most recent frame.
+    assert replayer.divergences == 3
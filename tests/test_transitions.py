@@ -0,0 +1,89 @@
+from utilities.api.transitions import (
+    Leg,
+    Transition,
+    find_route,
+    load_transitions,
+    split_legs,
+)
+from utilities.geometry import Point, WorldPoint
+
+LADDER = Transition(WorldPoint(3210, 3200, 0), WorldPoint(3210, 9600, 0), "Ladder")
+FAR_LADDER = Transition(WorldPoint(3300, 3200, 0), WorldPoint(3300, 9600, 0))
+STAIRS = Transition(WorldPoint(3205, 3205, 0), WorldPoint(3205, 3206, 1), cost=3)
+TRANSITIONS = [FAR_LADDER, STAIRS, LADDER]
+
+
+class _Walker:
+    """Walk straight between tiles, except between the surface and the dungeons."""
+
+    def __init__(self):
+        self.legs = []
+
+    def __call__(self, a: Point, b: Point, plane: int):
+        self.legs.append((a, b, plane))
+        if (a.y >= 9000) != (b.y >= 9000):
+            return []
+        path, (x, y) = [a], a
+        while (x, y) != (b.x, b.y):
+            x += (b.x > x) - (b.x < x)
+            y += (b.y > y) - (b.y < y)
+            path.append(Point(x, y))
+        return path
+
+
+def test_routes_take_transitions():
+    walker = _Walker()
+    route = find_route(
+        WorldPoint(3200, 3200, 0), WorldPoint(3215, 9605, 0), walker, TRANSITIONS
+    )
+    assert [(leg.plane, len(leg.path), leg.transition) for leg in route] == [
+        (0, 11, LADDER),
+        (0, 6, None),
+    ]
+    assert route[0].path[-1] == Point(3210, 3200)
+    assert route[1].path[0] == Point(3210, 9600)
+    # Legs that can't be on the shortest route are never pathfound.
+    assert all(b != Point(3300, 3200) for _, b, _ in walker.legs)
+
+
+def test_routes_change_plane():
+    route = find_route(
+        WorldPoint(3200, 3200, 0), WorldPoint(3200, 3210, 1), _Walker(), TRANSITIONS
+    )
+    assert [(leg.plane, leg.transition) for leg in route] == [(0, STAIRS), (1, None)]
+    assert (route[1].path[0], route[1].path[-1]) == (STAIRS.dest[:2], (3200, 3210))
+
+
+def test_routes_without_transitions():
+    start, goal = WorldPoint(3200, 3200, 0), WorldPoint(3203, 3201, 0)
+    path = [Point(3200, 3200), Point(3201, 3201), Point(3202, 3201), goal[:2]]
+    assert find_route(start, goal, _Walker()) == [Leg(0, path, None)]
+    assert find_route(start, WorldPoint(3200, 9600, 0), _Walker()) == []
+
+
+def test_split_legs_matches_known_transitions():
+    steps = [(3208, 3201, 0), (3209, 3200, 0), (3211, 9601, 0), (3212, 9602, 0)]
+    legs = split_legs(steps, TRANSITIONS)
+    assert legs == [
+        Leg(0, [Point(3208, 3201), Point(3209, 3200)], LADDER),
+        Leg(0, [Point(3211, 9601), Point(3212, 9602)], None),
+    ]
+    assert split_legs([]) == []
+
+
+def test_split_legs_makes_up_unknown_transitions():
+    steps = [(3250, 3200), (3250, 9600), (3250, 9601, 0), (3250, 9601, 1)]
+    legs = split_legs(steps, TRANSITIONS)
+    assert [leg.transition for leg in legs] == [
+        Transition(WorldPoint(3250, 3200, 0), WorldPoint(3250, 9600, 0)),
+        Transition(WorldPoint(3250, 9601, 0), WorldPoint(3250, 9601, 1)),
+        None,
+    ]
+    assert [leg.plane for leg in legs] == [0, 0, 1]
+
+
+def test_load_transitions(tmp_path):
+    path = tmp_path / "transitions.json"
+    path.write_text('[{"source": [3205, 3205, 0], "dest": [3205, 3206, 1], "cost": 3}]')
+    assert load_transitions(path) == [STAIRS]
+    assert load_transitions(tmp_path / "missing.json") == []
@@ -0,0 +1,69 @@
+import pytest
+
+from utilities.api.obstacles import ObstacleOverlay
+from utilities.api.path_cache import PathCache
+from utilities.geometry import Point
+from utilities.walker import PathCursor, Walker
+
+STRAIGHT = [Point(3200 + i, 3200) for i in range(100)]
+# East along y=0, north up x=10, then back west along y=4.
+U_TURN = (
+    [Point(x, 0) for x in range(11)]
+    + [Point(10, y) for y in range(1, 5)]
+    + [Point(x, 4) for x in range(9, -1, -1)]
+)
+
+
+def test_advance_follows_the_path():
+    cursor = PathCursor(STRAIGHT, window=4)  # The window widens as needed.
+    assert cursor.advance(STRAIGHT[0], horizon=12) == 12
+    assert cursor.index == 0
+    assert cursor.advance(Point(3230, 3201), horizon=12) == 42
+    assert cursor.index == 31  # The furthest of the three tiles a tile away.
+    assert cursor.upcoming() == STRAIGHT[31:43]
+    assert cursor.advance(STRAIGHT[95], horizon=12) == 99
+
+
+def test_advance_keeps_to_the_corridor():
+    cursor = PathCursor(U_TURN)
+    # The far leg is within reach too, but only across the gap between the legs.
+    assert cursor.advance(Point(0, 0), horizon=5) == 5
+    assert cursor.advance(Point(10, 2), horizon=5) == U_TURN.index(Point(5, 4))
+
+
+def test_advance_finds_its_place_again():
+    cursor = PathCursor(STRAIGHT, window=8)
+    assert cursor.advance(Point(3250, 3300), horizon=12) is None
+    assert cursor.upcoming() == []
+    cursor.advance(STRAIGHT[80], horizon=2)
+    assert (cursor.index, cursor.target_index) == (80, 82)
+    cursor.advance(STRAIGHT[10], horizon=2)  # Backward, e.g. we were pushed back.
+    assert (cursor.index, cursor.target_index) == (10, 12)
+
+
+@pytest.fixture
+def walker(tmp_path):
+    """A `Walker` with no bot, and its caches kept in temporary files."""
+    return Walker(
+        None,
+        path_cache=PathCache(tmp_path / "paths.json"),
+        obstacles=ObstacleOverlay(tmp_path / "obstacles.json"),
+    )
+
+
+def test_walker_keeps_the_given_caches(walker, tmp_path):
+    assert walker.path_cache.path == tmp_path / "paths.json"
+    assert walker.obstacles.path == tmp_path / "obstacles.json"
+
+
+def test_add_waypoints_splits_far_steps(walker):
+    walk_path = [(0, 0, 1), (25, 0, 1), (26, 0, 1)]
+    assert walker.add_waypoints(walk_path) == [
+        Point(0, 0),
+        Point(8, 0),
+        Point(17, 0),
+        Point(25, 0),
+        Point(26, 0),
+    ]
+    diagonal = walker.add_waypoints([Point(0, 0), Point(14, 14)])
+    assert diagonal == [Point(0, 0), Point(7, 7), Point(14, 14)]  # 19.8 tiles.